@@ -0,0 +1,49 @@
+"""
+Benchmarks for the library internals.
+
+Each module may be run as a script from the project root:
+
+    python -m benchmarks.class_creation
+"""
+
+import timeit
+
+
+def setup():
+    """
+    Configures Django with the same settings that tests use.
+    """
+    import django
+    from runtests import configure
+
+    configure()
+    django.setup()
+
+
+def measure(func, number: int=1, repeat: int=5) -> float:
+    """
+    Measures the best time of the function call.
+
+    Args:
+        func (callable): Function to measure.
+        number (int, optional): Calls in one measurement.
+        repeat (int, optional): Measurements count.
+
+    Returns:
+        float: Best time of a single call in seconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(title: str, results: dict):
+    """
+    Prints measurements in a table.
+
+    Args:
+        title (str): Table title.
+        results (dict): Measured values by their names.
+    """
+    print(title)
+
+    for name, value in results.items():
+        print(f'  {name:<40} {value}')
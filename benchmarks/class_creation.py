@@ -0,0 +1,69 @@
+"""
+Class creation time of the `ClassConnectorBase` metaclass compared to
+the previous implementation, that scanned `dir()` of every class.
+"""
+
+from benchmarks import setup, measure, report
+
+setup()
+
+from django.views.generic import ListView, UpdateView
+
+from composable_views.utils import (
+    ClassConnectorBase, ClassConnectable, ClassConnectableClass
+)
+from composable_views.mixins import ActionsHolder, ActionViewMixin
+
+
+CLASSES = 1000
+
+
+class LegacyClassConnectorBase(type):
+    """
+    Metaclass with the `dir()` scan over the whole MRO.
+    """
+
+    def __new__(cls, name, bases, attrs):
+        new = super().__new__(cls, name, bases, attrs)
+
+        for attr in dir(new):
+            value = getattr(new, attr)
+
+            try:
+                issub = issubclass(value, ClassConnectableClass)
+            except TypeError:
+                issub = False
+
+            if isinstance(value, ClassConnectable) or issub:
+                new.__dict__[attr].set_parent_class(new)
+
+        return new
+
+
+def create_classes(metaclass, base):
+    for index in range(CLASSES):
+        metaclass(f'View{index}', (base, ), {
+            'template_name': 'noop.html',
+            'paginate_by': index,
+        })
+
+
+def create_holders():
+    for index in range(CLASSES // 10):
+        action = type(f'Action{index}', (ActionViewMixin, UpdateView), {})
+        type(f'Holder{index}', (ActionsHolder, ListView), {
+            'actions': [action],
+        })
+
+
+if __name__ == '__main__':
+    report(f'Creation of {CLASSES} view classes, ms:', {
+        f'{metaclass.__name__} ({base.__name__})': round(measure(
+            lambda: create_classes(metaclass, base)
+        ) * 1000, 2)
+        for base in (ListView, UpdateView)
+        for metaclass in (LegacyClassConnectorBase, ClassConnectorBase)
+    })
+    report(f'Creation of {CLASSES // 10} actions holders, ms:', {
+        'ActionsHolder': round(measure(create_holders) * 1000, 2),
+    })
@@ -0,0 +1,101 @@
+"""
+Resolver depth and resolve time of the flattened url trees compared to
+the nested ones, that viewsets and actions holders generate by default.
+"""
+
+from benchmarks import setup, measure, report
+
+setup()
+
+from django.http import HttpResponse
+from django.views.generic import View
+
+from composable_views.utils import (
+    URLResolver, RegexPattern, ClassConnectableClass
+)
+from composable_views.resolvers import flatten_urls
+from composable_views.mixins import (
+    ViewSet, ActionsHolder, ActionViewMixin, UrlBuilderMixin, PK_REGEX,
+    PAGED_REGEX
+)
+
+
+HOLDERS = 50
+ACTIONS = 5
+RESOLVES = 1000
+
+
+class TView(View):
+    def get(self, request, *a, **k):
+        return HttpResponse()
+
+
+def create_urls() -> list:
+    urls = []
+
+    for index in range(HOLDERS):
+        actions = [
+            type(f'Action{index}x{x}', (ActionViewMixin, TView), {})
+            for x in range(ACTIONS)
+        ]
+        holder = type(f'Holder{index}', (ActionsHolder, TView), {
+            'url_regex_list': [PK_REGEX, PAGED_REGEX],
+            'actions': actions,
+        })
+        viewset = type(f'ViewSet{index}', (ViewSet, ), {
+            'detail_view_base': type(f'Detail{index}', (
+                UrlBuilderMixin, ClassConnectableClass, TView
+            ), {}),
+            'detail_url_regex_list': [PK_REGEX],
+        })
+        urls.extend(holder.as_urls())
+        urls.extend(viewset.as_urls())
+
+    return urls
+
+
+def get_depths(urls, depth: int=1) -> list:
+    """
+    Returns:
+        list: Count of resolvers on the way to each url.
+    """
+    return [
+        x for url in urls for x in (
+            get_depths(url.url_patterns, depth + 1)
+            if isinstance(url, URLResolver) else [depth]
+        )
+    ]
+
+
+def resolve_all(resolver, paths):
+    for path in paths:
+        resolver.resolve(path)
+
+
+if __name__ == '__main__':
+    nested = create_urls()
+    flat = flatten_urls(nested)
+    last = HOLDERS - 1
+    paths = [
+        f'holder{last}/1/',
+        f'holder{last}/page/2/action/action{last}x{ACTIONS - 1}/',
+        f'detail{last}/1/',
+    ] * (RESOLVES // 3)
+    results = {}
+
+    for name, urls in (('nested', nested), ('flat', flat)):
+        resolver = URLResolver(RegexPattern(r'^'), urls)
+        depths = get_depths(urls)
+
+        results[f'{name}: max depth'] = max(depths)
+        results[f'{name}: average depth'] = round(
+            sum(depths) / len(depths), 2
+        )
+        results[f'{name}: resolve, ms'] = round(
+            measure(lambda: resolve_all(resolver, paths)) * 1000, 2
+        )
+
+    report(
+        f'{HOLDERS} holders with {ACTIONS} actions and {HOLDERS} viewsets, '
+        f'{len(paths)} resolves:', results
+    )
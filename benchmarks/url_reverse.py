@@ -0,0 +1,77 @@
+"""
+Links generation time for a list page with url reversers compared to
+Django's `reverse()`.
+"""
+
+import sys
+
+from benchmarks import setup, measure, report
+
+setup()
+
+from django.http import HttpResponse
+from django.urls import reverse, set_urlconf
+from django.views.generic import View
+
+from composable_views.mixins import (
+    ActionsHolder, ActionViewMixin, PK_REGEX, PAGED_REGEX, PK_SLUG_REGEX
+)
+
+
+ROWS = 100
+ACTIONS = 6
+
+
+class TView(View):
+    def get(self, request, *a, **k):
+        return HttpResponse()
+
+
+class Holder(ActionsHolder, TView):
+    url_regex_list = ['', PK_REGEX, PAGED_REGEX, PK_SLUG_REGEX]
+    actions = [
+        type(f'Action{x}', (ActionViewMixin, TView), {})
+        for x in range(ACTIONS)
+    ]
+
+
+urlpatterns = Holder.as_urls()
+
+
+def reverse_django(rows):
+    return [
+        reverse(f'holder:actions:action{x}', kwargs=row)
+        for row in rows for x in range(ACTIONS)
+    ]
+
+
+def reverse_reverser(rows):
+    return [
+        Holder.get_url_reverser(f'action{x}').reverse(**row)
+        for row in rows for x in range(ACTIONS)
+    ]
+
+
+def reverse_many(rows):
+    return [
+        Holder.get_url_reverser(f'action{x}').reverse_many(rows)
+        for x in range(ACTIONS)
+    ]
+
+
+if __name__ == '__main__':
+    set_urlconf(sys.modules[__name__])
+    rows = [{'pk': x, 'slug': f'row-{x}'} for x in range(ROWS)]
+    assert sorted(reverse_django(rows)) == sorted(
+        url for urls in reverse_many(rows) for url in urls
+    )
+
+    report(f'{ROWS} rows with {ACTIONS} action links, ms:', {
+        'reverse()': round(measure(lambda: reverse_django(rows)) * 1000, 2),
+        'UrlReverser.reverse': round(
+            measure(lambda: reverse_reverser(rows)) * 1000, 2
+        ),
+        'UrlReverser.reverse_many': round(
+            measure(lambda: reverse_many(rows)) * 1000, 2
+        ),
+    })
@@ -0,0 +1,76 @@
+"""
+Url loading time from a snapshot compared to the url building.
+"""
+
+import json
+
+from benchmarks import setup, measure, report
+
+setup()
+
+from django.http import HttpResponse
+from django.views.generic import View
+
+from composable_views.snapshots import snapshot_urls, load_snapshot
+from composable_views.mixins import (
+    ViewSet, ActionsHolder, ActionViewMixin, UrlBuilderMixin, PK_REGEX,
+    PAGED_REGEX
+)
+from composable_views.utils import ClassConnectableClass
+
+
+HOLDERS = 50
+ACTIONS = 5
+
+
+class TView(View):
+    def get(self, request, *a, **k):
+        return HttpResponse()
+
+
+# Views are module attributes, so snapshot can reference them.
+for index in range(HOLDERS):
+    for x in range(ACTIONS):
+        name = f'Action{index}x{x}'
+        globals()[name] = type(name, (ActionViewMixin, TView), {
+            '__module__': __name__,
+        })
+
+    globals()[f'Holder{index}'] = type(f'Holder{index}', (
+        ActionsHolder, TView
+    ), {
+        '__module__': __name__,
+        'url_regex_list': [PK_REGEX, PAGED_REGEX],
+        'actions': [globals()[f'Action{index}x{x}'] for x in range(ACTIONS)],
+    })
+    globals()[f'ViewSet{index}'] = type(f'ViewSet{index}', (ViewSet, ), {
+        '__module__': __name__,
+        'detail_view_base': type(f'Detail{index}', (
+            UrlBuilderMixin, ClassConnectableClass, TView
+        ), {}),
+        'detail_url_regex_list': [PK_REGEX],
+    })
+
+
+def build_urls() -> list:
+    urls = []
+
+    for index in range(HOLDERS):
+        urls.extend(globals()[f'Holder{index}'].as_urls())
+        urls.extend(globals()[f'ViewSet{index}'].as_urls())
+
+    return urls
+
+
+if __name__ == '__main__':
+    text = json.dumps(snapshot_urls(build_urls))
+
+    report(
+        f'{HOLDERS} holders with {ACTIONS} actions and {HOLDERS} viewsets, '
+        'ms:', {
+            'build': round(measure(build_urls) * 1000, 2),
+            'snapshot load': round(
+                measure(lambda: load_snapshot(json.loads(text))) * 1000, 2
+            ),
+        }
+    )
@@ -0,0 +1,26 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+from ...snapshots import save_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Saves a snapshot of the urls, that a builder function returns.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'builder',
+            help='Dotted import path of the function, that returns urls.'
+        )
+        parser.add_argument('path', help='Snapshot file path.')
+
+    def handle(self, builder, path, **options):
+        try:
+            snapshot = save_snapshot(import_string(builder), path)
+        except (ImportError, ImproperlyConfigured) as e:
+            raise CommandError(e)
+
+        self.stdout.write(
+            f'Saved {len(snapshot["urls"])} urls to `{path}`.'
+        )
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from ...warmup import WarmupReport, warmup_urls
+
+
+class Command(BaseCommand):
+    help = (
+        'Builds, compiles and populates all the urls, and reports the '
+        'time and the counts for each viewset and actions holder.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--urlconf', help='Urlconf module. By default the root one.'
+        )
+        parser.add_argument(
+            '--language', action='append', dest='languages',
+            help='Language to populate resolvers for. May be repeated.'
+        )
+
+    def handle(self, urlconf=None, languages=None, **options):
+        reports = warmup_urls(urlconf, languages)
+        total = WarmupReport()
+        columns = ('ms', *WarmupReport.counts)
+
+        self.stdout.write(
+            f'{"":50}' + ''.join(f'{x:>10}' for x in columns)
+        )
+
+        for report in [*reports, total]:
+            if report is not total:
+                total.add(report)
+
+            name = 'total' if report is total else report.name
+            self.stdout.write(f'{name:50}{report.seconds * 1000:>10.2f}' + (
+                ''.join(f'{getattr(report, x):>10}' for x in columns[1:])
+            ))
@@ -6,3 +6,8 @@ from .url_build import *
 from .actions import *
 from .viewset import *
 from .context import *
+from .memoize import *
+from .bulk import *
+from .cache import *
+from .conditional import *
+from .pagination import *
@@ -4,29 +4,67 @@ Action class mixins set.
 
 import collections
 import abc
+import copy
+import base64
+import json
+import threading
 from functools import reduce
 
+from django.db import transaction
+from django.http import HttpResponseBadRequest, JsonResponse, QueryDict
+from django.views.generic import View
+from django.utils.datastructures import MultiValueDict
 from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
 from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.exception import response_for_exception
+try:
+    from asgiref.sync import async_to_sync, sync_to_async
+except ImportError:
+    async_to_sync = sync_to_async = None
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError:
+    from asyncio import iscoroutinefunction
 
 from ..utils import (
-    re_path, include, path_regex,
-    ClassConnectable, ClassConnector, ClassConnectorBase, ClassConnectableClass
+    re_path, path, include, path_prefix, URLResolver, RegexPattern,
+    RoutePattern, ClassConnectable, ClassConnector, ClassConnectorBase,
+    ClassConnectableClass
 )
+from ..resolvers import share_urls
+from ..reversers import join_names, get_reverser
 from .url_build import UrlBuilderMixin
+from .memoize import REQUEST_MEMO_ATTRIBUTE
+from .bulk import BulkActionMixin
 
 
 __all__ = (
-    'ActionViewMixin', 'ReusableActionMixin', 'ActionConnectorBase',
-    'ActionConnector', 'ActionsHolderBase', 'ActionsHolder'
+    'ActionViewMixin', 'ReusableActionMixin', 'ActionBatchView',
+    'ActionConnectorBase', 'ActionConnector', 'ActionsHolderBase',
+    'ActionsHolder'
 )
 
 
+PARENTAL_STATE_ATTRIBUTE = '_composable_parental'
+
+
 class ActionViewMixin(UrlBuilderMixin, ClassConnectableClass):
     """
     Mixin for an action view.
+
+    Attributes:
+        parental_proxy (bool): Parent view is created without calling
+            its `__init__`, and gets only the request, args and kwargs
+            of the action. Its instance attributes are stored on the
+            request, and shared by all the proxies of the parent class
+            with the same args and kwargs. So results, that the parent
+            caches on the instance (`cached_property` values, `object`
+            and so on), are computed once per request.
     """
 
+    parental_proxy = False
+
     @cached_property
     def parental(self):
         """
@@ -36,6 +74,12 @@ class ActionViewMixin(UrlBuilderMixin, ClassConnectableClass):
             View: Initialized parent view object with request, args and
                 kwargs from the current action view.
         """
+        if self.parental_proxy:
+            parent = self.parent_class.__new__(self.parent_class)
+            parent.__dict__ = self.get_parental_state()
+
+            return parent
+
         parent = self.parent_class()
 
         parent.request = self.request
@@ -44,6 +88,63 @@ class ActionViewMixin(UrlBuilderMixin, ClassConnectableClass):
 
         return parent
 
+    def get_parental_state(self) -> dict:
+        """
+        Returns:
+            dict: Instance attributes of the proxy parent, shared for
+                the request, or new ones, if there is no request, or
+                args and kwargs are not hashable.
+        """
+        state = {
+            'request': self.request, 'args': self.args,
+            'kwargs': self.kwargs,
+        }
+        key = (
+            self.parent_class, tuple(self.args),
+            tuple(sorted(self.kwargs.items())),
+        )
+
+        try:
+            hash(key)
+        except TypeError:
+            return state
+
+        if self.request is None:
+            return state
+
+        states = self.request.__dict__.setdefault(
+            PARENTAL_STATE_ATTRIBUTE, {}
+        )
+
+        return states.setdefault(key, state)
+
+    async def acall_parental(self, name: str, *args, **kwargs):
+        """
+        Calls a parent view method from the async action. Coroutine
+        methods are awaited, blocking ones are run with the
+        `sync_to_async`.
+
+        Example:
+            >>> obj = await self.acall_parental('get_object')
+
+        Args:
+            name (str): Parent method name.
+            *args: Method arguments.
+            **kwargs: Method keyword arguments.
+
+        Returns:
+            object: Method result.
+        """
+        method = getattr(self.parental, name)
+
+        if iscoroutinefunction(method):
+            return await method(*args, **kwargs)
+
+        if sync_to_async is None:
+            return method(*args, **kwargs)
+
+        return await sync_to_async(method)(*args, **kwargs)
+
     @classmethod
     def set_parent_class(cls, parent_class):
         """
@@ -70,6 +171,213 @@ class ReusableActionMixin:
     """
 
 
+class ActionBatchView(View):
+    """
+    View, that dispatches several actions of the connector in a single
+    request.
+
+    Request body is a JSON object with a list of actions:
+
+        {"actions": [
+            {"action": "read"},
+            {"action": "reassign", "data": {"user": 2}},
+            {"action": "rename", "method": "get", "kwargs": {"pk": 1}}
+        ]}
+
+    Each action gets a copy of the request with its method (`POST` by
+    default) and data as `GET` or `POST` and a JSON body. User, session
+    and memoized results are shared, but proxy parents are not, as they
+    hold the request of the action. Actions get the url kwargs of the
+    batch url and their own `kwargs`, that may not replace url ones.
+    Malformed items make the whole batch invalid.
+
+    Response is a JSON object with the status and the content of each
+    action response. Its status is 400 if any action failed. Actions
+    run in a single transaction, and the first failure rolls it back
+    and stops the batch, if the connector has `batch_atomic` set.
+
+    Attributes:
+        connector (ActionConnector): Connector of the actions.
+    """
+
+    connector = None
+
+    def get_items(self, request) -> list:
+        """
+        Args:
+            request (HttpRequest): Batch request.
+
+        Returns:
+            list: Action items, or `None` if the body is not valid.
+        """
+        try:
+            items = json.loads(request.body)['actions']
+        except (ValueError, TypeError, KeyError):
+            return None
+
+        if not isinstance(items, list) or not all(
+            self.is_valid_item(x) for x in items
+        ):
+            return None
+
+        return items
+
+    def is_valid_item(self, item) -> bool:
+        """
+        Checks the shape of an action item. Item `kwargs` may only add
+        new kwargs, so url kwargs of the batch url, that its route has
+        validated, can not be replaced from the body.
+
+        Args:
+            item (object): Action item from the body.
+
+        Returns:
+            bool: Whether the item is valid.
+        """
+        if not isinstance(item, dict):
+            return False
+
+        action = item.get('action')
+        method = item.get('method', 'post')
+        data = item.get('data')
+        kwargs = item.get('kwargs')
+
+        return (
+            isinstance(action, str) and action in self.connector and
+            isinstance(method, str) and
+            method.lower() in self.http_method_names and
+            (data is None or isinstance(data, dict)) and (
+                kwargs is None or isinstance(kwargs, dict) and all(
+                    isinstance(x, str) and x not in self.kwargs
+                    for x in kwargs
+                )
+            )
+        )
+
+    def get_action_request(self, request, item: dict):
+        """
+        Args:
+            request (HttpRequest): Batch request.
+            item (dict): Action item.
+
+        Returns:
+            HttpRequest: Request for the action.
+        """
+        method = item.get('method', 'POST').upper()
+        data = item.get('data') or {}
+        query = QueryDict(mutable=True)
+
+        for key, value in data.items():
+            query.setlist(key, [
+                str(x) for x in (value if isinstance(value, list) else [value])
+            ])
+
+        query._mutable = False
+        action_request = copy.copy(request)
+        action_request.method = method
+        action_request.GET = query if method == 'GET' else QueryDict()
+        action_request.POST = query if method != 'GET' else QueryDict()
+        action_request._files = MultiValueDict()
+        action_request._body = json.dumps(data).encode()
+        # Proxy parents keep the request, so each action gets its own.
+        action_request.__dict__.pop(PARENTAL_STATE_ATTRIBUTE, None)
+
+        return action_request
+
+    def get_content(self, response):
+        """
+        Args:
+            response (HttpResponse): Action response.
+
+        Returns:
+            object: Decoded JSON, text content, or base64 of the
+                binary one.
+        """
+        if callable(getattr(response, 'render', None)):
+            response.render()
+
+        if getattr(response, 'streaming', False):
+            content = b''.join(response.streaming_content)
+        else:
+            content = response.content
+
+        if response.get('Content-Type', '').startswith('application/json'):
+            return json.loads(content)
+
+        try:
+            return content.decode(response.charset)
+        except UnicodeDecodeError:
+            return base64.b64encode(content).decode()
+
+    def dispatch_action(self, request, item: dict) -> dict:
+        """
+        Dispatches a single action.
+
+        Args:
+            request (HttpRequest): Batch request.
+            item (dict): Action item.
+
+        Returns:
+            dict: Action name, response status and content.
+        """
+        view = self.connector.get_batch_views()[item['action']]
+        action_request = self.get_action_request(request, item)
+        kwargs = {**self.kwargs, **(item.get('kwargs') or {})}
+
+        try:
+            if iscoroutinefunction(view):
+                response = async_to_sync(view)(
+                    action_request, *self.args, **kwargs
+                )
+            else:
+                response = view(action_request, *self.args, **kwargs)
+        except Exception as e:
+            response = response_for_exception(action_request, e)
+
+        return {
+            'action': item['action'],
+            'status': response.status_code,
+            'content': self.get_content(response),
+        }
+
+    def run(self, request, items: list) -> list:
+        results = []
+
+        for item in items:
+            result = self.dispatch_action(request, item)
+            results.append(result)
+
+            if self.connector.batch_atomic and result['status'] >= 400:
+                transaction.set_rollback(True, self.connector.batch_using)
+                break
+
+        return results
+
+    def post(self, request, *args, **kwargs):
+        items = self.get_items(request)
+
+        if items is None or len(items) > self.connector.batch_max_actions:
+            return HttpResponseBadRequest()
+
+        # Memo is created before the requests are copied, so it is
+        # shared by all the actions.
+        request.__dict__.setdefault(REQUEST_MEMO_ATTRIBUTE, {})
+
+        if self.connector.batch_atomic:
+            with transaction.atomic(using=self.connector.batch_using):
+                results = self.run(request, items)
+        else:
+            results = self.run(request, items)
+
+        ok = all(x['status'] < 400 for x in results) and (
+            len(results) == len(items)
+        )
+
+        return JsonResponse(
+            {'ok': ok, 'results': results}, status=200 if ok else 400
+        )
+
+
 class ActionConnectorBase(ClassConnectorBase, abc.ABCMeta):
     pass
 
@@ -85,27 +393,105 @@ class ActionConnector(
         >>> class View(ActionsHolder):
         >>>    actions = ActionsConnector(
         >>>        ActionView1,
-        >>>        ActionView2
+        >>>        'app.actions.ActionView2'
         >>>    )
 
+    Actions, given with dotted import paths, are imported only when
+    actions are accessed first, for example, when urls are built.
+
     Attributes:
+        entries (list): Action classes, and dotted import paths of the
+            deferred actions, in the given order.
         data (dict): Action classes, referenced by their names.
         url_format (str): Url generation format that will prefix all
             actions that connector holds.
+        url_path_format (str): The same format for parent's `path`
+            urls.
         url_namespace (str): Namespace for view actions.
+        url_batch (bool): Whether to add an url for the
+            `ActionBatchView`, that dispatches several actions at once.
+        batch_name (str): Url name of the batch view.
+        batch_view_class (type): Batch view class.
+        batch_atomic (bool): Run batch actions in a single transaction.
+        batch_using (str): Database alias for the batch transaction.
+        batch_max_actions (int): Maximum actions in a single batch.
     """
 
     url_namespace = 'actions'
     url_format = r'^{regex}action/'
+    url_path_format = '{route}action/'
+    url_batch = False
+    batch_name = 'batch'
+    batch_view_class = ActionBatchView
+    batch_atomic = False
+    batch_using = None
+    batch_max_actions = 20
+    entries = ()
+    _data = None
+
+    def __init__(self, *actions, **options):
+        for key, value in options.items():
+            if not hasattr(type(self), key):
+                raise TypeError(f'Unknown connector option `{key}`.')
+
+            setattr(self, key, value)
+
+        self.entries = [
+            x if isinstance(x, str) else self.get_action_class(x)
+            for x in actions
+        ]
+        self.lock = threading.Lock()
 
-    def __init__(self, *actions):
-        self.data = {
-            action.get_viewclass_name(): action
-            for action in (self.get_action_class(x) for x in actions)
-        }
+        if not any(isinstance(x, str) for x in self.entries):
+            self.data = self.collect_actions(self.entries)
 
         super().__init__(*actions)
 
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            with self.lock:
+                if self._data is None:
+                    self._data = self.collect_actions(
+                        self.resolve_action(x) for x in self.entries
+                    )
+
+        return self._data
+
+    @data.setter
+    def data(self, value: dict):
+        self._data = value
+
+    def collect_actions(self, actions) -> dict:
+        """
+        Args:
+            actions (iterable): Action classes.
+
+        Returns:
+            dict: Action classes, referenced by their names.
+        """
+        return {action.get_viewclass_name(): action for action in actions}
+
+    def resolve_action(self, action):
+        """
+        Imports a deferred action and connects it to the parent class.
+
+        Args:
+            action (type | str): Action class, or a dotted import path.
+
+        Returns:
+            type: Action class.
+        """
+        if not isinstance(action, str):
+            return action
+
+        action = self.get_action_class(import_string(action))
+
+        if self.parent_class is not None:
+            action.set_parent_class(self.parent_class)
+
+        return action
+
     def get_action_class(self, action_class):
         """
         If a provided class is an instance of ReusableActionMixin then
@@ -134,8 +520,12 @@ class ActionConnector(
         """
         super().set_parent_class(cls)
 
-        for key in self.data:
-            self.data[key].set_parent_class(cls)
+        # Deferred actions are connected, when they are imported.
+        actions = self.entries if self._data is None else self._data.values()
+
+        for action in actions:
+            if not isinstance(action, str):
+                action.set_parent_class(cls)
 
     def __getattr__(self, key):
         """
@@ -156,13 +546,119 @@ class ActionConnector(
         except KeyError as e:
             raise AttributeError(e)
 
-    def as_urls(self, regex_list):
+    def get_url(self, prefix, urls: list):
+        """
+        Creates an url definition, that nests action urls under the
+        parent's url prefix.
+
+        Args:
+            prefix (str | RoutePattern): Regex or a route pattern of
+                the parent view url.
+            urls (list): Action urls.
+
+        Returns:
+            url: Url definition.
+        """
+        if isinstance(prefix, str):
+            return re_path(self.url_format.format(regex=prefix), include(urls))
+
+        return path(
+            self.url_path_format.format(route=str(prefix)), include(urls)
+        )
+
+    def get_url_reverser(self, action: str, namespace: str=None):
+        """
+        Returns a reverser for the action urls.
+
+        Example:
+            >>> View.actions.get_url_reverser('edit').reverse_many(
+            >>>     {'pk': x.pk} for x in object_list
+            >>> )
+
+        Args:
+            action (str): Action name.
+            namespace (str, optional): Namespace, that parent view urls
+                are included with.
+
+        Returns:
+            UrlReverser: Url reverser.
+        """
+        name = (
+            action if self.url_batch and action == self.batch_name
+            else self.data[action].get_url_name()
+        )
+
+        return get_reverser(join_names(
+            namespace, self.parent_class.get_url_name(), self.url_namespace,
+            name
+        ))
+
+    def get_batch_views(self) -> dict:
+        """
+        Returns:
+            dict: View functions of the actions by their names, for the
+                batch view to dispatch.
+        """
+        views = self.__dict__.get('_batch_views')
+
+        if views is None:
+            views = self._batch_views = {
+                name: action.as_view() for name, action in self.items()
+            }
+
+        return views
+
+    def get_batch_url(self):
+        """
+        Returns:
+            url: Batch view url definition.
+
+        Raises:
+            ImproperlyConfigured: When an action has the same name.
+        """
+        if self.batch_name in self.data:
+            raise ImproperlyConfigured(
+                f'Action `{self.batch_name}` has the batch view name.'
+            )
+
+        view = self.batch_view_class.as_view(connector=self)
+
+        if path is not None and self.parent_class.get_url_mode() == 'path':
+            return path(f'{self.batch_name}/', view, name=self.batch_name)
+
+        return re_path(
+            f'^{self.batch_name}/$', view, name=self.batch_name
+        )
+
+    def get_prefix_pattern(self, prefix):
+        """
+        Args:
+            prefix (str | RoutePattern): Regex or a route pattern of
+                the parent view url.
+
+        Returns:
+            RegexPattern | RoutePattern: Pattern, that prefixes action
+                urls.
+        """
+        if isinstance(prefix, str):
+            return RegexPattern(self.url_format.format(regex=prefix))
+
+        return RoutePattern(self.url_path_format.format(route=str(prefix)))
+
+    def as_urls(self, regex_list, bulk_regex_list=()):
         """
         Generates urls for actions.
 
+        Action urls are nested once under all the parent prefixes with
+        a `SharedPrefixResolver`. Old Django versions get a separate
+        include for each prefix.
+
         Args:
-            regex_list (list): List of regexes from the parent view to
-                prefix action urls.
+            regex_list (list): List of regexes (or route patterns for
+                the `path` urls) from the parent view to prefix action
+                urls.
+            bulk_regex_list (list, optional): Prefixes, that only the
+                `BulkActionMixin` actions are nested under.
 
         Returns:
             list: Description
@@ -170,13 +666,35 @@ class ActionConnector(
         urls = reduce(
             lambda acc, x: acc + list(x[1].as_urls()), self.items(), []
         )
+        bulk_urls = reduce(
+            lambda acc, x: acc + list(x.as_urls()),
+            (x for x in self.values() if issubclass(x, BulkActionMixin)),
+            []
+        ) if bulk_regex_list else []
 
-        return [
-            re_path(r'^', include(([
-                re_path(self.url_format.format(regex=regex), include(urls))
-                for regex in regex_list
-            ], self.url_namespace)))
-        ]
+        if self.url_batch:
+            urls.append(self.get_batch_url())
+
+        groups = [(regex_list, urls)]
+
+        if bulk_urls:
+            groups.append((bulk_regex_list, bulk_urls))
+
+        if URLResolver is None:
+            shared = [
+                self.get_url(prefix, group_urls)
+                for prefixes, group_urls in groups for prefix in prefixes
+            ]
+        else:
+            shared = [
+                share_urls(
+                    (self.get_prefix_pattern(x) for x in prefixes),
+                    group_urls
+                )
+                for prefixes, group_urls in groups
+            ]
+
+        return [re_path(r'^', include((shared, self.url_namespace)))]
 
 
 class ActionsHolderBase(ClassConnectorBase):
@@ -236,18 +754,42 @@ class ActionsHolder(
             iterable, and a new ``ActionConnector`` will be
             created or you may create an ``ActionConnector``
             by yourself.
+        actions_regex_list (list): Regexes, that prefix only the urls
+            of the `BulkActionMixin` actions, for example the
+            `PK_LIST_REGEX`.
     """
 
     actions = []
+    actions_regex_list = []
+
+    @classmethod
+    def get_url_reverser(cls, action: str=None, namespace: str=None):
+        """
+        Returns a reverser for the view urls, or for the action urls.
+
+        Args:
+            action (str, optional): Action name.
+            namespace (str, optional): Namespace, that view urls are
+                included with.
+
+        Returns:
+            UrlReverser: Url reverser.
+        """
+        if action is not None:
+            return cls.actions.get_url_reverser(action, namespace)
+
+        return get_reverser(join_names(namespace, cls.get_url_name()))
 
     @classmethod
     def as_urls(cls, regex_list=None):
         view_urls = list(super().as_urls(regex_list))
 
-        return [
+        return cls.finalize_urls([
             *view_urls,
-            re_path(r'^', include(([cls.actions.as_urls((
-                path_regex(view_url).pattern.lstrip('^').rstrip('$')
-                for view_url in view_urls
-            ))[0]], cls.get_url_name())))
-        ]
+            *cls.include_urls(lambda: [cls.actions.as_urls(
+                [path_prefix(view_url) for view_url in view_urls],
+                [cls.get_url_prefix(x) for x in cls.actions_regex_list],
+            )[0]], cls.get_url_name(), cls.get_url_prefixes(regex_list) | (
+                cls.get_url_prefixes(cls.actions_regex_list)
+            )),
+        ])
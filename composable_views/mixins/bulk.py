@@ -0,0 +1,225 @@
+"""
+Bulk execution of single object actions.
+"""
+
+import copy
+
+from django.http import HttpResponseBadRequest, JsonResponse
+from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.exception import response_for_exception
+
+
+__all__ = ['BulkActionMixin']
+
+
+class BulkActionMixin:
+    """
+    Runs a single object action for many objects at once, when its
+    url has a list of pks, like the `PK_LIST_REGEX` one. All the
+    objects are loaded with one query, and the action handler is
+    called for each of them with the `pk` kwarg, while `get_object`
+    of the action and of its parent return the loaded object.
+
+    Urls without the pks list are dispatched as usual, so the same
+    action is registered in the holder's `actions` once, and the
+    holder adds the pks list prefix with the `actions_regex_list`.
+    Bulk requests go through the whole `dispatch` chain once, so
+    access checks of other mixins apply to them too. Handlers are
+    called synchronously, so actions with async handlers are refused.
+
+    Example:
+        >>> class Publish(BulkActionMixin, ActionViewMixin, View):
+        >>>     def post(self, request, *args, **kwargs):
+        >>>         obj = self.get_object()
+        >>>         ...
+        >>>
+        >>> class Detail(ActionsHolder, DetailView):
+        >>>     url_regex_list = [PK_REGEX]
+        >>>     actions_regex_list = [PK_LIST_REGEX]
+        >>>     actions = [Publish]
+
+    Attributes:
+        bulk_kwarg (str): Url kwarg with the pks list.
+        bulk_object_kwarg (str): Kwarg, that each object is passed to
+            the action handler with.
+        bulk_chunk_size (int): Objects in a chunk.
+        bulk_executor (Executor): Executor to run chunks concurrently,
+            for example a `ThreadPoolExecutor`. Each thread uses its
+            own database connection, so chunks don't share
+            transactions, and executor threads should close their
+            connections themselves. By default chunks are run one by
+            one in the request thread.
+        bulk_max_objects (int): Maximum pks in a request, more are
+            rejected with the 400 response.
+        bulk_object (object): Object of the single action run.
+    """
+
+    bulk_kwarg = 'pks'
+    bulk_object_kwarg = 'pk'
+    bulk_chunk_size = 100
+    bulk_executor = None
+    bulk_max_objects = 1000
+    bulk_object = None
+
+    def get_bulk_pks(self) -> list:
+        """
+        Returns:
+            list: Unique pks from the url, a comma separated string
+                in the regex mode, or a converted list of ints.
+        """
+        pks = self.kwargs[self.bulk_kwarg]
+
+        if isinstance(pks, str):
+            pks = pks.split(',')
+
+        return list(dict.fromkeys(int(x) for x in pks))
+
+    def get_bulk_queryset(self, pks: list):
+        """
+        Args:
+            pks (list): Pks of the objects.
+
+        Returns:
+            QuerySet: Queryset of the parent view, or of the action
+                itself, filtered by the pks.
+        """
+        view = self.parental if self.parent_class is not None else self
+
+        return view.get_queryset().filter(pk__in=pks)
+
+    def get_bulk_objects(self, pks: list) -> list:
+        """
+        Loads all the objects with one query.
+
+        Args:
+            pks (list): Pks of the objects.
+
+        Returns:
+            list: Objects in the order of the pks.
+        """
+        order = {pk: index for index, pk in enumerate(pks)}
+
+        return sorted(
+            self.get_bulk_queryset(pks), key=lambda x: order.get(x.pk, 0)
+        )
+
+    def get_bulk_chunks(self, objects: list) -> list:
+        size = max(self.bulk_chunk_size, 1)
+
+        return [objects[i:i + size] for i in range(0, len(objects), size)]
+
+    def get_bulk_view(self, obj):
+        """
+        Args:
+            obj (object): Loaded object.
+
+        Returns:
+            View: Copy of the action for the single object.
+        """
+        view = copy.copy(self)
+        view.__dict__.pop('parental', None)
+        view.__dict__.pop(self.request.method.lower(), None)
+        view.bulk_object = obj
+        view.kwargs = {
+            **{k: v for k, v in self.kwargs.items() if k != self.bulk_kwarg},
+            self.bulk_object_kwarg: obj.pk,
+        }
+
+        def get_object(*args, **kwargs):
+            return obj
+
+        view.get_object = get_object
+
+        if self.parent_class is not None:
+            view.parental.get_object = get_object
+
+        return view
+
+    def run_bulk_chunk(self, objects: list) -> list:
+        """
+        Calls the action handler for each object of the chunk.
+
+        Args:
+            objects (list): Chunk of objects.
+
+        Returns:
+            list: Pks and response statuses.
+        """
+        results = []
+
+        for obj in objects:
+            view = self.get_bulk_view(obj)
+            handler = getattr(view, self.request.method.lower())
+
+            try:
+                response = handler(self.request, *view.args, **view.kwargs)
+            except Exception as e:
+                response = response_for_exception(self.request, e)
+
+            results.append({'pk': obj.pk, 'status': response.status_code})
+
+        return results
+
+    def get_bulk_response(self, results: list):
+        ok = all(x['status'] < 400 for x in results)
+
+        return JsonResponse(
+            {'ok': ok, 'results': results}, status=200 if ok else 400
+        )
+
+    def bulk(self, request, *args, **kwargs):
+        """
+        Handler of the bulk request.
+
+        Returns:
+            JsonResponse: Pks and response statuses of the objects.
+        """
+        pks = self.get_bulk_pks()
+
+        if len(pks) > self.bulk_max_objects:
+            return HttpResponseBadRequest()
+
+        objects = self.get_bulk_objects(pks)
+        chunks = self.get_bulk_chunks(objects)
+
+        if self.bulk_executor is None or len(chunks) < 2:
+            chunk_results = map(self.run_bulk_chunk, chunks)
+        else:
+            chunk_results = self.bulk_executor.map(
+                self.run_bulk_chunk, chunks
+            )
+
+        results = [x for chunk in chunk_results for x in chunk]
+        found = {x.pk for x in objects}
+        results.extend(
+            {'pk': pk, 'status': 404} for pk in pks if pk not in found
+        )
+
+        return self.get_bulk_response(results)
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """
+        Raises:
+            ImproperlyConfigured: When the action handlers are async.
+        """
+        if getattr(cls, 'view_is_async', False):
+            raise ImproperlyConfigured(
+                f'Bulk action `{cls.__name__}` can not have async '
+                'handlers.'
+            )
+
+        return super().as_view(**initkwargs)
+
+    def dispatch(self, request, *args, **kwargs):
+        method = request.method.lower()
+
+        if self.bulk_kwarg in kwargs and (
+            method in self.http_method_names and hasattr(self, method)
+        ):
+            # Handler is replaced on the instance, so the rest of the
+            # dispatch chain, access checks included, runs once for the
+            # whole bulk request.
+            setattr(self, method, self.bulk)
+
+        return super().dispatch(request, *args, **kwargs)
@@ -0,0 +1,277 @@
+"""
+Declarative response caching of views and actions.
+"""
+
+from functools import wraps
+
+from django.core.cache import caches, DEFAULT_CACHE_ALIAS
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_save, post_delete
+from django.utils import cache as cache_utils
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:
+    sync_to_async = None
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError:
+    from asyncio import iscoroutinefunction
+
+from ..snapshots import object_reference
+
+
+__all__ = [
+    'CACHE_ATTRIBUTES', 'get_cache_generation', 'is_authenticated',
+    'invalidate_cache', 'cache_response', 'ResponseCacheMixin'
+]
+
+CACHE_ATTRIBUTES = frozenset((
+    'cache_timeout', 'cache_vary', 'cache_key', 'cache_alias',
+    'cache_models', 'cache_authenticated',
+))
+
+GENERATION_KEY = 'composable_views.cache.generation.{key}'
+
+
+def get_cache_generation(key: str, alias: str=DEFAULT_CACHE_ALIAS) -> str:
+    """
+    Args:
+        key (str): Cache key of the views.
+        alias (str, optional): Cache alias.
+
+    Returns:
+        str: Current generation of the cached responses.
+    """
+    return caches[alias].get(GENERATION_KEY.format(key=key), '0')
+
+
+def is_authenticated(request) -> bool:
+    """
+    Args:
+        request (HttpRequest): Request.
+
+    Returns:
+        bool: Request has credentials, so its response may be private.
+    """
+    user = getattr(request, 'user', None)
+
+    return (
+        'HTTP_AUTHORIZATION' in request.META or
+        bool(getattr(user, 'is_authenticated', False))
+    )
+
+
+def invalidate_cache(key: str, alias: str=DEFAULT_CACHE_ALIAS):
+    """
+    Invalidates all cached responses of the views with the key. Old
+    responses are not deleted, but the new generation doesn't see
+    them, so they expire by themselves.
+
+    Args:
+        key (str): Cache key of the views.
+        alias (str, optional): Cache alias.
+    """
+    cache = caches[alias]
+    name = GENERATION_KEY.format(key=key)
+
+    try:
+        cache.incr(name)
+    except ValueError:
+        cache.add(name, 1, None)
+
+
+def cache_response(
+    view, key: str, timeout: int, vary: list=(),
+    alias: str=DEFAULT_CACHE_ALIAS, authenticated: bool=False
+):
+    """
+    Wraps a view function with a response cache. Works like Django's
+    `cache_page`, but responses are cached under the generation of
+    the key, so they may be invalidated with `invalidate_cache`.
+
+    Only GET responses with the 200 status are cached, and HEAD
+    requests are served from them. Requests with a logged in user or
+    the `Authorization` header bypass the cache, unless
+    `authenticated` is set.
+
+    Args:
+        view (callable): View function, sync or async.
+        key (str): Cache key of the view.
+        timeout (int): Cache timeout in seconds.
+        vary (list, optional): Request headers, that responses vary
+            on. They are added to the response `Vary` header, and
+            each value gets its own cache entry.
+        alias (str, optional): Cache alias.
+        authenticated (bool, optional): Cache responses of the
+            authenticated requests too. They vary on the `Cookie` and
+            `Authorization` headers then.
+
+    Returns:
+        callable: Wrapped view function.
+    """
+    cache = caches[alias]
+
+    if authenticated:
+        vary = (*vary, 'Cookie', 'Authorization')
+
+    def lookup(request) -> tuple:
+        if request.method not in ('GET', 'HEAD') or (
+            not authenticated and is_authenticated(request)
+        ):
+            return None, None
+
+        # Prefix is computed once, so a response, that was rendered
+        # before the invalidation, is not stored in the new generation.
+        prefix = f'{key}.{get_cache_generation(key, alias)}'
+        cache_key = cache_utils.get_cache_key(
+            request, prefix, 'GET', cache=cache
+        )
+
+        return prefix, None if cache_key is None else cache.get(cache_key)
+
+    def store(request, prefix: str, response):
+        if vary:
+            cache_utils.patch_vary_headers(response, vary)
+
+        if (
+            prefix is None or request.method != 'GET' or
+            response.streaming or response.status_code != 200 or
+            'private' in response.get('Cache-Control', '') or (
+                not request.COOKIES and response.cookies and
+                cache_utils.has_vary_header(response, 'Cookie')
+            )
+        ):
+            return response
+
+        def set_response(response):
+            cache.set(cache_utils.learn_cache_key(
+                request, response, timeout, prefix, cache=cache
+            ), response, timeout)
+
+        if callable(getattr(response, 'render', None)):
+            response.add_post_render_callback(set_response)
+        else:
+            set_response(response)
+
+        return response
+
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            prefix, response = await sync_to_async(lookup)(request)
+
+            if response is not None:
+                return response
+
+            response = await view(request, *args, **kwargs)
+
+            return await sync_to_async(store)(request, prefix, response)
+    else:
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            prefix, response = lookup(request)
+
+            if response is not None:
+                return response
+
+            return store(request, prefix, view(request, *args, **kwargs))
+
+    return wrapper
+
+
+class ResponseCacheMixin:
+    """
+    Caches view responses, when `cache_timeout` is set. The request
+    handler is wrapped with the cache, so the `dispatch` of access
+    mixins runs before it, even for the cached responses. Responses
+    are shared by all users, so requests with a logged in user or the
+    `Authorization` header are not cached by default.
+
+    Viewsets add this mixin to the generated views, when they have
+    `{name}_cache_timeout` or other `{name}_cache_*` attributes, and
+    actions declare them by themselves.
+
+    Responses are invalidated on saves and deletions of the
+    `cache_models`, or with the `invalidate_cache`.
+
+    Example:
+        >>> class Articles(ViewSet):
+        >>>     detail_view_base = ArticleDetail
+        >>>     detail_cache_timeout = 60
+        >>>     detail_cache_vary = ['Accept']
+        >>>     detail_cache_models = ['blog.Article']
+
+    Attributes:
+        cache_timeout (int): Cache timeout in seconds. `None` disables
+            the cache.
+        cache_vary (list): Request headers, that responses vary on.
+        cache_key (str): Key of the cached responses. By default it's
+            the import reference of the view, like a snapshot uses.
+        cache_alias (str): Cache alias.
+        cache_models (list): Models or `'app_label.Model'` strings,
+            whose changes invalidate the cache.
+        cache_authenticated (bool): Cache responses of the
+            authenticated requests too, separately for each `Cookie`
+            and `Authorization` header value.
+    """
+
+    cache_timeout = None
+    cache_vary = ()
+    cache_key = None
+    cache_alias = DEFAULT_CACHE_ALIAS
+    cache_models = ()
+    cache_authenticated = False
+
+    @classmethod
+    def get_cache_key(cls) -> str:
+        """
+        Returns:
+            str: Key of the cached responses.
+        """
+        if cls.cache_key is not None:
+            return cls.cache_key
+
+        try:
+            return object_reference(cls)
+        except ImproperlyConfigured:
+            return f'{cls.__module__}.{cls.__qualname__}'
+
+    @classmethod
+    def connect_cache_invalidation(cls):
+        """
+        Connects model signals, that invalidate the cache.
+        """
+        key = cls.get_cache_key()
+        alias = cls.cache_alias
+
+        def invalidate(sender, **kwargs):
+            invalidate_cache(key, alias)
+
+        for model in cls.cache_models:
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    invalidate, sender=model, weak=False,
+                    dispatch_uid=f'composable_views.cache.{alias}.{key}'
+                )
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        if cls.cache_timeout is not None:
+            cls.connect_cache_invalidation()
+
+        return super().as_view(**initkwargs)
+
+    def dispatch(self, request, *args, **kwargs):
+        method = request.method.lower()
+        handler = getattr(self, method, None)
+
+        if (
+            self.cache_timeout is not None and handler is not None and
+            method in ('get', 'head')
+        ):
+            setattr(self, method, cache_response(
+                handler, self.get_cache_key(), self.cache_timeout,
+                self.cache_vary, self.cache_alias, self.cache_authenticated
+            ))
+
+        return super().dispatch(request, *args, **kwargs)
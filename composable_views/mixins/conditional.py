@@ -0,0 +1,86 @@
+"""
+Conditional requests (ETag / Last-Modified) for views and actions.
+"""
+
+from django.views.decorators.http import condition
+
+
+__all__ = ['CONDITIONAL_ATTRIBUTES', 'ConditionalMixin']
+
+CONDITIONAL_ATTRIBUTES = frozenset(('etag', 'last_modified'))
+
+
+class ConditionalMixin:
+    """
+    Answers conditional requests with Django's `condition`, before the
+    request reaches the handler. So fresh client copies get the 304
+    response without `get_object`, `get_context_data` or rendering,
+    and unsafe requests with a stale `If-Match` get the 412 one.
+
+    Only the handler is wrapped, so the `dispatch` of access mixins
+    runs first, and denied requests never reach the ETag function.
+
+    Viewsets add this mixin to the generated views, when they have
+    `{name}_etag` or `{name}_last_modified` attributes.
+
+    Example:
+        >>> class Articles(ViewSet):
+        >>>     detail_view_base = ArticleDetail
+        >>>
+        >>>     def detail_etag(self, request, *args, **kwargs):
+        >>>         return str(Article.objects.filter(
+        >>>             pk=kwargs['pk']
+        >>>         ).values_list('version', flat=True).first())
+
+    Attributes:
+        etag (callable): Method, that returns the ETag of the resource,
+            or `None`. It takes the request, args and kwargs of the
+            view.
+        last_modified (callable): Method, that returns the datetime
+            of the last resource change, or `None`. It takes the same
+            arguments as the `etag`.
+        conditional_parental (bool): Action without its own functions
+            uses the ones of the parent view.
+    """
+
+    etag = None
+    last_modified = None
+    conditional_parental = False
+
+    def get_condition_funcs(self) -> tuple:
+        """
+        Returns:
+            tuple: ETag and last modified functions, bound to the view
+                or to the parent one.
+        """
+        view = self
+
+        if (
+            self.conditional_parental and self.etag is None and
+            self.last_modified is None and
+            getattr(self, 'parent_class', None) is not None
+        ):
+            view = self.parental
+
+        return (
+            getattr(view, 'etag', None), getattr(view, 'last_modified', None)
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        etag, last_modified = self.get_condition_funcs()
+        method = request.method.lower()
+        handler = (
+            getattr(self, method, None)
+            if method in self.http_method_names else None
+        )
+
+        # Handler is wrapped instead of the dispatch, so the access
+        # checks of the base view run before the conditional ones.
+        if handler is not None and (
+            etag is not None or last_modified is not None
+        ):
+            setattr(self, method, condition(
+                etag_func=etag, last_modified_func=last_modified
+            )(handler))
+
+        return super().dispatch(request, *args, **kwargs)
@@ -2,37 +2,880 @@
 Context manipulation mixins.
 """
 
-from functools import reduce
+import asyncio
+import copy
+import hashlib
+from functools import partial
 
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.utils.functional import SimpleLazyObject
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:
+    sync_to_async = None
+
+
+__all__ = [
+    'ContextCache', 'StaticContext', 'ContextGetter', 'context_getter',
+    'ContextGetterMixin', 'AsyncContextMixin'
+]
+
+
+class ContextCache:
+    """
+    Cache policy for a context getter.
+
+    Example:
+        >>> class View(ContextGetterMixin, TemplateView):
+        >>>     @context_getter(cache=ContextCache(
+        >>>         timeout=600, vary=['request.user.pk', 'kwargs.pk']
+        >>>     ))
+        >>>     def context_sidebar(self, context):
+        >>>         return {'sidebar': build_sidebar()}
+
+    Attributes:
+        timeout (int): Time to live of the cached value in seconds.
+        alias (str): Cache alias.
+        vary (iterable): Parts of the cache key. Each part is either a
+            dotted path to resolve from the view instance, like
+            `request.user.pk` or `kwargs.pk`, or a callable that
+            receives the view instance.
+        version (int | callable): Policy version, that is a part of the
+            cache key. Change it to invalidate all the cached values.
+            May be a callable that receives the view instance.
+        key_prefix (str): Prefix for the cache keys.
+    """
+
+    def __init__(
+        self,
+        timeout: int=DEFAULT_TIMEOUT,
+        alias: str='default',
+        vary=(),
+        version=None,
+        key_prefix: str='context'
+    ):
+        self.timeout = timeout
+        self.alias = alias
+        self.vary = tuple(vary)
+        self.version = version
+        self.key_prefix = key_prefix
+
+    def get_cache(self):
+        """
+        Returns:
+            BaseCache: Cache to store values in.
+        """
+        return caches[self.alias]
+
+    def get_part(self, view, part):
+        """
+        Resolves a single cache key part.
+
+        Args:
+            view (View): View instance.
+            part (str | callable): Dotted path or a callable.
+
+        Returns:
+            object: Key part value.
+        """
+        if callable(part):
+            return part(view)
+
+        value = view
+
+        for name in part.split('.'):
+            if value is None:
+                break
+
+            if hasattr(value, 'get') and not hasattr(value, name):
+                value = value.get(name)
+            else:
+                value = getattr(value, name, None)
+
+        return value
+
+    def get_version(self, view):
+        """
+        Args:
+            view (View): View instance.
+
+        Returns:
+            object: Current policy version.
+        """
+        return self.version(view) if callable(self.version) else self.version
+
+    def get_key(self, view, getter: 'ContextGetter') -> str:
+        """
+        Builds cache key for a getter value.
+
+        Args:
+            view (View): View instance.
+            getter (ContextGetter): Getter description.
+
+        Returns:
+            str: Cache key.
+        """
+        cls = type(view)
+        source = repr((
+            cls.__module__, cls.__qualname__, getter.name,
+            self.get_version(view),
+            tuple(self.get_part(view, x) for x in self.vary),
+        ))
+
+        return '{}:{}'.format(
+            self.key_prefix, hashlib.md5(source.encode('utf-8')).hexdigest()
+        )
+
+
+class StaticContext(dict):
+    """
+    Dict getters, that are next to each other, merged into one.
+
+    Attributes:
+        names (tuple): Names of the merged attributes, so instance
+            values may be used instead of the class ones.
+    """
+
+    def __init__(self, names=(), *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.names = tuple(names)
+
+
+class ContextGetter:
+    """
+    Description of a single context getter.
+
+    Attributes:
+        name (str): Name of the getter attribute in the view class.
+        key (str): Context key to store getter result in. If it's None
+            getter must return a dict, that will update the context.
+        lazy (bool): Lazy getter result will be evaluated only when
+            someone reads it from the context.
+        depends (iterable): Context keys (or getter names without a
+            prefix) this getter reads. Getters that have no
+            dependencies between each other may be evaluated at the
+            same time. If it's None getter depends on all the getters
+            before it.
+        cache (ContextCache): Cache policy for the getter result.
+    """
+
+    def __init__(
+        self,
+        name: str=None,
+        key: str=None,
+        lazy: bool=False,
+        depends=None,
+        cache: ContextCache=None
+    ):
+        self.name = name
+        self.key = key
+        self.lazy = lazy
+        self.depends = None if depends is None else frozenset(depends)
+        self.cache = cache
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.name}>'
+
+    def bind(self, name: str, prefix: str) -> 'ContextGetter':
+        """
+        Creates a copy of the getter description for the provided
+        attribute.
+
+        Args:
+            name (str): Attribute name in the view class.
+            prefix (str): Context getter prefix of the view class.
+
+        Returns:
+            ContextGetter: Bound getter description.
+        """
+        getter = copy.copy(self)
+        getter.name = name
+
+        if getter.key is None and getter.lazy:
+            getter.key = name[len(prefix):]
+
+        return getter
+
+    def get_label(self, prefix: str) -> str:
+        """
+        Returns name, other getters may depend on.
+
+        Args:
+            prefix (str): Context getter prefix of the view class.
+
+        Returns:
+            str: Context key or getter name without a prefix.
+        """
+        if self.key is not None:
+            return self.key
+
+        return self.name[len(prefix):]
+
+
+def context_getter(func=None, **options):
+    """
+    Decorator to set up a context getter method.
+
+    Example:
+        >>> class View(ContextGetterMixin, TemplateView):
+        >>>     @context_getter(lazy=True)
+        >>>     def context_users(self, context):
+        >>>         return User.objects.all()
+
+    Args:
+        func (callable, optional): Getter method.
+        **options: `ContextGetter` options.
+
+    Returns:
+        callable: Same method with `context_getter` description
+            attached or a decorator.
+    """
+    if func is None:
+        return partial(context_getter, **options)
+
+    func.context_getter = ContextGetter(**options)
+
+    return func
 
-__all__ = ['ContextGetterMixin']
 
 class ContextGetterMixin:
     """
     Context that will be passed to a template now may be generated
     without a supering `get_context_data` method.
 
+    Getters are collected once per class in to an ordered table, so
+    on each request only the getters themselves are resolved. Dict
+    getters that are next to each other are merged into a single
+    static dict at that moment, so changing them on the class after
+    the first render has no effect. Instance values, like `as_view`
+    initkwargs, are still used instead of the class ones.
+
+    Getter methods may be described by the `context_getter` decorator.
+    Result of a lazy getter will be stored in the context under its
+    key (name without a prefix by default) and evaluated at most once,
+    when the template or the view reads it.
+
+    Getters, that declared their dependencies, may be evaluated
+    concurrently: in a `context_executor` for the `get_context_data`
+    and with the `asyncio.gather` for the `aget_context_data`. Results
+    are always merged in the same order as without concurrency.
+
+    Getters with a `ContextCache` policy are read from the cache with
+    a single `get_many` call (per cache alias) before the evaluation,
+    and missed values are stored with a single `set_many` call after.
+    Values of the lazy getters are stored when they are evaluated.
+
+    Request may name the getters it needs (by their keys or names
+    without a prefix), for example for a partial page refresh. Only
+    those getters and their dependencies are evaluated then.
+
     Attributes:
         context_getter_prefix (str): Prefix for methods or data dicts
             that will be gathered for a template context.
+        context_executor (concurrent.futures.Executor): Executor to
+            run independent getters in. If it's None getters are
+            evaluated one after another. Getters in pool threads use
+            their own database connections, so they don't share the
+            request transaction, and executor threads should close
+            their connections themselves.
+        context_fields (iterable): Getters to evaluate. If it's None
+            all getters are evaluated. May be passed to the `as_view`.
+        context_fields_param (str): Query parameter with comma
+            separated getters to evaluate.
+        context_fields_header (str): Request header with comma
+            separated getters to evaluate.
     """
     context_getter_prefix = 'context_'
+    context_executor = None
+    context_fields = None
+    context_fields_param = None
+    context_fields_header = None
+
+    @classmethod
+    def get_context_getters(cls) -> tuple:
+        """
+        Returns context getters table for the current class. Table is
+        built on the first call and stored in the class itself.
+
+        Returns:
+            tuple: Ordered getters. Each item is either a static `dict`
+                or a `ContextGetter`, that should be resolved on the
+                view instance.
+        """
+        table = cls.__dict__.get('_context_getters')
+
+        if table is None:
+            table = cls.build_context_getters()
+            cls._context_getters = table
+
+        return table
+
+    @classmethod
+    def build_context_getters(cls) -> tuple:
+        """
+        Builds context getters table, keeping the order that `dir`
+        gives.
+
+        Returns:
+            tuple: Ordered getters table.
+        """
+        prefix = cls.context_getter_prefix
+        table = []
+        static = None
+
+        for name in dir(cls):
+            if not name.startswith(prefix):
+                continue
+
+            value = getattr(cls, name)
+
+            if isinstance(value, dict):
+                if static is None:
+                    static = StaticContext()
+                    table.append(static)
+
+                static.names += (name, )
+                static.update(value)
+            elif callable(value) or hasattr(type(value), '__get__'):
+                # Methods and descriptors (properties, for example) are
+                # resolved on the view instance.
+                getter = getattr(value, 'context_getter', None)
+                table.append((getter or ContextGetter()).bind(name, prefix))
+                static = None
+
+        return tuple(table)
+
+    @classmethod
+    def get_context_dependencies(cls) -> dict:
+        """
+        Returns context getters dependencies for the current class.
+        Dependencies are built on the first call and stored in the
+        class itself.
+
+        Returns:
+            dict: Indexes of the getters, each getter depends on, by
+                getter indexes. Static dicts are not included.
+        """
+        dependencies = cls.__dict__.get('_context_dependencies')
+
+        if dependencies is None:
+            dependencies = cls.build_context_dependencies()
+            cls._context_dependencies = dependencies
+
+        return dependencies
+
+    @classmethod
+    def build_context_dependencies(cls) -> dict:
+        """
+        Builds context getters dependencies. Getter without declared
+        dependencies depends on all the getters before it.
+
+        Returns:
+            dict: Dependencies by getter indexes.
+        """
+        prefix = cls.context_getter_prefix
+        table = cls.get_context_getters()
+        dependencies = {}
+
+        for index, getter in enumerate(table):
+            if isinstance(getter, dict):
+                continue
+
+            dependencies[index] = frozenset(
+                dependencies if getter.depends is None else
+                (
+                    x for x in dependencies
+                    if table[x].get_label(prefix) in getter.depends
+                )
+            )
+
+        return dependencies
+
+    @classmethod
+    def get_context_schedule(cls) -> tuple:
+        """
+        Returns context getters evaluation schedule for the current
+        class. Schedule is built on the first call and stored in the
+        class itself.
+
+        Returns:
+            tuple: Waves of getter indexes in the getters table. Each
+                wave depends only on the previous ones.
+        """
+        schedule = cls.__dict__.get('_context_schedule')
+
+        if schedule is None:
+            schedule = cls.build_context_schedule()
+            cls._context_schedule = schedule
+
+        return schedule
+
+    @classmethod
+    def build_context_schedule(cls) -> tuple:
+        """
+        Builds context getters evaluation schedule. Static dicts and
+        lazy getters are not evaluated, so they are not scheduled.
+
+        Returns:
+            tuple: Waves of getter indexes.
+        """
+        table = cls.get_context_getters()
+        levels = {}
+
+        for index, dependencies in cls.get_context_dependencies().items():
+            if table[index].lazy:
+                continue
+
+            levels[index] = max(
+                (levels[x] + 1 for x in dependencies if x in levels),
+                default=0
+            )
+
+        waves = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+
+        for index, level in levels.items():
+            waves[level].append(index)
+
+        return tuple(tuple(x) for x in waves)
+
+    def get_context_fields(self) -> frozenset:
+        """
+        Returns getters, requested for the evaluation. Query parameter
+        and header take precedence over the `context_fields`.
+
+        Returns:
+            frozenset: Getter keys (or names without a prefix) or None,
+                if all getters should be evaluated.
+        """
+        fields = self.context_fields
+        request = getattr(self, 'request', None)
+
+        if request is not None:
+            header = self.context_fields_header
+            param = self.context_fields_param
+            header = (
+                'HTTP_' + header.upper().replace('-', '_') if header else None
+            )
+
+            if param and param in request.GET:
+                fields = request.GET[param]
+            elif header and header in request.META:
+                fields = request.META[header]
+
+        if fields is None:
+            return None
+
+        if isinstance(fields, str):
+            fields = fields.split(',')
+
+        return frozenset(x.strip() for x in fields if x.strip())
+
+    def get_context_selection(self) -> frozenset:
+        """
+        Returns getters to evaluate: requested ones and everything they
+        depend on.
+
+        Returns:
+            frozenset: Getter indexes or None, if all getters should be
+                evaluated.
+        """
+        fields = self.get_context_fields()
+
+        if fields is None:
+            return None
 
-    def get_context_data(self, **kwargs):
         prefix = self.context_getter_prefix
-        getters = (
-            getattr(self, name)
-            for name in (x for x in dir(self) if x.startswith(prefix))
-        )
+        table = self.get_context_getters()
+        dependencies = self.get_context_dependencies()
+        stack = [
+            x for x in dependencies if table[x].get_label(prefix) in fields
+        ]
+        selection = set()
+
+        while stack:
+            index = stack.pop()
+
+            if index not in selection:
+                selection.add(index)
+                stack.extend(dependencies[index])
+
+        return frozenset(selection)
+
+    def get_context_executor(self):
+        """
+        Returns executor for the concurrent getters evaluation.
+
+        Returns:
+            concurrent.futures.Executor: Executor or None.
+        """
+        return self.context_executor
+
+    def get_context_value(self, getter: ContextGetter, context: dict):
+        """
+        Resolves a single getter value.
+
+        Args:
+            getter (ContextGetter): Getter description.
+            context (dict): Context, built so far.
+
+        Returns:
+            object: Getter result or None, if there is no value.
+        """
+        value = getattr(self, getter.name)
+
+        if callable(value):
+            return value(context)
+
+        if getter.key is not None or isinstance(value, dict):
+            return value
+
+        return None
+
+    async def aget_context_value(self, getter: ContextGetter, context: dict):
+        """
+        Resolves a single getter value in an async view. Coroutine
+        getters are awaited, others are run in the `context_executor`
+        or with the `sync_to_async`, if there is no executor.
+
+        Args:
+            getter (ContextGetter): Getter description.
+            context (dict): Context, built so far.
+
+        Returns:
+            object: Getter result or None, if there is no value.
+        """
+        method = getattr(type(self), getter.name, None)
+
+        if asyncio.iscoroutinefunction(method):
+            return await getattr(self, getter.name)(context)
+
+        executor = self.get_context_executor()
+
+        if executor is not None:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, self.get_context_value, getter, context
+            )
+
+        return await self.call_async(self.get_context_value, getter, context)
+
+    def get_context_cache_keys(self, selection: frozenset=None) -> dict:
+        """
+        Args:
+            selection (frozenset, optional): Getters to evaluate.
+
+        Returns:
+            dict: Cache keys of the cached getters by their indexes.
+        """
+        return {
+            index: getter.cache.get_key(self, getter)
+            for index, getter in enumerate(self.get_context_getters())
+            if (
+                not isinstance(getter, dict) and getter.cache is not None and
+                (selection is None or index in selection)
+            )
+        }
+
+    def read_context_cache(self, keys: dict) -> dict:
+        """
+        Reads cached getters values. Makes one `get_many` call for each
+        used cache alias.
+
+        Args:
+            keys (dict): Cache keys by getter indexes.
+
+        Returns:
+            dict: Cached values by getter indexes.
+        """
+        table = self.get_context_getters()
+        groups = {}
+        results = {}
+
+        for index, key in keys.items():
+            groups.setdefault(table[index].cache.alias, {})[key] = index
+
+        for indexes in groups.values():
+            cache = table[next(iter(indexes.values()))].cache.get_cache()
+
+            for key, value in cache.get_many(list(indexes)).items():
+                results[indexes[key]] = value
+
+        return results
+
+    def write_context_cache(self, keys: dict, results: dict, cached: dict):
+        """
+        Stores evaluated getters values, that were not found in the
+        cache. Makes one `set_many` call for each used cache alias and
+        timeout.
+
+        Args:
+            keys (dict): Cache keys by getter indexes.
+            results (dict): Evaluated values by getter indexes.
+            cached (dict): Values, that were found in the cache.
+        """
+        table = self.get_context_getters()
+        groups = {}
+
+        for index, key in keys.items():
+            if index in cached or index not in results:
+                continue
+
+            policy = table[index].cache
+            groups.setdefault((policy.alias, policy.timeout), {})[key] = (
+                results[index]
+            )
+
+        for (alias, timeout), values in groups.items():
+            caches[alias].set_many(values, timeout)
+
+    def get_cached_context_value(
+        self,
+        getter: ContextGetter,
+        context: dict,
+        key: str
+    ):
+        """
+        Resolves a single getter value and stores it in the cache.
+
+        Args:
+            getter (ContextGetter): Getter description.
+            context (dict): Context, built so far.
+            key (str): Cache key.
+
+        Returns:
+            object: Getter result or None, if there is no value.
+        """
+        value = self.get_context_value(getter, context)
+        getter.cache.get_cache().set(key, value, getter.cache.timeout)
+
+        return value
+
+    def get_lazy_context(self, context: dict, keys: dict, cached: dict):
+        """
+        Creates lazy values for the lazy getters, that are cached, but
+        were not found in the cache.
+
+        Args:
+            context (dict): Context to evaluate getters with.
+            keys (dict): Cache keys by getter indexes.
+            cached (dict): Values, that were found in the cache.
+
+        Returns:
+            dict: Lazy values by getter indexes.
+        """
+        table = self.get_context_getters()
+
+        return {
+            index: SimpleLazyObject(partial(
+                self.get_cached_context_value, table[index], context, key
+            ))
+            for index, key in keys.items()
+            if table[index].lazy and index not in cached
+        }
+
+    def get_static_context(self, static: StaticContext) -> dict:
+        """
+        Args:
+            static (StaticContext): Merged dict getters.
+
+        Returns:
+            dict: Merged dict, or dicts merged again, if any of them is
+                shadowed by an instance value.
+        """
+        if not any(name in self.__dict__ for name in static.names):
+            return static
+
+        merged = {}
+
+        for name in static.names:
+            value = getattr(self, name)
+
+            if isinstance(value, dict):
+                merged.update(value)
+
+        return merged
+
+    def update_context(
+        self,
+        context: dict,
+        results: dict=None,
+        lazy: dict=None,
+        stop: int=None,
+        evaluate: bool=True,
+        selection: frozenset=None
+    ) -> dict:
+        """
+        Updates context with getters in the table order.
+
+        Args:
+            context (dict): Context to update.
+            results (dict, optional): Already evaluated getters results
+                by their indexes. Getters, evaluated in place, will be
+                stored here too.
+            lazy (dict, optional): Already created lazy values by their
+                indexes.
+            stop (int, optional): Index of the getter to stop before.
+            evaluate (bool, optional): Whether to evaluate getters,
+                that have no results yet, or to skip them.
+            selection (frozenset, optional): Getters to use. If it's
+                None all getters are used.
+
+        Returns:
+            dict: Updated context.
+        """
+        results = {} if results is None else results
+        lazy = {} if lazy is None else lazy
+
+        for index, getter in enumerate(self.get_context_getters()[:stop]):
+            if isinstance(getter, dict):
+                context.update(self.get_static_context(getter))
+                continue
+
+            if selection is not None and index not in selection:
+                continue
+
+            if getter.lazy and index not in results:
+                if index not in lazy:
+                    lazy[index] = SimpleLazyObject(
+                        partial(self.get_context_value, getter, context)
+                    )
+
+                context[getter.key] = lazy[index]
+                continue
+
+            if index in results:
+                value = results[index]
+            elif evaluate:
+                value = results[index] = self.get_context_value(
+                    getter, context
+                )
+            else:
+                continue
+
+            if getter.key is not None:
+                context[getter.key] = value
+            elif value is not None:
+                context.update(value)
+
+        return context
+
+    def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        schedule = self.get_context_schedule()
+        executor = self.get_context_executor()
+        table = self.get_context_getters()
+        selection = self.get_context_selection()
+        keys = self.get_context_cache_keys(selection)
+        cached = self.read_context_cache(keys) if keys else {}
+        results = dict(cached)
+        lazy = self.get_lazy_context(context, keys, cached)
+
+        if selection is not None:
+            schedule = [[x for x in y if x in selection] for y in schedule]
+
+        if executor is not None and any(len(x) > 1 for x in schedule):
+            for wave in schedule:
+                futures = [
+                    (index, executor.submit(
+                        self.get_context_value,
+                        table[index],
+                        # Lazy values of the copy are not kept, so
+                        # the final ones see the whole context.
+                        self.update_context(
+                            dict(context), results, dict(lazy), index,
+                            False, selection
+                        )
+                    ))
+                    for index in wave
+                    if index not in results
+                ]
+
+                for index, future in futures:
+                    results[index] = future.result()
+
+        self.update_context(context, results, lazy, selection=selection)
+
+        if keys:
+            self.write_context_cache(keys, results, cached)
 
-        getters = (
-            getter(context) if callable(getter) else getter
-            for getter in getters
-            if callable(getter) or isinstance(getter, dict)
+        return context
+
+    async def aget_context_data(self, **kwargs):
+        """
+        Async version of the `get_context_data`. Getters of each
+        schedule wave are evaluated with the `asyncio.gather`.
+
+        Returns:
+            dict: Template context.
+        """
+        context = super().get_context_data(**kwargs)
+        table = self.get_context_getters()
+        selection = self.get_context_selection()
+        keys = self.get_context_cache_keys(selection)
+        cached = (
+            await self.call_async(self.read_context_cache, keys)
+            if keys else {}
         )
+        results = dict(cached)
+        lazy = self.get_lazy_context(context, keys, cached)
+
+        for wave in self.get_context_schedule():
+            wave = [
+                x for x in wave
+                if x not in results and (selection is None or x in selection)
+            ]
+            values = await asyncio.gather(*(
+                self.aget_context_value(
+                    table[index],
+                    self.update_context(
+                        dict(context), results, dict(lazy), index, False,
+                        selection
+                    )
+                )
+                for index in wave
+            ))
+            results.update(zip(wave, values))
+
+        self.update_context(context, results, lazy, selection=selection)
 
-        for getter in getters:
-            context.update(getter)
+        if keys:
+            await self.call_async(
+                self.write_context_cache, keys, results, cached
+            )
 
         return context
+
+    async def call_async(self, func, *args):
+        """
+        Calls a blocking function from the async view.
+
+        Args:
+            func (callable): Function to call.
+            *args: Function arguments.
+
+        Returns:
+            object: Function result.
+        """
+        if sync_to_async is None:
+            return func(*args)
+
+        return await sync_to_async(func)(*args)
+
+
+class AsyncContextMixin:
+    """
+    Async `get` for the template views with context getters. Context
+    is built with the `aget_context_data`, so coroutine getters are
+    awaited together. Django runs the view natively under ASGI, if all
+    the other handlers of the view are async too.
+
+    Example:
+        >>> class View(AsyncContextMixin, ContextGetterMixin, TemplateView):
+        >>>     async def context_user(self, context):
+        >>>         return {'user': await User.objects.aget(pk=1)}
+    """
+
+    async def get(self, request, *args, **kwargs):
+        context = await self.aget_context_data(**kwargs)
+
+        return self.render_to_response(context)
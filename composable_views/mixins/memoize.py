@@ -0,0 +1,161 @@
+"""
+Request scoped memoization of view methods.
+"""
+
+import asyncio
+import inspect
+from functools import wraps
+
+from django.core.exceptions import ImproperlyConfigured
+
+
+__all__ = [
+    'REQUEST_MEMO_ATTRIBUTE', 'memoized', 'clear_memoized', 'MemoizeMixin'
+]
+
+REQUEST_MEMO_ATTRIBUTE = '_composable_memo'
+
+_missing = object()
+
+
+def _get_memo(view, method, args: tuple, kwargs: dict) -> tuple:
+    """
+    Returns:
+        tuple: Request memo and the call key, or `None` and `None` if
+            the call can not be memoized.
+    """
+    request = getattr(view, 'request', None)
+
+    if request is None:
+        return None, None
+
+    key = (
+        type(view), method, tuple(getattr(view, 'args', ())),
+        tuple(sorted(getattr(view, 'kwargs', {}).items())),
+        args, tuple(sorted(kwargs.items())),
+    )
+
+    try:
+        hash(key)
+    except TypeError:
+        return None, None
+
+    return request.__dict__.setdefault(REQUEST_MEMO_ATTRIBUTE, {}), key
+
+
+def memoized(method):
+    """
+    Decorator, that memoizes a view method for the current request.
+
+    Results are stored on the request, keyed by the view class, the
+    method, view args and kwargs, and method arguments. So the parent
+    view, that `parental` creates, shares them with all the actions
+    for the same request. Methods are called as is when the view has
+    no request, or arguments are not hashable.
+
+    Coroutine methods are memoized as tasks, so concurrent calls
+    await the same one. Failed calls are not memoized.
+
+    Example:
+        >>> class View(DetailView):
+        >>>     @memoized
+        >>>     def get_object(self, queryset=None):
+        >>>         return super().get_object(queryset)
+
+    Args:
+        method (callable): View method.
+
+    Returns:
+        callable: Memoized method.
+    """
+    if getattr(method, 'memoized', False):
+        return method
+
+    if inspect.iscoroutinefunction(method):
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            memo, key = _get_memo(self, method, args, kwargs)
+
+            if memo is None:
+                return await method(self, *args, **kwargs)
+
+            task = memo.get(key)
+
+            if task is None:
+                task = memo[key] = asyncio.ensure_future(
+                    method(self, *args, **kwargs)
+                )
+
+            try:
+                # Cancelled caller doesn't cancel the shared task.
+                return await asyncio.shield(task)
+            except Exception:
+                if memo.get(key) is task and task.done():
+                    del memo[key]
+
+                raise
+    else:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            memo, key = _get_memo(self, method, args, kwargs)
+
+            if memo is None:
+                return method(self, *args, **kwargs)
+
+            value = memo.get(key, _missing)
+
+            if value is _missing:
+                value = memo[key] = method(self, *args, **kwargs)
+
+            return value
+
+    wrapper.memoized = True
+
+    return wrapper
+
+
+def clear_memoized(request):
+    """
+    Drops all the memoized results of the request. For example, after
+    the objects were changed.
+
+    Args:
+        request (HttpRequest): Request.
+    """
+    request.__dict__.pop(REQUEST_MEMO_ATTRIBUTE, None)
+
+
+class MemoizeMixin:
+    """
+    Memoizes methods, listed in `memoized_methods`, for the current
+    request. Inherited methods, like Django's `get_object`, are
+    memoized too, without overriding them.
+
+    Example:
+        >>> class View(MemoizeMixin, ActionsHolder, DetailView):
+        >>>     memoized_methods = ['get_object', 'get_queryset']
+        >>>
+        >>> class Edit(ActionViewMixin, UpdateView):
+        >>>     def get_object(self, queryset=None):
+        >>>         return self.parental.get_object()
+
+    Attributes:
+        memoized_methods (iterable): Method names.
+    """
+
+    memoized_methods = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for name in cls.memoized_methods:
+            method = getattr(cls, name, None)
+
+            if not inspect.isfunction(method):
+                raise ImproperlyConfigured(
+                    f'`{cls.__name__}.{name}` is not a method, that may be '
+                    'memoized.'
+                )
+
+            if not getattr(method, 'memoized', False):
+                setattr(cls, name, memoized(method))
@@ -0,0 +1,257 @@
+"""
+Keyset (cursor) pagination of list views.
+"""
+
+import json
+import base64
+import binascii
+
+from django.db.models import Q
+from django.http import Http404
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from ..reversers import get_reverser
+
+
+__all__ = ['CursorPage', 'CursorPaginationMixin']
+
+
+class CursorPage:
+    """
+    Page of the cursor pagination. Provides the same `has_next` and
+    `has_previous` methods, as Django's page does, so templates may
+    check them in the same way.
+
+    Attributes:
+        object_list (list): Page objects.
+        next_cursor (str): Cursor of the next page, or `None`.
+        previous_cursor (str): Cursor of the previous page, or `None`.
+        next_url (str): Url of the next page, or `None`.
+        previous_url (str): Url of the previous page, or `None`.
+    """
+
+    def __init__(
+        self, object_list: list, next_cursor: str=None,
+        previous_cursor: str=None, next_url: str=None,
+        previous_url: str=None
+    ):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.next_url = next_url
+        self.previous_url = previous_url
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginationMixin:
+    """
+    Paginates a list view by the keyset `(sort key, pk)`, instead of
+    the offset, so every page is fetched with the same
+    `WHERE (key, pk) > (...) LIMIT n` query, no matter how far it is.
+
+    Cursor is an opaque url safe string, that the view gets with the
+    `CURSOR_REGEX` url, and the first page is served by the url without
+    it. Page links are reversed by the name of the matched url, so
+    views work inside viewsets and actions holders.
+
+    Example:
+        >>> class Articles(ViewSet):
+        >>>     list_view_base = ArticleList
+        >>>     list_url_regex_list = ['', CURSOR_REGEX]
+        >>>
+        >>> class ArticleList(CursorPaginationMixin, UrlBuilderMixin,
+        >>>                   ClassConnectableClass, ListView):
+        >>>     model = Article
+        >>>     paginate_by = 50
+        >>>     cursor_ordering = '-created'
+
+    Attributes:
+        cursor_kwarg (str): Url kwarg with the cursor.
+        cursor_ordering (str): Model field to sort by, with the `-`
+            prefix for the descending order. Field must not be null,
+            and the pk is used to order the equal values.
+    """
+
+    cursor_kwarg = 'cursor'
+    cursor_ordering = 'pk'
+
+    def get_cursor_ordering(self) -> tuple:
+        """
+        Returns:
+            tuple: Sort key field name, and whether the order is
+                descending.
+        """
+        ordering = self.cursor_ordering
+
+        return ordering.lstrip('-'), ordering.startswith('-')
+
+    def encode_cursor(self, obj, previous: bool=False) -> str:
+        """
+        Args:
+            obj (Model): First or last object of the page.
+            previous (bool, optional): Cursor points to the previous
+                page.
+
+        Returns:
+            str: Cursor.
+        """
+        field, _ = self.get_cursor_ordering()
+        data = json.dumps(
+            [int(previous), getattr(obj, field), obj.pk],
+            cls=DjangoJSONEncoder, separators=(',', ':')
+        )
+
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor: str, model) -> tuple:
+        """
+        Args:
+            cursor (str): Cursor from the url.
+            model (type): Model of the paginated objects, that cursor
+                values are converted with.
+
+        Returns:
+            tuple: Whether the cursor points to the previous page,
+                sort key value, and pk.
+
+        Raises:
+            Http404: When cursor is invalid.
+        """
+        field, _ = self.get_cursor_ordering()
+        pk_field = model._meta.pk
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(
+                cursor + '=' * (-len(cursor) % 4)
+            ))
+            previous, value, pk = data
+            value = (
+                pk_field if field == 'pk' else model._meta.get_field(field)
+            ).to_python(value)
+            pk = pk_field.to_python(pk)
+        except (
+            binascii.Error, TypeError, ValueError, ValidationError,
+            FieldDoesNotExist
+        ):
+            raise Http404('Invalid cursor.')
+
+        if value is None or pk is None:
+            raise Http404('Invalid cursor.')
+
+        return bool(previous), value, pk
+
+    def get_cursor_filter(self, value, pk, descending: bool) -> Q:
+        """
+        Args:
+            value (object): Sort key value of the cursor.
+            pk (object): Pk of the cursor.
+            descending (bool): Objects are fetched in the descending
+                order.
+
+        Returns:
+            Q: Filter of the objects after the cursor.
+        """
+        field, _ = self.get_cursor_ordering()
+        lookup = 'lt' if descending else 'gt'
+
+        if field == 'pk':
+            return Q(**{f'pk__{lookup}': pk})
+
+        return Q(**{f'{field}__{lookup}': value}) | Q(**{
+            field: value, f'pk__{lookup}': pk
+        })
+
+    def get_cursor_url(self, cursor: str=None) -> str:
+        """
+        Args:
+            cursor (str, optional): Page cursor, or `None` for the
+                first page.
+
+        Returns:
+            str: Page url, reversed by the name of the current url.
+        """
+        match = getattr(self.request, 'resolver_match', None)
+        viewname = (
+            match.view_name if match is not None else self.get_url_name()
+        )
+        kwargs = {
+            key: value for key, value in self.kwargs.items()
+            if key != self.cursor_kwarg
+        }
+
+        if cursor is not None:
+            kwargs[self.cursor_kwarg] = cursor
+
+        return get_reverser(viewname)(*self.args, **kwargs)
+
+    def paginate_queryset(self, queryset, page_size: int) -> tuple:
+        """
+        Fetches a page of objects after the cursor, or before it, for
+        the previous page.
+
+        Args:
+            queryset (QuerySet): Objects.
+            page_size (int): Objects on a page.
+
+        Returns:
+            tuple: `None` instead of the paginator, `CursorPage`, page
+                objects, and whether there are other pages.
+        """
+        field, descending = self.get_cursor_ordering()
+        cursor = self.kwargs.get(self.cursor_kwarg)
+        previous = False
+
+        # Previous page is fetched in the reversed order.
+        if cursor is not None:
+            previous, value, pk = self.decode_cursor(
+                cursor, queryset.model
+            )
+            queryset = queryset.filter(
+                self.get_cursor_filter(value, pk, descending != previous)
+            )
+
+        order = '-' if descending != previous else ''
+        queryset = queryset.order_by(
+            *dict.fromkeys([f'{order}{field}', f'{order}pk'])
+        )
+        objects = list(queryset[:page_size + 1])
+        more = len(objects) > page_size
+        objects = objects[:page_size]
+
+        if previous:
+            objects.reverse()
+
+        has_next = more if not previous else cursor is not None
+        has_previous = cursor is not None if not previous else more
+        next_cursor = previous_cursor = None
+
+        if objects and has_next:
+            next_cursor = self.encode_cursor(objects[-1])
+
+        if objects and has_previous:
+            previous_cursor = self.encode_cursor(objects[0], previous=True)
+
+        page = CursorPage(
+            objects, next_cursor, previous_cursor,
+            next_url=next_cursor and self.get_cursor_url(next_cursor),
+            previous_url=(
+                previous_cursor and self.get_cursor_url(previous_cursor)
+            ),
+        )
+
+        return None, page, objects, page.has_other_pages()
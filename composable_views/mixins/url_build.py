@@ -9,10 +9,32 @@ Attributes:
     PK_REGEX (regex): Regex for views that receives elements by `pk`.
     SLUG_REGEX (regex): Regex for views that receives elements by `slug`.
     PK_SLUG_REGEX (regex): Combination of `PK_REGEX` and `SLUG_REGEX`.
+    PK_LIST_REGEX (regex): Regex for views that receive elements by a
+        comma separated list of `pks`.
+    CURSOR_REGEX (regex): Regex for views, that are paginated with an
+        opaque keyset `cursor`.
+    PAGED_ROUTE (route): Route with converters for `PAGED_REGEX`.
+    PK_ROUTE (route): Route with converters for `PK_REGEX`.
+    SLUG_ROUTE (route): Route with converters for `SLUG_REGEX`.
+    PK_SLUG_ROUTE (route): Route with converters for `PK_SLUG_REGEX`.
+    PK_LIST_ROUTE (route): Route with converters for `PK_LIST_REGEX`.
+    CURSOR_ROUTE (route): Route with converters for `CURSOR_REGEX`.
+    REGEX_ROUTES (dict): Default regexes translation into routes.
 """
 import re
-
-from ..utils import re_path
+from functools import lru_cache
+
+from django.core.exceptions import ImproperlyConfigured
+try:
+    from django.urls import register_converter
+except ImportError:
+    # Converters are available only since Django 2.0.
+    register_converter = None
+
+from ..utils import re_path, path, include, RegexPattern, RoutePattern
+from ..resolvers import (
+    REGEX_SPECIAL, literal_prefix, compile_urls, flatten_urls, LazyResolver
+)
 
 
 __all__ = (
@@ -20,6 +42,18 @@ __all__ = (
     'SLUG_REGEX',
     'PK_SLUG_REGEX',
     'PAGED_REGEX',
+    'PK_LIST_REGEX',
+    'CURSOR_REGEX',
+    'PK_ROUTE',
+    'SLUG_ROUTE',
+    'PK_SLUG_ROUTE',
+    'PAGED_ROUTE',
+    'PK_LIST_ROUTE',
+    'CURSOR_ROUTE',
+    'REGEX_ROUTES',
+
+    'PkListConverter',
+    'CursorConverter',
 
     'NamedClassMixin',
     'UrlBuilderMixin',
@@ -29,12 +63,95 @@ PK_REGEX = r'(?P<pk>[0-9]+)/'
 SLUG_REGEX = r'(?P<slug>[0-9a-zA-Z_-]+)/'
 PK_SLUG_REGEX = fr'{PK_REGEX}-{SLUG_REGEX}'
 PAGED_REGEX = r'page/(?P<page>[0-9]+)/'
+PK_LIST_REGEX = r'(?P<pks>[0-9]+(?:,[0-9]+)*)/'
+CURSOR_REGEX = r'cursor/(?P<cursor>[-a-zA-Z0-9_]+)/'
+
+PK_ROUTE = '<int:pk>/'
+SLUG_ROUTE = '<slug:slug>/'
+PK_SLUG_ROUTE = f'{PK_ROUTE}-{SLUG_ROUTE}'
+PAGED_ROUTE = 'page/<int:page>/'
+PK_LIST_ROUTE = '<pk_list:pks>/'
+CURSOR_ROUTE = 'cursor/<cursor:cursor>/'
+
+REGEX_ROUTES = {
+    '': '',
+    PK_REGEX: PK_ROUTE,
+    SLUG_REGEX: SLUG_ROUTE,
+    PK_SLUG_REGEX: PK_SLUG_ROUTE,
+    PAGED_REGEX: PAGED_ROUTE,
+    PK_LIST_REGEX: PK_LIST_ROUTE,
+    CURSOR_REGEX: CURSOR_ROUTE,
+}
+
+
+class PkListConverter:
+    """
+    Path converter for a comma separated list of integer pks.
+    """
+
+    regex = '[0-9]+(?:,[0-9]+)*'
+
+    def to_python(self, value: str) -> list:
+        return [int(x) for x in value.split(',')]
+
+    def to_url(self, value) -> str:
+        if isinstance(value, str):
+            return value
+
+        return ','.join(str(x) for x in value)
+
+
+class CursorConverter:
+    """
+    Path converter for an url safe base64 cursor without padding.
+    """
+
+    regex = '[-a-zA-Z0-9_]+'
+
+    def to_python(self, value: str) -> str:
+        return value
+
+    def to_url(self, value: str) -> str:
+        return value
+
+
+if register_converter is not None:
+    register_converter(PkListConverter, 'pk_list')
+    register_converter(CursorConverter, 'cursor')
+
+
+# Naming and url regex helpers are memoized by all their arguments, so
+# values are computed once for each class and any changed attribute
+# leads to a new value.
+
+@lru_cache(maxsize=None)
+def _dashed_name(class_name: str) -> str:
+    return '-'.join(
+        re.sub(r'(?P<cap>[A-Z])', r' \g<cap>', class_name).split()
+    ).lower()
+
+
+@lru_cache(maxsize=None)
+def _humanized_name(name: str) -> str:
+    return name.replace('-', ' ').replace('_', ' ').capitalize()
+
+
+@lru_cache(maxsize=None)
+def _url_regex(url_format: str, name: str, regex: str) -> str:
+    return re.sub(r'(/+)', '/', url_format.format(name=name, regex=regex))
+
+
+@lru_cache(maxsize=None)
+def _url_route(path_format: str, name: str, route: str) -> str:
+    return re.sub(r'(/+)', '/', path_format.format(name=name, route=route))
 
 
 class NamedClassMixin:
     """
     For classes that shoud have name and verbose name.
 
+    Generated names are memoized, so they may be used in a hot code.
+
     Attributes:
         name (str): Name of the class. May be used as a key for class
             identification.
@@ -52,14 +169,7 @@ class NamedClassMixin:
         Returns:
             str: class name
         """
-        name = cls.name
-
-        if not cls.name:
-            name = '-'.join(
-                re.sub(r'(?P<cap>[A-Z])', ' \g<cap>', cls.__name__).split()
-            ).lower()
-
-        return name
+        return cls.name or _dashed_name(cls.__name__)
 
     @classmethod
     def get_verbose_name(cls) -> str:
@@ -69,17 +179,7 @@ class NamedClassMixin:
         Returns:
             str: class name
         """
-        name = cls.verbose_name
-
-        if not cls.verbose_name:
-            name = (
-                cls.get_viewclass_name()
-                    .replace('-', ' ')
-                    .replace('_', ' ')
-                    .capitalize()
-            )
-
-        return name
+        return cls.verbose_name or _humanized_name(cls.get_viewclass_name())
 
 
 class UrlBuilderMixin(NamedClassMixin):
@@ -94,6 +194,23 @@ class UrlBuilderMixin(NamedClassMixin):
             `name` attribute, but can be customized.
         url_regex_list (list): List of regexes used to generate urls
             for the view.
+        url_compiled (bool): Classes that generate url trees (viewsets
+            and actions holders) will wrap their urls in a
+            `TrieResolver`.
+        url_flatten (bool): Classes that generate url trees will
+            collapse redundant resolver levels with `flatten_urls`.
+        url_lazy (bool): Classes that generate url trees will include
+            their urls with a `LazyResolver`, so urls are built on the
+            first use. System checks build them at startup.
+        url_mode (str): Url generation mode: `'regex'` for `re_path`
+            urls, or `'path'` for `path` urls with converters. By
+            default inherits it's value from the parent class, or
+            falls back to `'regex'`.
+        url_path_format (str): Route format for the `'path'` mode,
+            based on two variables: `name` and `route`.
+        url_regex_routes (dict): Regexes translation into routes for the
+            `'path'` mode. Regex, that has no translation, and is not a
+            plain route itself, produces a `re_path` url.
     """
 
     url_name = None
@@ -101,6 +218,12 @@ class UrlBuilderMixin(NamedClassMixin):
         r''
     ]
     url_format = r'^{name}/{regex}/$'
+    url_compiled = False
+    url_flatten = False
+    url_lazy = False
+    url_mode = None
+    url_path_format = '{name}/{route}/'
+    url_regex_routes = REGEX_ROUTES
 
     @classmethod
     def get_url_name(cls) -> str:
@@ -132,11 +255,133 @@ class UrlBuilderMixin(NamedClassMixin):
         if regex is None:
             regex = next(iter(cls.url_regex_list), None)
 
-        name = cls.get_url_name()
+        return _url_regex(cls.url_format, cls.get_url_name(), regex)
 
-        return re.sub(
-            r'(/+)', '/', cls.url_format.format(name=name, regex=regex)
-        )
+    @classmethod
+    def get_url_mode(cls) -> str:
+        """
+        Returns:
+            str: Url generation mode of the class, or of the closest
+                parent class, that has it.
+        """
+        if cls.url_mode is not None:
+            return cls.url_mode
+
+        parent_class = getattr(cls, 'parent_class', None)
+
+        if isinstance(parent_class, type) and issubclass(
+            parent_class, UrlBuilderMixin
+        ):
+            return parent_class.get_url_mode()
+
+        return 'regex'
+
+    @classmethod
+    def get_url_route(cls, regex: str=None) -> str:
+        """
+        Based on provided regex build an url route for the current
+        view.
+
+        Args:
+            regex (None, optional): If regex is none the first from
+                url_regex_list will be used.
+
+        Returns:
+            str: Resulting url route, or `None` if regex can't be
+                translated into a route.
+        """
+        if regex is None:
+            regex = next(iter(cls.url_regex_list), None)
+
+        route = cls.url_regex_routes.get(regex)
+
+        if route is None and REGEX_SPECIAL.isdisjoint(regex):
+            # Plain text and converter routes are the same in both modes.
+            route = regex
+
+        if route is None:
+            return None
+
+        return _url_route(cls.url_path_format, cls.get_url_name(), route)
+
+    @classmethod
+    def get_url(cls, regex: str, view):
+        """
+        Creates an url definition for the regex in the current url
+        generation mode.
+
+        Args:
+            regex (str): Regex from the `url_regex_list`.
+            view (callable): View function.
+
+        Raises:
+            ImproperlyConfigured: When `'path'` mode is used with an
+                old Django version.
+
+        Returns:
+            url: Url definition.
+        """
+        if cls.get_url_mode() == 'path':
+            if path is None:
+                raise ImproperlyConfigured(
+                    'Url `path` mode requires Django 2.0 or newer.'
+                )
+
+            route = cls.get_url_route(regex)
+
+            if route is not None:
+                return path(route, view, name=cls.get_url_name())
+
+        return re_path(cls.get_url_regex(regex), view, name=cls.get_url_name())
+
+    @classmethod
+    def get_url_prefix(cls, regex: str):
+        """
+        Prefix to nest other urls under the view url for the regex,
+        the same as `path_prefix` gives for the url itself.
+
+        Args:
+            regex (str): Regex from the `url_regex_list`.
+
+        Returns:
+            str | RoutePattern: Url regex without anchors, or a route
+                pattern in the `'path'` mode.
+        """
+        if cls.get_url_mode() == 'path' and path is not None:
+            route = cls.get_url_route(regex)
+
+            if route is not None:
+                return RoutePattern(route)
+
+        return cls.get_url_regex(regex).lstrip('^').rstrip('$')
+
+    @classmethod
+    def get_url_prefixes(cls, regex_list: list=None) -> set:
+        """
+        Finds literal prefixes of the urls without building them.
+
+        Args:
+            regex_list (list, optional): List of regexes, that will be
+                used instead of the default ones, described in class.
+
+        Returns:
+            set: Literal prefixes of the urls.
+        """
+        if regex_list is None:
+            regex_list = cls.url_regex_list
+
+        path_mode = cls.get_url_mode() == 'path'
+        prefixes = set()
+
+        for regex in regex_list:
+            route = cls.get_url_route(regex) if path_mode else None
+            pattern = (
+                RegexPattern(cls.get_url_regex(regex)) if route is None
+                else RoutePattern(route)
+            )
+            prefixes.add(literal_prefix(pattern)[0])
+
+        return prefixes
 
     @classmethod
     def as_urls(cls, regex_list: list=None, **kwargs):
@@ -157,10 +402,55 @@ class UrlBuilderMixin(NamedClassMixin):
             regex_list = cls.url_regex_list
 
         return (
-            re_path(
-                cls.get_url_regex(regex),
-                cls.as_view(**kwargs),
-                name=cls.get_url_name()
-            )
+            cls.get_url(regex, cls.as_view(**kwargs))
             for regex in regex_list
         )
+
+    @classmethod
+    def include_urls(
+        cls, build, namespace: str=None, prefixes: set=None
+    ) -> list:
+        """
+        Includes urls under an empty prefix. Urls are built right away,
+        or on the first use for the lazy classes.
+
+        Args:
+            build (callable): Function, that returns urls.
+            namespace (str, optional): Urls namespace.
+            prefixes (set, optional): Literal prefixes of the urls. By
+                default prefixes of the class urls are used.
+
+        Returns:
+            list: List with a single url definition.
+        """
+        if cls.url_lazy:
+            if prefixes is None:
+                prefixes = cls.get_url_prefixes()
+
+            return [LazyResolver(
+                RegexPattern(r'^'), build, prefixes, namespace, namespace
+            )]
+
+        return [re_path(r'^', include((build(), namespace)))]
+
+    @classmethod
+    def finalize_urls(cls, urls) -> list:
+        """
+        Applies url tree options of the class to the generated urls.
+        Used by the classes, that generate url trees.
+
+        Args:
+            urls (iterable): Generated url definitions.
+
+        Returns:
+            list: Final url definitions.
+        """
+        urls = list(urls)
+
+        if cls.url_flatten:
+            urls = flatten_urls(urls)
+
+        if cls.url_compiled:
+            urls = compile_urls(urls)
+
+        return urls
@@ -1,20 +1,29 @@
+import threading
+from collections.abc import Mapping
 from typing import Generator
-from functools import reduce
+from functools import reduce, partial
+from weakref import WeakKeyDictionary
 
 from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
 
 from ..utils import (
-    re_path, include,
     ClassConnectable, ClassConnector, ClassConnectorBase, ClassConnectableClass
 )
+from ..reversers import join_names, get_reverser
 from .url_build import UrlBuilderMixin
+from .conditional import CONDITIONAL_ATTRIBUTES, ConditionalMixin
+from .cache import CACHE_ATTRIBUTES, ResponseCacheMixin
 
 
 __all__ = [
-    'postfixed_items', 'collect_attributes',
-    'ViewSetBase', 'ViewSet',
+    'postfixed_items', 'attribute_names', 'group_attributes',
+    'collect_attributes', 'DeferredView', 'DeferredViews', 'ViewSetBase',
+    'ViewSet',
 ]
 
+_attribute_names = WeakKeyDictionary()
+
 
 def postfixed_items(lst: list, postfix: str) -> Generator[str, None, None]:
     """
@@ -34,11 +43,69 @@ def postfixed_items(lst: list, postfix: str) -> Generator[str, None, None]:
     )
 
 
+def attribute_names(Class: type) -> frozenset:
+    """
+    Returns names of all attributes, that are available in the class.
+    Names are computed once for each class.
+
+    Args:
+        Class (type): Class to look for available properties.
+
+    Returns:
+        frozenset: Attribute names, the same as `hasattr` checks.
+    """
+    names = _attribute_names.get(Class)
+
+    if names is None:
+        names = _attribute_names[Class] = frozenset(
+            name
+            for klass in (*Class.__mro__, *type(Class).__mro__)
+            for name in vars(klass)
+        )
+
+    return names
+
+
+def group_attributes(attrs: dict, prefixes, exclude=()) -> dict:
+    """
+    Splits attributes by prefixes in a single pass. Prefix is removed
+    with the delimiter from the attribute name.
+
+    Args:
+        attrs (dict): Attributes - value dict.
+        prefixes (iterable): Properties prefixes.
+        exclude (iterable, optional): Attributes to skip.
+
+    Returns:
+        dict: Attribute - value dicts by prefixes.
+    """
+    exclude = set(exclude)
+    groups = {prefix: {} for prefix in prefixes}
+    lengths = sorted({len(prefix) for prefix in groups})
+
+    for key, value in attrs.items():
+        if key in exclude:
+            continue
+
+        for length in lengths:
+            if length >= len(key):
+                break
+
+            group = groups.get(key[:length])
+
+            if group is not None:
+                # +1 - because prefix has a delimiter `_`.
+                group[key[length + 1:]] = value
+
+    return groups
+
+
 def collect_attributes(
     Class: type,
     prefix: str,
     attrs: dict,
-    shared: list=[]
+    shared: list=[],
+    group: dict=None
 ) -> dict:
     """
     Collects all attributes from `attrs` parameter that:
@@ -51,32 +118,110 @@ def collect_attributes(
         attrs (dict): Attributes - value dict.
         shared (list, optional): Dhared attributes that have both in
             the Class and in the attrs keys without prefixes.
+        group (dict, optional): Already grouped by `group_attributes`
+            attributes for the prefix.
     """
+    names = attribute_names(Class)
     shared = set(shared)
 
+    if group is None:
+        group = group_attributes(attrs, [prefix], shared)[prefix]
+
     attributes = {
-        attr: value
-        for attr, key, value in (
-            # Getting an attribute in resulted class.
-            # +1 - because prefix has a delimiter `_`.
-            (key if key in shared else key[len(prefix) + 1:], key, value)
-            for key, value in sorted(
-                attrs.items(),
-                key=lambda x: x[0] not in shared
-            )
-        )
-        if (
-            (key.startswith(prefix) and hasattr(Class, attr))
-            or
-            (key in shared and hasattr(Class, key))
-        )
+        key: value
+        for key, value in attrs.items()
+        if key in shared and key in names
     }
-
+    attributes.update(
+        (attr, value) for attr, value in group.items() if attr in names
+    )
     attributes['parent_class'] = None
 
     return attributes
 
 
+class DeferredView:
+    """
+    Viewset attribute, that resolves a view, given with a dotted import
+    path, on the first access.
+
+    Attributes:
+        resolve (callable): Returns a view class for the viewset, that
+            holds the attribute.
+        owner (type): Viewset, that holds the attribute.
+        view (type): Resolved view class, or `None` until the first
+            access.
+    """
+
+    def __init__(self, resolve):
+        self.resolve = resolve
+        self.owner = None
+        self.view = None
+        self.lock = threading.Lock()
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+
+    @property
+    def resolved(self) -> bool:
+        return self.view is not None
+
+    def __get__(self, instance, owner=None):
+        if self.view is None:
+            with self.lock:
+                if self.view is None:
+                    view = self.resolve()
+                    view.set_parent_class(self.owner)
+                    self.view = view
+
+        return self.view
+
+
+class DeferredViews(Mapping):
+    """
+    Views of the viewset by their properties prefixes. Deferred views
+    are resolved only when they are accessed.
+
+    Attributes:
+        owner (type): Viewset.
+        names (tuple): Views properties prefixes.
+        postfix (str): View class attribute postfix.
+    """
+
+    def __init__(self, owner, names, postfix: str):
+        self.owner = owner
+        self.names = tuple(names)
+        self.postfix = postfix
+
+    def deferred(self, name: str):
+        """
+        Args:
+            name (str): View properties prefix.
+
+        Returns:
+            DeferredView: Unresolved view attribute, or `None` if the
+                view is resolved already or is not deferred.
+        """
+        value = vars(self.owner).get(name + self.postfix)
+
+        if isinstance(value, DeferredView) and not value.resolved:
+            return value
+
+        return None
+
+    def __getitem__(self, name: str):
+        if name not in self.names:
+            raise KeyError(name)
+
+        return getattr(self.owner, name + self.postfix)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
 class ViewSetBase(ClassConnectorBase):
     """
     Metaclass for view set generation.
@@ -93,27 +238,86 @@ class ViewSetBase(ClassConnectorBase):
         keys = attrs.keys()
         views = set(postfixed_items(keys, cls.view_postfix))
         view_bases = set(postfixed_items(keys, cls.base_postfix)) - views
+        groups = group_attributes(
+            attrs, view_bases, attrs.get('shared_properties', [])
+        )
+        deferred = False
 
         # Creating a new views based on base classes that viewset has.
+        # Views, given with dotted import paths, are created on the
+        # first access.
         for base in view_bases:
-            view = cls.create_view(base, attrs)
-            cls.check_view(view)
+            if isinstance(attrs[base + cls.base_postfix], str):
+                view = DeferredView(partial(
+                    cls.resolve_view, base, dict(attrs), groups[base]
+                ))
+                deferred = True
+            else:
+                view = cls.create_view(base, attrs, groups[base])
+                cls.check_view(view)
+
             attrs[base + cls.view_postfix] = view
             attrs.pop(base + cls.base_postfix)
 
         # Checking view classes
         for view in views:
-            cls.check_view(attrs[view + cls.view_postfix])
+            key = view + cls.view_postfix
+
+            if isinstance(attrs[key], str):
+                attrs[key] = DeferredView(
+                    partial(cls.resolve_view, view, {key: attrs[key]})
+                )
+                deferred = True
+            else:
+                cls.check_view(attrs[key])
+
+        if not deferred:
+            attrs['views'] = {
+                view: attrs[view + cls.view_postfix]
+                for view in views | view_bases
+            }
+
+        new = super(ViewSetBase, cls).__new__(cls, name, bases, attrs)
+
+        if deferred:
+            new.views = DeferredViews(
+                new, views | view_bases, cls.view_postfix
+            )
 
-        attrs['views'] = {
-            view: attrs[view + cls.view_postfix]
-            for view in views | view_bases
-        }
+        return new
 
-        return super(ViewSetBase, cls).__new__(cls, name, bases, attrs)
+    @classmethod
+    def resolve_view(cls, name: str, attrs: dict, group: dict=None):
+        """
+        Imports a deferred view, and creates it from the base class if
+        it is needed.
+
+        Args:
+            name (str): View properties prefix.
+            attrs (dict): Attributes of the viewset, with the dotted
+                import path of the view base, or of the view class.
+            group (dict, optional): Viewset attributes with the view
+                prefix, grouped by `group_attributes`.
+
+        Returns:
+            type: View class.
+        """
+        key = name + cls.view_postfix
+
+        if key in attrs:
+            view = import_string(attrs[key])
+        else:
+            key = name + cls.base_postfix
+            view = cls.create_view(
+                name, {**attrs, key: import_string(attrs[key])}, group
+            )
+
+        cls.check_view(view)
+
+        return view
 
     @classmethod
-    def create_view(cls, base, attrs):
+    def create_view(cls, base, attrs, group=None):
         """
         Creates a new view from the base class.
 
@@ -122,24 +326,44 @@ class ViewSetBase(ClassConnectorBase):
                 based on.
             attrs (dict): All attributes of the viewset that will be
                 created.
+            group (dict, optional): Viewset attributes with the view
+                prefix, grouped by `group_attributes`.
 
         Returns:
             type: Newly created View class from provided Base class.
+                It gets the `ConditionalMixin`, when the viewset has
+                the `{base}_etag` or `{base}_last_modified` attribute,
+                and the `ResponseCacheMixin` for `{base}_cache_*` ones.
         """
         ViewBase = attrs[base + cls.base_postfix]
+        shared = attrs.get('shared_properties', [])
+
+        if group is None:
+            group = group_attributes(attrs, [base], shared)[base]
+
+        optional = [
+            (mixin, names.intersection(group))
+            for names, mixin in (
+                (CONDITIONAL_ATTRIBUTES, ConditionalMixin),
+                (CACHE_ATTRIBUTES, ResponseCacheMixin),
+            )
+        ]
         bases = (
-            x for x in (ClassConnectableClass, UrlBuilderMixin)
+            x for x in (
+                ClassConnectableClass, UrlBuilderMixin,
+                *(mixin for mixin, names in optional if names)
+            )
             if not issubclass(ViewBase, x)
         )
-
-        return type(
-            ViewBase.__name__,
-            (*bases, ViewBase),
-            collect_attributes(
-                ViewBase, base, attrs, attrs.get('shared_properties', [])
-            )
+        attributes = collect_attributes(ViewBase, base, attrs, shared, group)
+        # Attributes of the optional mixins are passed even if the base
+        # doesn't have them, as the mixins are added.
+        attributes.update(
+            (name, group[name]) for _, names in optional for name in names
         )
 
+        return type(ViewBase.__name__, (*bases, ViewBase), attributes)
+
     @classmethod
     def check_view(cls, view):
         """
@@ -190,6 +414,12 @@ class ViewSet(UrlBuilderMixin, ClassConnector, metaclass=ViewSetBase):
     injected from viewset to newly created view class during a view
     creation process.
 
+    Both attributes also take dotted import paths. Such views are
+    imported and created only when they are accessed first, for
+    example, when viewset urls are built. With `url_lazy` urls are
+    built on the first request, that reaches viewset urls, so it's
+    better to include them under a literal prefix.
+
     Attributes:
         shared_properties (list): List of properties that will be
             injected into all bases that viewset have.
@@ -197,12 +427,51 @@ class ViewSet(UrlBuilderMixin, ClassConnector, metaclass=ViewSetBase):
 
     shared_properties = []
 
+    @classmethod
+    def get_url_reverser(cls, view: str, namespace: str=None):
+        """
+        Returns a reverser for the view urls.
+
+        Args:
+            view (str): View properties prefix.
+            namespace (str, optional): Namespace, that viewset urls are
+                included with.
+
+        Returns:
+            UrlReverser: Url reverser.
+        """
+        return get_reverser(join_names(
+            namespace, cls.get_viewclass_name(),
+            cls.views[view].get_url_name()
+        ))
+
+    @classmethod
+    def get_url_prefixes(cls, regex_list=None) -> set:
+        views = cls.views
+
+        # Prefixes of deferred views are unknown until they are
+        # imported, so urls are not gated by them.
+        if isinstance(views, DeferredViews) and any(
+            views.deferred(name) for name in views
+        ):
+            return {''}
+
+        return set().union(*(
+            view.get_url_prefixes() for view in views.values()
+        ))
+
+    @classmethod
+    def build_urls(cls) -> list:
+        """
+        Returns:
+            list: Urls of all the views.
+        """
+        return reduce(
+            lambda acc, x: acc + list(x.as_urls()), cls.views.values(), []
+        )
+
     @classmethod
     def as_urls(cls, regex_list=None):
-        return [re_path(r'^', include((
-            reduce(
-                lambda acc, x: acc + list(x.as_urls()),
-                cls.views.values(),
-                []
-            ), cls.get_viewclass_name() or None
-        )))]
+        return cls.finalize_urls(cls.include_urls(
+            cls.build_urls, cls.get_viewclass_name() or None
+        ))
@@ -0,0 +1,833 @@
+"""
+Url resolvers, that speed up resolving of the generated url trees.
+
+Resolvers work only with Django 2.0 or newer.
+"""
+
+import os
+import re
+import threading
+from functools import lru_cache
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.datastructures import MultiValueDict
+from django.utils.functional import cached_property
+from django.utils.regex_helper import normalize
+from django.utils.translation import get_language
+try:
+    from django.urls import Resolver404
+except ImportError:
+    from django.core.urlresolvers import Resolver404
+
+from .utils import URLPattern, URLResolver, RegexPattern, RoutePattern
+
+
+__all__ = [
+    'literal_prefix',
+    'TrieResolver',
+    'compile_urls',
+    'flatten_urls',
+    'SharedPrefixResolver',
+    'share_urls',
+    'LazyResolver',
+]
+
+REGEX_SPECIAL = set('.^$*+?{}[]|()\\')
+REGEX_QUANTIFIERS = set('*+?{')
+REGEX_NAMED_GROUP = re.compile(r'(?<!\\)\(\?P<\w+>')
+REGEX_BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+RESOLVER_STATE = (
+    '_reverse_dict', '_namespace_dict', '_app_dict', '_callback_strs',
+    '_populated',
+)
+
+
+def _check_resolvers():
+    if URLResolver is None:
+        raise ImproperlyConfigured(
+            'Url resolvers require Django 2.0 or newer.'
+        )
+
+
+def _has_alternation(regex: str) -> bool:
+    depth = 0
+    in_class = False
+    escaped = False
+
+    for char in regex:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+
+    return False
+
+
+def _regex_literals(regex: str):
+    # Yields literal characters from the start of the anchored regex,
+    # with the regex index after each of them.
+    index = 1
+    length = len(regex)
+
+    while index < length:
+        char = regex[index]
+        step = 1
+
+        if char == '\\':
+            if index + 1 >= length or regex[index + 1].isalnum():
+                break
+
+            char = regex[index + 1]
+            step = 2
+        elif char in REGEX_SPECIAL:
+            break
+
+        quantified = (
+            index + step < length and regex[index + step] in REGEX_QUANTIFIERS
+        )
+
+        if quantified:
+            # Quantified character is not a literal one.
+            break
+
+        index += step
+
+        yield char, index
+
+
+def _regex_literal_prefix(regex: str) -> tuple:
+    # Unanchored regex may match anywhere in the path.
+    if not regex.startswith('^') or _has_alternation(regex):
+        return '', False
+
+    literal = []
+    index = 1
+
+    for char, index in _regex_literals(regex):
+        literal.append(char)
+
+    rest = regex[index:]
+
+    return ''.join(literal), rest in ('', '$', r'\Z')
+
+
+def literal_prefix(pattern) -> tuple:
+    """
+    Finds a literal prefix of the url pattern.
+
+    Args:
+        pattern (RegexPattern | RoutePattern): Url pattern object.
+
+    Returns:
+        tuple: Literal prefix string and a flag, whether the whole
+            pattern is literal. Unknown patterns have no literal prefix.
+    """
+    if RoutePattern is not None and isinstance(pattern, RoutePattern):
+        route = str(pattern)
+        prefix = route.split('<', 1)[0]
+
+        return prefix, prefix == route
+
+    if RegexPattern is not None and isinstance(pattern, RegexPattern):
+        return _regex_literal_prefix(str(pattern))
+
+    return '', False
+
+
+class TrieNode:
+    """
+    Prefix trie node.
+
+    Attributes:
+        children (dict): Child nodes by characters.
+        leaves (list): Url leaves, whose literal prefix ends here.
+        candidates (tuple): All the leaves, that are possible for the
+            path, that reaches this node.
+        resolver (URLResolver): Pruned url tree with candidates only.
+    """
+
+    def __init__(self, candidates: tuple=()):
+        self.children = {}
+        self.leaves = []
+        self.candidates = candidates
+        self.resolver = None
+
+
+class TrieResolver(URLResolver or object):
+    """
+    Url resolver, that compiles the whole url tree into a prefix trie
+    keyed on the literal parts of the patterns.
+
+    Path is looked up in the trie first, to find url patterns it may
+    match, and only then those patterns are matched the usual Django
+    way. So regexes run only for the patterns with the same literal
+    prefix. Reversing works with the full url tree, so it's the same
+    as for the nested includes.
+
+    Trie is built on the first resolve. Plain resolvers are looked
+    into, and any other resolver (another compiled one, for example)
+    is matched as a single leaf.
+    """
+
+    def get_leaves(self) -> list:
+        """
+        Collects all leaves of the url tree.
+
+        Returns:
+            list: Pairs of leaf index paths in the tree and their
+                literal prefixes.
+        """
+        leaves = []
+
+        def walk(patterns, path, prefix, complete):
+            for index, pattern in enumerate(patterns):
+                literal, literal_complete = literal_prefix(pattern.pattern)
+                current = prefix + literal if complete else prefix
+
+                if type(pattern) is URLResolver:
+                    walk(
+                        pattern.url_patterns, path + (index, ), current,
+                        complete and literal_complete
+                    )
+                else:
+                    leaves.append((path + (index, ), current))
+
+        walk(self.url_patterns, (), '', True)
+
+        return leaves
+
+    @cached_property
+    def trie(self) -> TrieNode:
+        """
+        Returns:
+            TrieNode: Root node of the url tree prefix trie.
+        """
+        root = TrieNode()
+
+        for leaf, prefix in self.get_leaves():
+            node = root
+
+            for char in prefix:
+                node = node.children.setdefault(char, TrieNode())
+
+            node.leaves.append(leaf)
+
+        nodes = [(root, ())]
+
+        while nodes:
+            node, candidates = nodes.pop()
+            node.candidates = tuple(sorted(candidates + tuple(node.leaves)))
+            nodes.extend((x, node.candidates) for x in node.children.values())
+
+        return root
+
+    def prune(self, patterns: list, leaves: tuple, depth: int=0) -> list:
+        """
+        Creates a copy of the url tree only with the provided leaves.
+
+        Args:
+            patterns (list): Url patterns.
+            leaves (tuple): Leaf index paths to keep.
+            depth (int, optional): Current depth in the tree.
+
+        Returns:
+            list: Pruned url patterns.
+        """
+        pruned = []
+
+        for index, pattern in enumerate(patterns):
+            selected = tuple(x for x in leaves if x[depth] == index)
+
+            if not selected:
+                continue
+
+            if len(selected[0]) == depth + 1:
+                pruned.append(pattern)
+            else:
+                pruned.append(URLResolver(
+                    pattern.pattern,
+                    self.prune(pattern.url_patterns, selected, depth + 1),
+                    pattern.default_kwargs,
+                    pattern.app_name,
+                    pattern.namespace,
+                ))
+
+        return pruned
+
+    def get_node(self, path: str) -> TrieNode:
+        """
+        Finds the deepest trie node for the path.
+
+        Args:
+            path (str): Path to resolve.
+
+        Returns:
+            TrieNode: Trie node.
+        """
+        node = self.trie
+
+        for char in path:
+            child = node.children.get(char)
+
+            if child is None:
+                break
+
+            node = child
+
+        return node
+
+    def get_node_resolver(self, node: TrieNode) -> URLResolver:
+        """
+        Args:
+            node (TrieNode): Trie node.
+
+        Returns:
+            URLResolver: Resolver for the pruned url tree with node
+                candidates.
+        """
+        if node.resolver is None:
+            node.resolver = URLResolver(
+                self.pattern,
+                self.prune(self.url_patterns, node.candidates),
+                self.default_kwargs,
+                self.app_name,
+                self.namespace,
+            )
+
+        return node.resolver
+
+    def resolve(self, path):
+        path = str(path)
+        match = self.pattern.match(path)
+
+        if not match:
+            return super().resolve(path)
+
+        node = self.get_node(match[0])
+
+        return self.get_node_resolver(node).resolve(path)
+
+
+def compile_urls(urls) -> list:
+    """
+    Wraps urls in a `TrieResolver`.
+
+    Args:
+        urls (iterable): Url patterns.
+
+    Returns:
+        list: List with a single compiled resolver.
+    """
+    _check_resolvers()
+
+    return [TrieResolver(RegexPattern(r'^'), list(urls))]
+
+
+def _is_plain(url) -> bool:
+    return (
+        type(url) is URLResolver and
+        not url.namespace and
+        not url.default_kwargs
+    )
+
+
+def _is_empty(pattern) -> bool:
+    return literal_prefix(pattern) == ('', True)
+
+
+def _is_static(pattern) -> bool:
+    # Translated patterns depend on the active language.
+    if type(pattern) is RoutePattern:
+        return isinstance(pattern._route, str)
+
+    return type(pattern) is RegexPattern and isinstance(pattern._regex, str)
+
+
+def _has_positional(pattern) -> bool:
+    return pattern.regex.groups > len(pattern.regex.groupindex)
+
+
+def _escape_literal(literal: str) -> str:
+    return ''.join('\\' + x if x in REGEX_SPECIAL else x for x in literal)
+
+
+def _with_pattern(url, pattern):
+    if type(url) is URLPattern:
+        return URLPattern(pattern, url.callback, url.default_args, url.name)
+
+    if type(url) is SharedPrefixResolver:
+        return SharedPrefixResolver(
+            pattern, url.prefixes, url.url_patterns, url.default_kwargs
+        )
+
+    return URLResolver(
+        pattern, url.url_patterns, url.default_kwargs, url.app_name,
+        url.namespace,
+    )
+
+
+def _join_pattern(prefix, pattern):
+    if type(pattern) is not type(prefix):
+        return None
+
+    if type(prefix) is RoutePattern:
+        return RoutePattern(
+            str(prefix) + str(pattern), name=pattern.name, is_endpoint=True
+        )
+
+    prefix_regex, regex = str(prefix), str(pattern)
+
+    # Positional arguments are passed differently by the nested resolvers,
+    # and unanchored patterns match differently, so those are not joined.
+    if (
+        prefix_regex.endswith('$') or not regex.startswith('^') or
+        _has_positional(prefix) or _has_positional(pattern)
+    ):
+        return None
+
+    return RegexPattern(
+        prefix_regex + regex[1:], name=pattern.name, is_endpoint=True
+    )
+
+
+def _join_url(prefix, url):
+    if (
+        type(url) is not URLPattern or
+        not _is_static(prefix) or not _is_static(url.pattern)
+    ):
+        return None
+
+    pattern = _join_pattern(prefix, url.pattern)
+
+    return None if pattern is None else _with_pattern(url, pattern)
+
+
+def _extend_pattern(pattern, literal: str):
+    if type(pattern) is RoutePattern:
+        if '<' in literal or '>' in literal:
+            return None
+
+        return RoutePattern(str(pattern) + literal, name=pattern.name)
+
+    regex = str(pattern)
+
+    if regex.endswith('$') or _has_alternation(regex):
+        return None
+
+    return RegexPattern(regex + _escape_literal(literal), name=pattern.name)
+
+
+def _strip_pattern(pattern, length: int):
+    if type(pattern) is RoutePattern:
+        return RoutePattern(
+            str(pattern)[length:], name=pattern.name,
+            is_endpoint=pattern._is_endpoint
+        )
+
+    regex = str(pattern)
+    literals = _regex_literals(regex)
+
+    for _ in range(length):
+        _, index = next(literals)
+
+    return RegexPattern(
+        '^' + regex[index:], name=pattern.name,
+        is_endpoint=pattern._is_endpoint
+    )
+
+
+def _hoist_literal(url):
+    # Common literal prefix of the resolver urls is moved into the
+    # resolver pattern, so not matching resolver is skipped by a single
+    # regex.
+    children = url.url_patterns
+
+    if not children or not _is_static(url.pattern):
+        return url
+
+    literals = []
+
+    for child in children:
+        if (
+            type(child) not in (
+                URLPattern, URLResolver, SharedPrefixResolver
+            ) or
+            not _is_static(child.pattern)
+        ):
+            return url
+
+        literals.append(literal_prefix(child.pattern)[0])
+
+    literal = os.path.commonprefix(literals)
+    pattern = _extend_pattern(url.pattern, literal) if literal else None
+
+    if pattern is None:
+        return url
+
+    return URLResolver(
+        pattern,
+        [
+            _with_pattern(x, _strip_pattern(x.pattern, len(literal)))
+            for x in children
+        ],
+        url.default_kwargs, url.app_name, url.namespace,
+    )
+
+
+def flatten_urls(urls) -> list:
+    """
+    Collapses redundant resolver levels of the url tree, keeping the
+    same url names and namespaces.
+
+    * Resolvers with an empty prefix and without a namespace are
+        replaced with their urls.
+    * Resolvers without a namespace, that have only the urls in them,
+        are replaced with urls, whose patterns are joined with the
+        resolver prefix.
+    * Namespaced resolvers with an empty prefix, that have a single
+        resolver without a namespace in them, are merged with it.
+    * Literal prefix, that is common for all the resolver urls, is
+        moved into the resolver pattern. So namespaced resolvers with
+        an empty prefix are skipped by a single regex too.
+
+    Translated patterns and custom resolver classes are left as they
+    are. Urls of the `LazyResolver` are flattened, when they are built.
+
+    Args:
+        urls (iterable): Url patterns.
+
+    Returns:
+        list: Flattened url patterns.
+    """
+    _check_resolvers()
+
+    flat = []
+
+    for url in urls:
+        if type(url) is LazyResolver:
+            flat.append(LazyResolver(
+                url.pattern, lambda url=url: flatten_urls(url.build()),
+                url.prefixes, url.app_name, url.namespace,
+            ))
+            continue
+
+        if type(url) is not URLResolver:
+            flat.append(url)
+            continue
+
+        children = flatten_urls(url.url_patterns)
+        pattern = url.pattern
+
+        if _is_plain(url):
+            if _is_empty(pattern):
+                flat.extend(children)
+                continue
+
+            joined = [_join_url(pattern, x) for x in children]
+
+            if all(joined):
+                flat.extend(joined)
+                continue
+        elif (
+            not url.default_kwargs and _is_empty(pattern) and
+            len(children) == 1 and _is_plain(children[0])
+        ):
+            pattern, children = children[0].pattern, children[0].url_patterns
+
+        flat.append(_hoist_literal(URLResolver(
+            pattern, children, url.default_kwargs, url.app_name,
+            url.namespace,
+        )))
+
+    return flat
+
+
+class SharedPrefixResolver(URLResolver or object):
+    """
+    Url resolver, that nests the same urls under several prefixes, but
+    keeps and searches them once.
+
+    Path is matched against all the prefixes with a single combined
+    regex, to find the first prefix that may match it, and only then
+    urls are resolved the usual Django way. If urls do not match, the
+    next matching prefix is tried, so resolving works the same as for
+    a separate include for each prefix. Reverse entries are created
+    for each prefix, as if there were separate includes.
+
+    Resolver pattern should be a literal one, that captures no
+    arguments, and resolver can not be namespaced, because Django
+    reverses namespaced urls with the plain resolvers.
+
+    Attributes:
+        prefixes (list): Prefix patterns, that are matched after the
+            resolver pattern.
+    """
+
+    def __init__(self, pattern, prefixes, urlconf_name, default_kwargs=None):
+        super().__init__(pattern, urlconf_name, default_kwargs)
+
+        self.prefixes = list(prefixes)
+        self.resolvers = {}
+
+    @cached_property
+    def prefixes_regex(self):
+        """
+        Returns:
+            Pattern: Combined regex of all the prefixes, where the first
+                matching prefix is found by the group name, or `None`
+                if prefixes can't be combined.
+        """
+        groups = []
+
+        for index, pattern in enumerate(self.prefixes):
+            regex = pattern.regex.pattern
+
+            if not regex.startswith('^') or REGEX_BACKREFERENCE.search(regex):
+                return None
+
+            groups.append(
+                f'(?P<_{index}>{REGEX_NAMED_GROUP.sub("(?:", regex[1:])})'
+            )
+
+        try:
+            return re.compile('^(?:' + '|'.join(groups) + ')')
+        except re.error:
+            return None
+
+    def get_candidates(self, path: str):
+        """
+        Args:
+            path (str): Path after the resolver pattern.
+
+        Returns:
+            iterable: Indexes of the prefixes, that may match the path.
+        """
+        regex = self.prefixes_regex
+
+        if regex is None:
+            return range(len(self.prefixes))
+
+        match = regex.match(path)
+
+        if match is None or match.lastgroup is None:
+            return ()
+
+        return range(int(match.lastgroup[1:]), len(self.prefixes))
+
+    def get_prefix_resolver(self, index: int) -> URLResolver:
+        """
+        Args:
+            index (int): Prefix index.
+
+        Returns:
+            URLResolver: Resolver, that nests urls under the prefix.
+        """
+        resolver = self.resolvers.get(index)
+
+        if resolver is None:
+            resolver = self.resolvers[index] = URLResolver(
+                RegexPattern(r'^'),
+                [URLResolver(self.prefixes[index], self.url_patterns)],
+                self.default_kwargs,
+            )
+
+        return resolver
+
+    def resolve(self, path):
+        path = str(path)
+        match = self.pattern.match(path)
+
+        if not match:
+            raise Resolver404({'path': path})
+
+        new_path, tried = match[0], []
+
+        for index in self.get_candidates(new_path):
+            try:
+                return self.get_prefix_resolver(index).resolve(new_path)
+            except Resolver404 as e:
+                tried.extend(e.args[0].get('tried', []))
+
+        raise Resolver404({'tried': tried, 'path': new_path})
+
+    def _populate(self):
+        base = URLResolver(RegexPattern(r'^'), self.url_patterns)
+        lookups = MultiValueDict()
+        namespaces = {}
+        language_code = get_language()
+
+        # Prefixes are reversed, the same way Django does for the
+        # separate includes.
+        for pattern in reversed(self.prefixes):
+            prefix = pattern.regex.pattern[1:]
+
+            for name in base.reverse_dict:
+                for matches, pat, defaults, converters in (
+                    base.reverse_dict.getlist(name)
+                ):
+                    lookups.appendlist(name, (
+                        normalize(prefix + pat), prefix + pat, defaults,
+                        {**pattern.converters, **converters},
+                    ))
+
+            for namespace, (ns_prefix, resolver) in (
+                base.namespace_dict.items()
+            ):
+                namespaces[namespace] = (prefix + ns_prefix, resolver)
+
+        for _, resolver in namespaces.values():
+            resolver.pattern.converters.update(self.prefixes[0].converters)
+
+        self._callback_strs.update(base._callback_strs)
+        self._namespace_dict[language_code] = namespaces
+        self._app_dict[language_code] = base.app_dict
+        self._reverse_dict[language_code] = lookups
+        self._populated = True
+
+
+@lru_cache(maxsize=None)
+def _has_resolver_state() -> bool:
+    # Shared resolver populates the private state of Django's resolver,
+    # that is not a part of its public API.
+    resolver = URLResolver(RegexPattern(r'^'), [])
+
+    return all(hasattr(resolver, x) for x in RESOLVER_STATE)
+
+
+def share_urls(prefixes, urls) -> URLResolver:
+    """
+    Nests urls under all the prefixes with a `SharedPrefixResolver`.
+    Literal prefix, that is common for all the prefixes, is moved into
+    the resolver pattern.
+
+    With Django versions, whose resolver has no private state, that the
+    shared resolver populates, urls are included under each prefix
+    separately.
+
+    Args:
+        prefixes (iterable): Prefix patterns.
+        urls (iterable): Url patterns.
+
+    Returns:
+        URLResolver: `SharedPrefixResolver` for all the prefixes, or a
+            resolver with a separate include for each of them.
+    """
+    _check_resolvers()
+
+    prefixes = list(prefixes)
+
+    if not _has_resolver_state():
+        urls = list(urls)
+
+        return URLResolver(
+            RegexPattern(r'^'), [URLResolver(x, urls) for x in prefixes]
+        )
+
+    literal = os.path.commonprefix([
+        literal_prefix(x)[0] if _is_static(x) else '' for x in prefixes
+    ])
+
+    return SharedPrefixResolver(
+        RegexPattern('^' + _escape_literal(literal)),
+        [_strip_pattern(x, len(literal)) for x in prefixes] if literal
+        else prefixes,
+        list(urls),
+    )
+
+
+class LazyResolver(URLResolver or object):
+    """
+    Url resolver, that builds its urls on the first use.
+
+    Path is checked against the literal prefixes of the urls first, so
+    urls are built only by the first request, that may match them.
+    Urls are built once under a lock, so concurrent threads do not
+    build them twice.
+
+    Parent resolver doesn't populate a namespaced resolver, so urls are
+    built when any url in the namespace is reversed. Resolver without a
+    namespace is built by the first reverse of any url.
+
+    Django's system checks walk the whole url tree, so they build all
+    the lazy resolvers. Urls are deferred only in processes, that skip
+    the checks, like WSGI and ASGI servers, or commands run with the
+    `--skip-checks` option. `runserver`, `check` and tests build them
+    at startup.
+
+    Attributes:
+        build (callable): Function, that returns urls.
+        prefixes (tuple): Literal prefixes of all the urls.
+        urls (list): Built urls, or `None`.
+    """
+
+    def __init__(
+        self, pattern, build, prefixes=('', ), app_name=None, namespace=None
+    ):
+        super().__init__(pattern, None, None, app_name, namespace)
+
+        self.build = build
+        self.prefixes = tuple(prefixes)
+        self.lock = threading.Lock()
+        self.urls = None
+
+    @property
+    def url_patterns(self) -> list:
+        if self.urls is None:
+            with self.lock:
+                if self.urls is None:
+                    self.urls = list(self.build())
+
+        return self.urls
+
+    @property
+    def reverse_dict(self):
+        self.url_patterns
+
+        return URLResolver.reverse_dict.fget(self)
+
+    @property
+    def namespace_dict(self):
+        self.url_patterns
+
+        return URLResolver.namespace_dict.fget(self)
+
+    @property
+    def app_dict(self):
+        self.url_patterns
+
+        return URLResolver.app_dict.fget(self)
+
+    def _is_callback(self, name):
+        self.url_patterns
+
+        return super()._is_callback(name)
+
+    def _reverse_with_prefix(self, *args, **kwargs):
+        self.url_patterns
+
+        return super()._reverse_with_prefix(*args, **kwargs)
+
+    def _populate(self):
+        if self.urls is not None or not self.namespace:
+            super()._populate()
+
+    def resolve(self, path):
+        path = str(path)
+
+        if self.urls is None:
+            match = self.pattern.match(path)
+
+            if not match or not match[0].startswith(self.prefixes):
+                raise Resolver404({'path': path})
+
+        return super().resolve(path)
@@ -0,0 +1,311 @@
+"""
+Url reversers, that speed up reversing of the same url names, for
+example when links are generated for every row of a list.
+
+Reversers work only with Django 2.0 or newer.
+"""
+
+import re
+from functools import lru_cache
+from urllib.parse import quote
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.translation import get_language
+
+try:
+    from django.urls import (
+        get_resolver, get_urlconf, get_script_prefix, reverse
+    )
+    from django.urls.resolvers import get_ns_resolver
+    from django.utils.http import RFC3986_SUBDELIMS, escape_leading_slashes
+except ImportError:
+    # Namespaced resolvers with converters are available only since
+    # Django 2.0.
+    get_ns_resolver = None
+
+
+__all__ = [
+    'join_names',
+    'UrlReverser',
+    'get_reverser',
+]
+
+
+def _check_reversers():
+    if get_ns_resolver is None:
+        raise ImproperlyConfigured(
+            'Url reversers require Django 2.0 or newer.'
+        )
+
+
+def join_names(*names) -> str:
+    """
+    Joins namespaces and url name into a view name for reversing.
+
+    Args:
+        *names (str): Namespaces and url name. Empty ones are skipped.
+
+    Returns:
+        str: View name.
+    """
+    return ':'.join(x for x in names if x)
+
+
+class UrlReverser:
+    """
+    Url reverser for a single view name.
+
+    Namespaces are looked up, and url patterns are collected only once
+    for the urlconf and the active language. Patterns are prefixed for
+    each script prefix, and compiled once, when arguments first match
+    their params. So reversing does the same as Django's
+    `reverse()`, without the lookups and the pattern compilation, and
+    returns the same urls.
+
+    Any call, that doesn't produce an url, is passed to Django's
+    `reverse()`, so errors are the same too. Current application is not
+    supported, and the default namespaces of applications are used.
+
+    Attributes:
+        viewname (str): View name with namespaces.
+        urlconf (str): Urlconf module. By default the current one.
+    """
+
+    def __init__(self, viewname: str, urlconf=None):
+        _check_reversers()
+
+        self.viewname = viewname
+        self.urlconf = urlconf
+        self.state = None
+
+    def get_resolver(self):
+        """
+        Looks up namespaces of the view name, the same way Django does.
+
+        Returns:
+            tuple: Resolver, that has the view name, and the url name.
+                Resolver is `None` if namespaces are not registered.
+        """
+        resolver = get_resolver(self.urlconf or get_urlconf())
+        *path, view = self.viewname.split(':')
+        ns_pattern = ''
+        ns_converters = {}
+
+        for ns in path:
+            app_list = resolver.app_dict.get(ns)
+
+            if app_list and ns not in app_list:
+                ns = app_list[0]
+
+            if ns not in resolver.namespace_dict:
+                return None, view
+
+            extra, resolver = resolver.namespace_dict[ns]
+            ns_pattern += extra
+            ns_converters.update(resolver.pattern.converters)
+
+        if ns_pattern:
+            resolver = get_ns_resolver(
+                ns_pattern, resolver, tuple(ns_converters.items())
+            )
+
+        return resolver, view
+
+    def get_candidates(self) -> tuple:
+        """
+        Returns:
+            tuple: Url templates of the view name, with their params,
+                defaults, converters and patterns.
+        """
+        resolver, view = self.get_resolver()
+
+        if resolver is None:
+            return ()
+
+        return tuple(
+            (result, frozenset(params), tuple(params), defaults, converters,
+                pattern)
+            for possibility, pattern, defaults, converters in (
+                resolver.reverse_dict.getlist(view)
+            )
+            for result, params in possibility
+        )
+
+    def get_compiled(self, prefix: str) -> list:
+        """
+        Args:
+            prefix (str): Script prefix.
+
+        Returns:
+            list: Candidates with the prefixed url templates and the
+                patterns to check urls with.
+        """
+        key = (get_resolver(self.urlconf or get_urlconf()), get_language())
+        state = self.state
+
+        if state is None or state[0] != key:
+            state = self.state = (key, self.get_candidates(), {})
+
+        compiled = state[2].get(prefix)
+
+        if compiled is None:
+            compiled = state[2][prefix] = [
+                (
+                    prefix.replace('%', '%%') + result, params, names,
+                    defaults, converters,
+                    '^%s%s' % (re.escape(prefix), pattern),
+                )
+                for result, params, names, defaults, converters, pattern in (
+                    state[1]
+                )
+            ]
+
+        return compiled
+
+    def match(self, compiled: list, args: tuple, kwargs: dict) -> str:
+        """
+        Finds the first url template, that matches arguments.
+
+        Args:
+            compiled (list): Compiled candidates.
+            args (tuple): Positional url arguments.
+            kwargs (dict): Keyword url arguments.
+
+        Returns:
+            str: Url, or `None` if there is no matching template.
+        """
+        if args and kwargs:
+            return None
+
+        for template, params, names, defaults, converters, pattern in (
+            compiled
+        ):
+            if args:
+                if len(args) != len(names):
+                    continue
+
+                subs = dict(zip(names, args))
+            else:
+                if (params ^ kwargs.keys()).difference(defaults):
+                    continue
+
+                if any(
+                    kwargs.get(k, v) != v
+                    for k, v in defaults.items() if k not in params
+                ):
+                    continue
+
+                subs = kwargs
+
+            text_subs = {}
+
+            try:
+                for k, v in subs.items():
+                    text_subs[k] = (
+                        converters[k].to_url(v) if k in converters else str(v)
+                    )
+            except ValueError:
+                continue
+
+            url = template % text_subs
+
+            # Patterns are compiled only for the matching params, as
+            # Django does, since some of them may not compile at all,
+            # like nested ones with the same group names. Django's
+            # `reverse()` raises the same error then.
+            try:
+                regex = compile_pattern(pattern)
+            except re.error:
+                return None
+
+            if regex.search(url):
+                # Quoting and scheme relative urls the same as Django.
+                return escape_leading_slashes(
+                    quote(url, safe=RFC3986_SUBDELIMS + '/~:@')
+                )
+
+        return None
+
+    def reverse(self, *args, **kwargs) -> str:
+        """
+        Reverses the view name.
+
+        Args:
+            *args: Positional url arguments.
+            **kwargs: Keyword url arguments.
+
+        Returns:
+            str: Url.
+
+        Raises:
+            NoReverseMatch: The same as Django's `reverse()` does.
+        """
+        url = self.match(self.get_compiled(get_script_prefix()), args, kwargs)
+
+        if url is None:
+            return reverse(self.viewname, self.urlconf, args, kwargs)
+
+        return url
+
+    __call__ = reverse
+
+    def reverse_many(self, arguments) -> list:
+        """
+        Reverses the view name for each item of arguments.
+
+        Example:
+            >>> reverser.reverse_many({'pk': x.pk} for x in object_list)
+
+        Args:
+            arguments (iterable): Keyword url arguments dicts, or
+                positional url arguments lists or tuples.
+
+        Returns:
+            list: Urls in the same order.
+
+        Raises:
+            NoReverseMatch: The same as Django's `reverse()` does.
+        """
+        compiled = self.get_compiled(get_script_prefix())
+        urls = []
+
+        for item in arguments:
+            args, kwargs = (
+                (tuple(item), {}) if isinstance(item, (list, tuple))
+                else ((), item)
+            )
+            url = self.match(compiled, args, kwargs)
+
+            if url is None:
+                url = reverse(self.viewname, self.urlconf, args, kwargs)
+
+            urls.append(url)
+
+        return urls
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str):
+    """
+    Args:
+        pattern (str): Url pattern with the script prefix.
+
+    Returns:
+        Pattern: Compiled pattern, shared by all the reversers.
+    """
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=None)
+def get_reverser(viewname: str, urlconf=None) -> UrlReverser:
+    """
+    Returns a shared reverser for the view name.
+
+    Args:
+        viewname (str): View name with namespaces.
+        urlconf (str, optional): Urlconf module.
+
+    Returns:
+        UrlReverser: Url reverser.
+    """
+    return UrlReverser(viewname, urlconf)
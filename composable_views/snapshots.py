@@ -0,0 +1,466 @@
+"""
+Url table snapshots, that let workers load urls without building them.
+
+Snapshot is a JSON file with all the url patterns, names, namespaces,
+default kwargs and import paths of the views, that a builder function
+returns. Views are imported only when they are dispatched first, so
+neither viewsets nor actions holders are created on the url loading.
+
+Example:
+    >>> # urls.py
+    >>> def build_urls():
+    >>>     from app.views import ArticleViewSet
+    >>>
+    >>>     return ArticleViewSet.as_urls()
+    >>>
+    >>> urlpatterns = load_urls('urls.json', build_urls)
+
+    $ python manage.py url_snapshot app.urls.build_urls urls.json
+
+Snapshot is checked against the hash of the source files, that the
+urls are defined in, and against the Django version. Missing, broken
+or stale snapshot is ignored and urls are built the usual way.
+
+Snapshots work only with Django 2.0 or newer.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+import importlib.util
+from collections.abc import Mapping
+
+import django
+from django.core.exceptions import ImproperlyConfigured
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError:
+    from asyncio import iscoroutinefunction
+
+from .utils import URLPattern, URLResolver, RegexPattern, RoutePattern
+from .resolvers import TrieResolver, SharedPrefixResolver, LazyResolver
+
+
+__all__ = [
+    'SNAPSHOT_VERSION',
+    'object_reference',
+    'import_reference',
+    'snapshot_urls',
+    'save_snapshot',
+    'load_snapshot',
+    'is_fresh',
+    'load_urls',
+]
+
+SNAPSHOT_VERSION = 1
+
+# Modules, that build urls, but are not view bases.
+BUILD_MODULES = (
+    'composable_views.utils',
+    'composable_views.resolvers',
+    'composable_views.snapshots',
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _check_snapshots():
+    if URLResolver is None:
+        raise ImproperlyConfigured(
+            'Url snapshots require Django 2.0 or newer.'
+        )
+
+
+def _lookup(value, path: str):
+    for name in path.split('.'):
+        try:
+            value = getattr(value, name)
+        except AttributeError:
+            value = value[name]
+
+    return value
+
+
+def _child_path(parent, child) -> str:
+    views = getattr(parent, 'views', None)
+
+    if isinstance(views, Mapping):
+        for name, value in views.items():
+            if value is child:
+                return f'views.{name}'
+
+    for attr in sorted(getattr(parent, '_connectables', ())):
+        value = getattr(parent, attr)
+
+        if value is child:
+            return attr
+
+        if isinstance(value, Mapping):
+            for key, item in value.items():
+                if item is child:
+                    return f'{attr}.{key}'
+
+    return None
+
+
+def object_reference(value) -> str:
+    """
+    Import path of a module level object, or of a view, that is
+    connected to an importable parent class.
+
+    Args:
+        value (object): Class or function.
+
+    Returns:
+        str: Module name and attributes path, separated with `:`.
+
+    Raises:
+        ImproperlyConfigured: If object can not be imported.
+    """
+    qualname = getattr(value, '__qualname__', '')
+    module = sys.modules.get(getattr(value, '__module__', None))
+
+    if module is not None and qualname and '<locals>' not in qualname:
+        try:
+            if _lookup(module, qualname) is value:
+                return f'{module.__name__}:{qualname}'
+        except (AttributeError, LookupError, TypeError):
+            pass
+
+    parent = getattr(value, 'parent_class', None)
+    path = None if parent is None else _child_path(parent, value)
+
+    if path is None:
+        raise ImproperlyConfigured(f'`{value!r}` can not be imported.')
+
+    return f'{object_reference(parent)}.{path}'
+
+
+def import_reference(reference: str):
+    """
+    Args:
+        reference (str): Reference from `object_reference`.
+
+    Returns:
+        object: Referenced object.
+    """
+    module, path = reference.split(':', 1)
+
+    return _lookup(importlib.import_module(module), path)
+
+
+def _check_json(value, description: str):
+    if json.loads(json.dumps(value)) != value:
+        raise ImproperlyConfigured(
+            f'{description} `{value!r}` can not be saved to a snapshot.'
+        )
+
+    return value
+
+
+def _dump_pattern(pattern) -> dict:
+    if type(pattern) is RegexPattern:
+        regex = pattern._regex
+
+        if isinstance(regex, str):
+            return {
+                'regex': regex, 'name': pattern.name,
+                'endpoint': pattern._is_endpoint,
+            }
+    elif type(pattern) is RoutePattern:
+        route = pattern._route
+
+        if isinstance(route, str):
+            return {
+                'route': route, 'name': pattern.name,
+                'endpoint': pattern._is_endpoint,
+            }
+
+    raise ImproperlyConfigured(
+        f'Pattern `{pattern}` can not be saved to a snapshot.'
+    )
+
+
+def _load_pattern(data: dict):
+    if 'route' in data:
+        return RoutePattern(data['route'], data['name'], data['endpoint'])
+
+    return RegexPattern(data['regex'], data['name'], data['endpoint'])
+
+
+def _view_modules(value) -> set:
+    modules = set()
+
+    while value is not None:
+        modules.update(
+            x.__module__ for x in getattr(value, '__mro__', (value, ))
+        )
+        value = getattr(value, 'parent_class', None)
+
+    return modules
+
+
+def _dump_view(callback, modules: set) -> dict:
+    view_class = getattr(callback, 'view_class', None)
+    view = callback if view_class is None else view_class
+    reference = object_reference(view)
+
+    modules.update(_view_modules(view))
+
+    return {
+        'view': reference,
+        'initkwargs': None if view_class is None else _check_json(
+            callback.view_initkwargs, 'View initkwargs'
+        ),
+        # Flags, that middlewares check on the view, like `csrf_exempt`.
+        'attributes': {
+            key: value for key, value in vars(callback).items()
+            if not key.startswith('_') and
+            isinstance(value, (bool, int, float, str))
+        },
+        'async': iscoroutinefunction(callback),
+    }
+
+
+def _load_view(data: dict):
+    reference = data['view']
+    initkwargs = data['initkwargs']
+    resolved = []
+
+    def get_view():
+        if not resolved:
+            view = import_reference(reference)
+
+            if initkwargs is not None:
+                view = view.as_view(**initkwargs)
+
+            resolved.append(view)
+
+        return resolved[0]
+
+    if data['async']:
+        async def view(request, *args, **kwargs):
+            return await get_view()(request, *args, **kwargs)
+    else:
+        def view(request, *args, **kwargs):
+            return get_view()(request, *args, **kwargs)
+
+    view.__dict__.update(data['attributes'])
+    view.__module__, view.__qualname__ = reference.split(':', 1)
+    view.view_reference = reference
+    view.import_view = get_view
+
+    return view
+
+
+def _dump_url(url, modules: set) -> dict:
+    pattern = _dump_pattern(url.pattern)
+
+    if type(url) is URLPattern:
+        return {
+            'type': 'pattern',
+            'pattern': pattern,
+            'name': url.name,
+            'kwargs': _check_json(url.default_args, 'Url kwargs'),
+            **_dump_view(url.callback, modules),
+        }
+
+    # Lazy urls are saved built, as views are imported lazily anyway.
+    types = {
+        URLResolver: 'resolver',
+        LazyResolver: 'resolver',
+        TrieResolver: 'compiled',
+        SharedPrefixResolver: 'shared',
+    }
+
+    if type(url) not in types:
+        raise ImproperlyConfigured(
+            f'Url `{url!r}` can not be saved to a snapshot.'
+        )
+
+    data = {
+        'type': types[type(url)],
+        'pattern': pattern,
+        'app_name': url.app_name,
+        'namespace': url.namespace,
+        'kwargs': _check_json(url.default_kwargs or {}, 'Url kwargs'),
+        'urls': [_dump_url(x, modules) for x in url.url_patterns],
+    }
+
+    if isinstance(url, SharedPrefixResolver):
+        data['prefixes'] = [_dump_pattern(x) for x in url.prefixes]
+
+    return data
+
+
+def _load_url(data: dict):
+    pattern = _load_pattern(data['pattern'])
+
+    if data['type'] == 'pattern':
+        return URLPattern(
+            pattern, _load_view(data), data['kwargs'], data['name']
+        )
+
+    urls = [_load_url(x) for x in data['urls']]
+
+    if data['type'] == 'shared':
+        return SharedPrefixResolver(
+            pattern, [_load_pattern(x) for x in data['prefixes']], urls,
+            data['kwargs']
+        )
+
+    Resolver = TrieResolver if data['type'] == 'compiled' else URLResolver
+
+    return Resolver(
+        pattern, urls, data['kwargs'], data['app_name'], data['namespace']
+    )
+
+
+def _source_hash(modules) -> str:
+    """
+    Args:
+        modules (iterable): Module names.
+
+    Returns:
+        str: Hash of the modules sources, or `None` if some source can
+            not be found.
+    """
+    digest = hashlib.sha256(
+        f'{SNAPSHOT_VERSION}:{django.__version__}'.encode()
+    )
+
+    for name in sorted(modules):
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            return None
+
+        if spec is None or not spec.has_location:
+            return None
+
+        try:
+            with open(spec.origin, 'rb') as source:
+                digest.update(name.encode() + b'\0' + source.read())
+        except OSError:
+            return None
+
+    return digest.hexdigest()
+
+
+def snapshot_urls(build) -> dict:
+    """
+    Builds urls, and creates their snapshot.
+
+    Args:
+        build (callable): Importable function, that returns urls.
+
+    Returns:
+        dict: Snapshot, that may be saved as JSON.
+
+    Raises:
+        ImproperlyConfigured: If some url or view can not be saved.
+    """
+    _check_snapshots()
+
+    builder = object_reference(build)
+    modules = {builder.split(':', 1)[0], *BUILD_MODULES}
+    urls = [_dump_url(x, modules) for x in build()]
+    modules = sorted(
+        x for x in modules
+        if x != 'builtins' and x != 'django' and not x.startswith('django.')
+    )
+
+    return {
+        'version': SNAPSHOT_VERSION,
+        'builder': builder,
+        'modules': modules,
+        'hash': _source_hash(modules),
+        'urls': urls,
+    }
+
+
+def save_snapshot(build, path: str) -> dict:
+    """
+    Builds urls, and saves their snapshot to a file. File is replaced
+    at once, so workers never read a partially written one.
+
+    Args:
+        build (callable): Importable function, that returns urls.
+        path (str): Snapshot file path.
+
+    Returns:
+        dict: Saved snapshot.
+    """
+    snapshot = snapshot_urls(build)
+    temporary = f'{path}.{os.getpid()}.tmp'
+
+    with open(temporary, 'w') as file:
+        json.dump(snapshot, file)
+
+    os.replace(temporary, path)
+
+    return snapshot
+
+
+def load_snapshot(snapshot: dict) -> list:
+    """
+    Creates urls from the snapshot, without any freshness checks.
+
+    Args:
+        snapshot (dict): Url snapshot.
+
+    Returns:
+        list: Urls with the views, that are imported on the first
+            dispatch.
+    """
+    _check_snapshots()
+
+    return [_load_url(x) for x in snapshot['urls']]
+
+
+def is_fresh(snapshot: dict, build) -> bool:
+    """
+    Args:
+        snapshot (dict): Url snapshot.
+        build (callable): Function, that urls should be built with.
+
+    Returns:
+        bool: Whether snapshot has urls of the same builder, and
+            sources of the urls are the same.
+    """
+    return (
+        snapshot.get('version') == SNAPSHOT_VERSION and
+        snapshot.get('builder') == object_reference(build) and
+        snapshot.get('hash') is not None and
+        snapshot['hash'] == _source_hash(snapshot.get('modules', ()))
+    )
+
+
+def load_urls(path: str, build) -> list:
+    """
+    Loads urls from the snapshot file, or builds them if snapshot is
+    missing, broken or stale.
+
+    Args:
+        path (str): Snapshot file path.
+        build (callable): Importable function, that returns urls.
+
+    Returns:
+        list: Urls.
+    """
+    try:
+        with open(path) as file:
+            snapshot = json.load(file)
+
+        if is_fresh(snapshot, build):
+            return load_snapshot(snapshot)
+
+        logger.warning('Url snapshot `%s` is stale.', path)
+    except FileNotFoundError:
+        logger.info('Url snapshot `%s` is not found.', path)
+    except Exception as e:
+        logger.warning('Url snapshot `%s` is not loaded: %s', path, e)
+
+    return list(build())
@@ -1,15 +1,19 @@
 from django import test
 from django.views.generic import View
-from django.utils.functional import SimpleLazyObject
+from django.utils.functional import SimpleLazyObject, cached_property
 from django.core.exceptions import ImproperlyConfigured
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
+from django.core.exceptions import PermissionDenied
+from unittest import mock
 from django.test.utils import override_settings
+from asgiref.sync import iscoroutinefunction
 try:
-    from django.urls import reverse
+    from django.urls import reverse, resolve
 except ModuleNotFoundError as e:
-    from django.core.urlresolvers import reverse
+    from django.core.urlresolvers import reverse, resolve
 
 from ..mixins.url_build import PK_REGEX, PAGED_REGEX
+from ..mixins.memoize import MemoizeMixin
 from ..mixins.actions import (
     ActionViewMixin, ActionConnector, ActionsHolder, ReusableActionMixin
 )
@@ -40,6 +44,10 @@ class ActionFive(ActionViewMixin, TView):
     name = 'five'
 
 
+class ActionDeferred(ActionViewMixin, TView):
+    name = 'deferred'
+
+
 class Reusable(ReusableActionMixin, ActionViewMixin, TView):
     name = 'reusable'
 
@@ -74,6 +82,35 @@ class ActionParentalList(ActionViewMixin, View):
         return HttpResponse(','.join(self.parental.get_list()))
 
 
+class ActionParentalProxy(ActionViewMixin, View):
+    name = 'proxy'
+    parental_proxy = True
+
+    def get(self, request, *a, **k):
+        return HttpResponse(
+            f'{self.parental.get_object()} {self.parental.cached_object}'
+        )
+
+    @cached_property
+    def cached_object(self):
+        return self.parental.cached_object
+
+
+class ProxyLeaf(ActionViewMixin, View):
+    name = 'leaf'
+    parental_proxy = True
+
+
+class ProxyMid(ActionsHolder, ActionViewMixin, View):
+    name = 'mid'
+    parental_proxy = True
+    actions = [ProxyLeaf]
+
+
+class ProxyGrand(ActionsHolder, View):
+    actions = [ProxyMid]
+
+
 class ActionComplex(ActionsHolder, TView):
     data = {
         1: 'first',
@@ -90,12 +127,25 @@ class ActionComplex(ActionsHolder, TView):
     actions = [
         ActionParentalSingle,
         ActionParentalList,
+        ActionParentalProxy,
         Reusable
     ]
+    inits = 0
+
+    def __init__(self, *a, **k):
+        type(self).inits += 1
+
+        super().__init__(*a, **k)
 
     def get_object(self):
         return self.data[int(self.kwargs['pk'])]
 
+    @cached_property
+    def cached_object(self):
+        self.object_calls = getattr(self, 'object_calls', 0) + 1
+
+        return self.get_object()
+
     def get_list(self):
         page = int(self.kwargs.get('page', 1))
         per_page = int(self.per_page)
@@ -103,10 +153,117 @@ class ActionComplex(ActionsHolder, TView):
         return list(self.data.values())[(page - 1) * per_page:page * per_page]
 
 
+class AsyncAction(ActionViewMixin, View):
+    name = 'async'
+
+    async def get(self, request, *a, **k):
+        return HttpResponse(
+            f"{await self.acall_parental('get_object')} "
+            f"{await self.acall_parental('aget_title')}"
+        )
+
+
+class AsyncHolder(ActionsHolder, View):
+    url_regex_list = [PK_REGEX]
+    actions = [AsyncAction]
+
+    async def get(self, request, *a, **k):
+        return HttpResponse(await self.aget_title())
+
+    def get_object(self):
+        return f'object {self.kwargs["pk"]}'
+
+    async def aget_title(self):
+        return f'title {self.kwargs["pk"]}'
+
+
+class BatchRead(ActionViewMixin, View):
+    name = 'read'
+
+    def post(self, request, *a, **k):
+        return JsonResponse({
+            'kwargs': k, 'data': request.POST.dict(),
+            'object': self.parental.get_object(),
+        })
+
+    def get(self, request, *a, **k):
+        return HttpResponse(request.GET.get('q'))
+
+
+class BatchFail(ActionViewMixin, View):
+    name = 'fail'
+
+    def post(self, request, *a, **k):
+        raise PermissionDenied()
+
+
+class BatchProxy(ActionViewMixin, View):
+    name = 'proxy'
+    parental_proxy = True
+
+    def post(self, request, *a, **k):
+        return JsonResponse({
+            'own': request.POST['x'],
+            'parent': self.parental.request.POST['x'],
+        })
+
+
+class BatchBinary(ActionViewMixin, View):
+    name = 'binary'
+
+    def post(self, request, *a, **k):
+        return HttpResponse(b'\xff\x00', content_type='image/png')
+
+
+class BatchHolder(MemoizeMixin, ActionsHolder, View):
+    memoized_methods = ['get_object']
+    url_regex_list = [PK_REGEX]
+    actions = ActionConnector(
+        BatchRead, BatchFail, BatchProxy, BatchBinary, url_batch=True
+    )
+    objects = []
+
+    def get_object(self):
+        self.objects.append(self.kwargs['pk'])
+
+        return self.kwargs['pk']
+
+
+class BatchRename(ActionViewMixin, View):
+    name = 'rename'
+
+    def post(self, request, *a, **k):
+        return HttpResponse()
+
+
+class BatchAtomicHolder(ActionsHolder, View):
+    url_mode = 'path'
+    url_regex_list = [PK_REGEX]
+    actions = ActionConnector(
+        BatchRename, Reusable, url_batch=True, batch_atomic=True
+    )
+
+
+class ActionPathSingle(ActionParentalSingle):
+    parent_class = None
+
+
+class ActionPathComplex(ActionComplex):
+    url_mode = 'path'
+    actions = [
+        ActionPathSingle,
+        Reusable
+    ]
+
+
 urlpatterns = [
     *ActionsViewList.as_urls(),
     *ActionsViewListConnector.as_urls(),
     *ActionComplex.as_urls(),
+    *ActionPathComplex.as_urls(),
+    *AsyncHolder.as_urls(),
+    *BatchHolder.as_urls(),
+    *BatchAtomicHolder.as_urls(),
 ]
 
 
@@ -152,6 +309,32 @@ class ActionsViewConnectorTestCase(test.TestCase):
             class ConnectorString(ActionsHolder, View):
                 actions = 'string'
 
+    def test_actions_deferred(self):
+        class DeferredHolder(ActionsHolder, TView):
+            url_lazy = True
+            actions = [
+                'composable_views.tests.test_actions.ActionDeferred',
+                Reusable,
+            ]
+
+        connector = DeferredHolder.actions
+        urls = type('Urls', (), {
+            'urlpatterns': DeferredHolder.as_urls(),
+        })
+
+        self.assertIsNone(connector._data)
+        self.assertIsNone(ActionDeferred.parent_class)
+        self.assertEqual(connector.reusable.parent_class, DeferredHolder)
+
+        match = resolve('/deferred-holder/action/deferred/', urls)
+
+        self.assertIs(match.func.view_class, ActionDeferred)
+        self.assertEqual(ActionDeferred.parent_class, DeferredHolder)
+        self.assertEqual(list(connector), ['deferred', 'reusable'])
+
+        with self.assertRaises(ImportError):
+            ActionConnector('composable_views.tests.unknown.Action').data
+
     def test_actions_reusable(self):
         view_url = '/actions-view-list-connector/action/reusable/'
         complex_url = '/action-complex/1/action/reusable/'
@@ -227,6 +410,152 @@ class ActionsViewConnectorTestCase(test.TestCase):
             str(single_response.content, encoding='utf-8'), single_content
         )
 
+    def test_actions_parental_proxy(self):
+        inits = ActionComplex.inits
+        action = ActionParentalProxy()
+        action.request = None
+        action.kwargs = {'pk': 3}
+        action.args = []
+        parent = action.parental
+
+        self.assertIsInstance(parent, ActionComplex)
+        self.assertEqual(ActionComplex.inits, inits)
+        self.assertEqual(parent.get_object(), 'third')
+        self.assertEqual(parent.cached_object, 'third')
+        self.assertEqual(action.cached_object, 'third')
+        self.assertEqual(parent.object_calls, 1)
+        self.assertNotIn('parental', parent.__dict__)
+
+        request = test.RequestFactory().get('/')
+        first, second = ActionParentalProxy(), ActionParentalProxy()
+
+        for action in (first, second):
+            action.setup(request, pk=3)
+
+        self.assertEqual(first.cached_object, second.cached_object)
+        self.assertIs(first.parental.__dict__, second.parental.__dict__)
+        self.assertEqual(second.parental.object_calls, 1)
+
+        response = self.client.get('/action-complex/1/action/proxy/')
+
+        self.assertEqual(
+            str(response.content, encoding='utf-8'), 'first first'
+        )
+        self.assertEqual(ActionComplex.inits, inits)
+
+    def test_actions_parental_proxy_nested(self):
+        leaf = ProxyLeaf()
+        leaf.setup(test.RequestFactory().get('/'), pk=1)
+
+        self.assertIsInstance(leaf.parental, ProxyMid)
+        self.assertIsInstance(leaf.parental.parental, ProxyGrand)
+        self.assertEqual(leaf.parental.parental.kwargs, {'pk': 1})
+
+    async def test_actions_async(self):
+        holder_url = '/async-holder/2/'
+        action_url = '/async-holder/2/action/async/'
+
+        for url in (holder_url, action_url):
+            self.assertTrue(iscoroutinefunction(resolve(url).func))
+
+        holder_response = await self.async_client.get(holder_url)
+        action_response = await self.async_client.get(action_url)
+
+        self.assertEqual(holder_response.content, b'title 2')
+        self.assertEqual(action_response.content, b'object 2 title 2')
+
+    def test_actions_batch(self):
+        url = reverse('batch-holder:actions:batch', kwargs={'pk': 3})
+        actions = [
+            {'action': 'read', 'data': {'a': 1, 'b': ['x', 'y']}},
+            {'action': 'read', 'method': 'get', 'data': {'q': 'z'}},
+            {'action': 'fail'},
+            {'action': 'read'},
+        ]
+
+        self.assertEqual(url, '/batch-holder/3/action/batch/')
+        self.assertEqual(
+            BatchHolder.get_url_reverser('batch').reverse(pk=3), url
+        )
+
+        BatchHolder.objects.clear()
+        response = self.client.post(
+            url, {'actions': actions}, content_type='application/json'
+        )
+        results = response.json()['results']
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([x['status'] for x in results], [200, 200, 403, 200])
+        self.assertEqual(results[0]['content'], {
+            'kwargs': {'pk': '3'}, 'data': {'a': '1', 'b': 'y'},
+            'object': '3',
+        })
+        self.assertEqual(results[1]['content'], 'z')
+        self.assertEqual(results[3]['content']['data'], {})
+        self.assertEqual(BatchHolder.objects, ['3'])
+
+        for body in (
+            {}, {'actions': [{'action': 'unknown'}]},
+            {'actions': [{'action': 'read', 'kwargs': {'pk': '../999'}}]},
+            {'actions': [{'action': 'read', 'data': [1]}]},
+            {'actions': [{'action': ['read']}]},
+            {'actions': [{'action': 'read', 'kwargs': [1]}]},
+            {'actions': [{'action': 'read', 'method': 'unknown'}]},
+            {'actions': ['read']},
+        ):
+            self.assertEqual(self.client.post(
+                url, body, content_type='application/json'
+            ).status_code, 400)
+
+        response = self.client.post(url, {'actions': [
+            {'action': 'read', 'kwargs': {'extra': 1}},
+        ]}, content_type='application/json')
+
+        self.assertTrue(response.json()['ok'])
+        self.assertEqual(
+            response.json()['results'][0]['content']['kwargs'],
+            {'pk': '3', 'extra': 1}
+        )
+
+    def test_actions_batch_parental(self):
+        response = self.client.post('/batch-holder/3/action/batch/', {
+            'actions': [
+                {'action': 'proxy', 'data': {'x': 1}},
+                {'action': 'proxy', 'data': {'x': 2}},
+                {'action': 'binary'},
+            ]
+        }, content_type='application/json')
+        results = response.json()['results']
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [x['content'] for x in results],
+            [{'own': '1', 'parent': '1'}, {'own': '2', 'parent': '2'}, '/wA=']
+        )
+
+    def test_actions_batch_atomic(self):
+        url = '/batch-atomic-holder/1/action/batch/'
+
+        with mock.patch('django.db.transaction.set_rollback') as rollback:
+            response = self.client.post(url, {'actions': [
+                {'action': 'rename'}, {'action': 'reusable'},
+                {'action': 'rename'},
+            ]}, content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [x['status'] for x in response.json()['results']], [200, 405]
+        )
+        rollback.assert_called_once_with(True, None)
+
+        with self.assertRaises(ImproperlyConfigured):
+            ActionConnector(
+                BatchFail, url_batch=True, batch_name='fail'
+            ).as_urls([''])
+
+        with self.assertRaises(TypeError):
+            ActionConnector(unknown=True)
+
     def test_actions_parental_equality(self):
         action = ActionParentalSingle()
         action.request = None
@@ -234,3 +563,25 @@ class ActionsViewConnectorTestCase(test.TestCase):
         action.args = []
 
         self.assertEqual(action.parental, action.parental)
+
+    def test_actions_path_mode(self):
+        single_url = '/action-path-complex/2/action/single/'
+        reusable_url = '/action-path-complex/page/1/action/reusable/'
+        single_response = self.client.get(single_url)
+
+        self.assertEqual(ActionPathSingle.get_url_mode(), 'path')
+        self.assertEqual(
+            reverse('action-path-complex:actions:single', kwargs={'pk': 2}),
+            single_url
+        )
+        self.assertEqual(
+            reverse(
+                'action-path-complex:actions:reusable', kwargs={'page': 1}
+            ),
+            reusable_url
+        )
+        self.assertEqual(resolve(single_url).kwargs, {'pk': 2})
+        self.assertEqual(single_response.status_code, 200)
+        self.assertEqual(
+            str(single_response.content, encoding='utf-8'), 'second'
+        )
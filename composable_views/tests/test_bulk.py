@@ -0,0 +1,247 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from django import test
+from django.views.generic import View
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse, HttpResponseForbidden, Http404
+try:
+    from django.urls import reverse, resolve, Resolver404
+except ModuleNotFoundError as e:
+    from django.core.urlresolvers import reverse, resolve, Resolver404
+
+from ..mixins.url_build import PK_REGEX, PK_LIST_REGEX
+from ..mixins.bulk import BulkActionMixin
+from ..mixins.actions import ActionViewMixin, ActionsHolder
+
+
+queries = []
+
+
+class Item:
+    def __init__(self, pk):
+        self.pk = pk
+
+
+class ItemQuerySet:
+    def __init__(self, pks=None):
+        self.pks = pks
+
+    def filter(self, pk__in):
+        return ItemQuerySet(pk__in)
+
+    def __iter__(self):
+        queries.append(self.pks)
+
+        return iter([Item(x) for x in reversed(self.pks) if x < 10])
+
+
+class ItemView(View):
+    def get_queryset(self):
+        return ItemQuerySet()
+
+    def get_object(self, queryset=None):
+        queries.append(self.kwargs['pk'])
+
+        return Item(self.kwargs['pk'])
+
+    def get(self, request, *a, **k):
+        return HttpResponse()
+
+
+class PublishAction(BulkActionMixin, ActionViewMixin, View):
+    name = 'publish'
+    bulk_chunk_size = 2
+
+    def get_object(self):
+        return self.parental.get_object()
+
+    def post(self, request, *args, **kwargs):
+        obj = self.get_object()
+
+        if self.bulk_object not in (None, self.parental.get_object()):
+            raise ValueError(obj)
+
+        if obj.pk == 3:
+            raise Http404
+
+        return HttpResponse(str(kwargs['pk']))
+
+
+class BulkPublish(PublishAction):
+    pass
+
+
+class BulkHolder(ActionsHolder, ItemView):
+    url_regex_list = [PK_REGEX]
+    actions_regex_list = [PK_LIST_REGEX]
+    actions = [BulkPublish]
+
+
+class DenyMixin:
+    def dispatch(self, request, *args, **kwargs):
+        if 'HTTP_X_ALLOW' not in request.META:
+            return HttpResponseForbidden()
+
+        return super().dispatch(request, *args, **kwargs)
+
+
+class DeniedPublish(DenyMixin, PublishAction):
+    name = 'denied'
+
+
+class PlainAction(ActionViewMixin, View):
+    name = 'plain'
+
+    def post(self, request, *args, **kwargs):
+        return HttpResponse(str(kwargs['pk']))
+
+
+class BulkDeniedHolder(ActionsHolder, ItemView):
+    url_regex_list = [PK_REGEX]
+    actions_regex_list = [PK_LIST_REGEX]
+    actions = [DeniedPublish, PlainAction]
+
+
+class BulkExecutorPublish(PublishAction):
+    bulk_executor = ThreadPoolExecutor(2)
+
+
+class BulkPathHolder(ActionsHolder, ItemView):
+    url_mode = 'path'
+    url_regex_list = [PK_REGEX]
+    actions_regex_list = [PK_LIST_REGEX]
+    actions = [BulkExecutorPublish]
+
+
+urls = type('Urls', (), {
+    'urlpatterns': [
+        *BulkHolder.as_urls(), *BulkPathHolder.as_urls(),
+        *BulkDeniedHolder.as_urls(),
+    ],
+})
+
+
+class BulkTestCase(test.TestCase):
+    def setUp(self):
+        queries.clear()
+        self.factory = test.RequestFactory()
+
+    def bulk(self, url: str, **headers):
+        match = resolve(url, urls)
+        response = match.func(
+            self.factory.post(url, **headers), *match.args, **match.kwargs
+        )
+
+        return response.status_code, json.loads(response.content)
+
+    def test_bulk_urls(self):
+        self.assertEqual(
+            reverse('bulk-holder:actions:publish', urls, kwargs={'pk': 1}),
+            '/bulk-holder/1/action/publish/'
+        )
+        self.assertEqual(
+            reverse(
+                'bulk-holder:actions:publish', urls, kwargs={'pks': '1,2'}
+            ),
+            '/bulk-holder/1,2/action/publish/'
+        )
+        self.assertEqual(
+            reverse(
+                'bulk-path-holder:actions:publish', urls,
+                kwargs={'pks': [1, 2]}
+            ),
+            '/bulk-path-holder/1,2/action/publish/'
+        )
+        self.assertEqual(
+            resolve('/bulk-path-holder/1,2/action/publish/', urls).kwargs,
+            {'pks': [1, 2]}
+        )
+
+    def test_bulk_single(self):
+        match = resolve('/bulk-holder/5/action/publish/', urls)
+        response = match.func(self.factory.post('/'), **match.kwargs)
+
+        self.assertEqual(response.content, b'5')
+        self.assertEqual(queries, ['5', '5'])
+
+    def test_bulk(self):
+        for url in (
+            '/bulk-holder/1,2,3,12,4,1/action/publish/',
+            '/bulk-path-holder/1,2,3,12,4,1/action/publish/',
+        ):
+            queries.clear()
+            status, content = self.bulk(url)
+
+            self.assertEqual(status, 400)
+            self.assertEqual(queries, [[1, 2, 3, 12, 4]])
+            self.assertEqual(content, {'ok': False, 'results': [
+                {'pk': 1, 'status': 200},
+                {'pk': 2, 'status': 200},
+                {'pk': 3, 'status': 404},
+                {'pk': 4, 'status': 200},
+                {'pk': 12, 'status': 404},
+            ]})
+
+        self.assertEqual(
+            self.bulk('/bulk-holder/2,1/action/publish/'),
+            (200, {'ok': True, 'results': [
+                {'pk': 2, 'status': 200}, {'pk': 1, 'status': 200},
+            ]})
+        )
+
+    def test_bulk_limits(self):
+        url = '/bulk-holder/1,2,3/action/publish/'
+        match = resolve(url, urls)
+
+        BulkPublish.bulk_max_objects = 2
+
+        try:
+            response = match.func(self.factory.post(url), **match.kwargs)
+        finally:
+            del BulkPublish.bulk_max_objects
+
+        self.assertEqual(response.status_code, 400)
+
+        response = match.func(self.factory.get(url), **match.kwargs)
+
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(queries, [])
+
+    def test_bulk_access(self):
+        for url in (
+            '/bulk-denied-holder/1/action/denied/',
+            '/bulk-denied-holder/1,2/action/denied/',
+        ):
+            match = resolve(url, urls)
+            response = match.func(self.factory.post(url), **match.kwargs)
+
+            self.assertEqual(response.status_code, 403)
+
+        self.assertEqual(queries, [])
+        self.assertEqual(
+            self.bulk(
+                '/bulk-denied-holder/1,2/action/denied/', HTTP_X_ALLOW=1
+            ),
+            (200, {'ok': True, 'results': [
+                {'pk': 1, 'status': 200}, {'pk': 2, 'status': 200},
+            ]})
+        )
+        self.assertEqual(queries, [[1, 2]])
+
+    def test_bulk_only_prefixes(self):
+        self.assertEqual(
+            resolve('/bulk-denied-holder/1/action/plain/', urls).kwargs,
+            {'pk': '1'}
+        )
+
+        with self.assertRaises(Resolver404):
+            resolve('/bulk-denied-holder/1,2/action/plain/', urls)
+
+    def test_bulk_async(self):
+        class AsyncPublish(BulkActionMixin, View):
+            async def post(self, request, *args, **kwargs):
+                return HttpResponse()
+
+        with self.assertRaises(ImproperlyConfigured):
+            AsyncPublish.as_view()
@@ -0,0 +1,204 @@
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync
+from django import test
+from django.views.generic import View
+from django.http import HttpResponse, HttpResponseForbidden
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+
+from ..utils import ClassConnectableClass
+from ..mixins.url_build import UrlBuilderMixin, PK_REGEX
+from ..mixins.viewset import ViewSet
+from ..mixins.actions import ActionViewMixin, ActionsHolder
+from ..mixins.cache import ResponseCacheMixin, invalidate_cache
+
+
+calls = []
+
+
+class Article:
+    pass
+
+
+class CountView(View):
+    def get(self, request, *a, **k):
+        calls.append(type(self).__name__)
+
+        return HttpResponse(f'{len(calls)}')
+
+    def post(self, request, *a, **k):
+        return self.get(request, *a, **k)
+
+
+class CachedView(
+    ResponseCacheMixin, UrlBuilderMixin, ClassConnectableClass, CountView
+):
+    pass
+
+
+class PlainView(UrlBuilderMixin, ClassConnectableClass, CountView):
+    pass
+
+
+class CachedViewSet(ViewSet):
+    list_view_base = PlainView
+    list_cache_timeout = 60
+    list_cache_vary = ['Accept']
+    list_cache_models = [Article]
+
+    detail_view_base = CachedView
+    detail_url_regex_list = [PK_REGEX]
+
+
+class CachedAction(ResponseCacheMixin, ActionViewMixin, CountView):
+    name = 'stats'
+    cache_timeout = 60
+    cache_key = 'cached-stats'
+
+
+class CachedHolder(ActionsHolder, CountView):
+    actions = [CachedAction]
+
+
+class AsyncCachedView(ResponseCacheMixin, View):
+    cache_timeout = 60
+    cache_key = 'async-cached'
+
+    async def get(self, request, *a, **k):
+        calls.append('async')
+
+        return HttpResponse(f'{len(calls)}')
+
+
+class UserView(ResponseCacheMixin, View):
+    cache_timeout = 60
+    cache_key = 'user-page'
+
+    def dispatch(self, request, *args, **kwargs):
+        if 'HTTP_X_DENY' in request.META:
+            return HttpResponseForbidden()
+
+        return super().dispatch(request, *args, **kwargs)
+
+    def get(self, request, *a, **k):
+        calls.append('user')
+        user = request.user
+
+        return HttpResponse(
+            f'secret of {user.name}' if user.is_authenticated else 'public'
+        )
+
+
+class SharedUserView(UserView):
+    cache_key = 'shared-user-page'
+    cache_authenticated = True
+
+
+class CacheTestCase(test.TestCase):
+    def setUp(self):
+        calls.clear()
+        cache.clear()
+        self.factory = test.RequestFactory()
+
+    def test_cache_key(self):
+        self.assertEqual(
+            CachedViewSet.views['list'].get_cache_key(),
+            f'{__name__}:CachedViewSet.views.list',
+        )
+        self.assertEqual(CachedAction.get_cache_key(), 'cached-stats')
+
+    def test_viewset_cache(self):
+        view = CachedViewSet.views['list'].as_view()
+        get = self.factory.get
+
+        self.assertEqual(view(get('/')).content, b'1')
+        self.assertEqual(view(get('/')).content, b'1')
+        self.assertEqual(view(self.factory.head('/')).content, b'1')
+        self.assertEqual(
+            view(get('/', HTTP_ACCEPT='text/plain')).content, b'2'
+        )
+        self.assertEqual(view(get('/')).content, b'1')
+        self.assertIn('Accept', view(get('/'))['Vary'])
+        self.assertEqual(view(get('/?page=2')).content, b'3')
+        self.assertEqual(view(self.factory.post('/')).content, b'4')
+        self.assertEqual(view(get('/')).content, b'1')
+
+        post_save.send(sender=Article, instance=Article())
+
+        self.assertEqual(view(get('/')).content, b'5')
+
+        post_delete.send(sender=Article, instance=Article())
+
+        self.assertEqual(view(get('/')).content, b'6')
+
+        self.assertTrue(
+            issubclass(CachedViewSet.views['list'], ResponseCacheMixin)
+        )
+
+        detail = CachedViewSet.views['detail'].as_view()
+
+        self.assertEqual(detail(get('/')).content, b'7')
+        self.assertEqual(detail(get('/')).content, b'8')
+
+    def test_action_cache(self):
+        view = CachedAction.as_view()
+
+        self.assertEqual(view(self.factory.get('/')).content, b'1')
+        self.assertEqual(view(self.factory.get('/')).content, b'1')
+        self.assertEqual(view.view_class, CachedAction)
+
+        invalidate_cache('cached-stats')
+
+        self.assertEqual(view(self.factory.get('/')).content, b'2')
+        self.assertEqual(view(self.factory.get('/')).content, b'2')
+
+    def test_async_cache(self):
+        view = AsyncCachedView.as_view()
+        request = self.factory.get('/')
+
+        self.assertEqual(async_to_sync(view)(request).content, b'1')
+        self.assertEqual(async_to_sync(view)(request).content, b'1')
+        self.assertEqual(calls, ['async'])
+
+    def request(self, name: str=None, **extra):
+        request = self.factory.get('/', **extra)
+        request.user = SimpleNamespace(
+            is_authenticated=name is not None, name=name
+        )
+
+        return request
+
+    def test_authenticated_cache(self):
+        view = UserView.as_view()
+
+        self.assertEqual(
+            view(self.request('alice')).content, b'secret of alice'
+        )
+        self.assertEqual(view(self.request()).content, b'public')
+        self.assertEqual(view(self.request()).content, b'public')
+        self.assertEqual(
+            view(self.request('bob')).content, b'secret of bob'
+        )
+        self.assertEqual(view(self.request(
+            HTTP_AUTHORIZATION='Token x'
+        )).content, b'public')
+        self.assertEqual(calls, ['user', 'user', 'user', 'user'])
+
+        # Access checks run before the cache lookup.
+        self.assertEqual(
+            view(self.request(HTTP_X_DENY='1')).status_code, 403
+        )
+
+    def test_authenticated_shared_cache(self):
+        view = SharedUserView.as_view()
+        alice = {'HTTP_COOKIE': 'sessionid=alice'}
+
+        self.assertEqual(
+            view(self.request('alice', **alice)).content, b'secret of alice'
+        )
+        self.assertEqual(
+            view(self.request('alice', **alice)).content, b'secret of alice'
+        )
+        self.assertEqual(view(self.request()).content, b'public')
+        self.assertEqual(calls, ['user', 'user'])
@@ -0,0 +1,170 @@
+from datetime import datetime, timezone
+
+from asgiref.sync import async_to_sync
+from django import test
+from django.views.generic import View
+from django.http import HttpResponse, HttpResponseForbidden
+
+from ..utils import ClassConnectableClass
+from ..mixins.url_build import UrlBuilderMixin, PK_REGEX
+from ..mixins.viewset import ViewSet
+from ..mixins.actions import ActionViewMixin, ActionsHolder
+from ..mixins.conditional import ConditionalMixin
+
+
+calls = []
+
+
+class ObjectView(UrlBuilderMixin, ClassConnectableClass, View):
+    def get_object(self):
+        calls.append('object')
+
+        return self.kwargs['pk']
+
+    def get(self, request, *a, **k):
+        return HttpResponse(str(self.get_object()))
+
+    def post(self, request, *a, **k):
+        return self.get(request, *a, **k)
+
+
+class ConditionalViewSet(ViewSet):
+    detail_view_base = ObjectView
+    detail_url_regex_list = [PK_REGEX]
+
+    list_view_base = ObjectView
+
+    def detail_etag(self, request, *args, **kwargs):
+        calls.append('etag')
+
+        return f'v{kwargs["pk"]}'
+
+    def detail_last_modified(self, request, *args, **kwargs):
+        return datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+class DenyMixin:
+    def dispatch(self, request, *args, **kwargs):
+        if 'HTTP_X_ALLOW' not in request.META:
+            return HttpResponseForbidden()
+
+        return super().dispatch(request, *args, **kwargs)
+
+
+class DeniedObjectView(DenyMixin, ObjectView):
+    pass
+
+
+class DeniedViewSet(ViewSet):
+    detail_view_base = DeniedObjectView
+    detail_url_regex_list = [PK_REGEX]
+
+    def detail_etag(self, request, *args, **kwargs):
+        calls.append('etag')
+
+        return f'v{kwargs["pk"]}'
+
+
+class ConditionalAction(ConditionalMixin, ActionViewMixin, View):
+    name = 'edit'
+    conditional_parental = True
+
+    def post(self, request, *a, **k):
+        return HttpResponse('changed')
+
+
+class ConditionalHolder(ConditionalMixin, ActionsHolder, ObjectView):
+    url_regex_list = [PK_REGEX]
+    actions = [ConditionalAction]
+
+    def etag(self, request, *args, **kwargs):
+        return f'"holder-{kwargs["pk"]}"'
+
+
+class AsyncConditionalView(ConditionalMixin, View):
+    def etag(self, request, *a, **k):
+        return 'async'
+
+    async def get(self, request, *a, **k):
+        calls.append('get')
+
+        return HttpResponse()
+
+
+class ConditionalTestCase(test.TestCase):
+    def setUp(self):
+        calls.clear()
+        self.factory = test.RequestFactory()
+
+    def test_viewset_conditional(self):
+        detail = ConditionalViewSet.views['detail']
+
+        self.assertTrue(issubclass(detail, ConditionalMixin))
+        self.assertFalse(
+            issubclass(ConditionalViewSet.views['list'], ConditionalMixin)
+        )
+
+        view = detail.as_view()
+        response = view(self.factory.get('/'), pk=1)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], '"v1"')
+        self.assertEqual(
+            response['Last-Modified'], 'Wed, 01 Jan 2020 00:00:00 GMT'
+        )
+        self.assertEqual(calls, ['etag', 'object'])
+
+        calls.clear()
+        response = view(
+            self.factory.get('/', HTTP_IF_NONE_MATCH='"v1"'), pk=1
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(calls, ['etag'])
+
+        response = view(self.factory.get(
+            '/', HTTP_IF_MODIFIED_SINCE='Thu, 02 Jan 2020 00:00:00 GMT'
+        ), pk=2)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(
+            view(self.factory.get('/', HTTP_IF_NONE_MATCH='"v1"'), pk=2)
+            .status_code, 200
+        )
+
+    def test_conditional_access(self):
+        view = DeniedViewSet.views['detail'].as_view()
+        response = view(
+            self.factory.get('/', HTTP_IF_NONE_MATCH='"v1"'), pk=1
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertEqual(calls, [])
+
+        response = view(self.factory.get(
+            '/', HTTP_IF_NONE_MATCH='"v1"', HTTP_X_ALLOW='1'
+        ), pk=1)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(calls, ['etag'])
+
+    def test_action_parental_conditional(self):
+        view = ConditionalAction.as_view()
+
+        self.assertEqual(view(self.factory.post(
+            '/', HTTP_IF_MATCH='"holder-1"'
+        ), pk=1).status_code, 200)
+        self.assertEqual(view(self.factory.post(
+            '/', HTTP_IF_MATCH='"holder-2"'
+        ), pk=1).status_code, 412)
+
+    def test_async_conditional(self):
+        view = AsyncConditionalView.as_view()
+        request = self.factory.get('/', HTTP_IF_NONE_MATCH='"async"')
+
+        self.assertEqual(async_to_sync(view)(request).status_code, 304)
+        self.assertEqual(
+            async_to_sync(view)(self.factory.get('/')).status_code, 200
+        )
+        self.assertEqual(calls, ['get'])
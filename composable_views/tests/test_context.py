@@ -1,12 +1,20 @@
 import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from unittest import mock
+
+from asgiref.sync import async_to_sync
 from django import test
+from django.core.cache import caches
 from django.views.generic import TemplateView
 from django.test.utils import override_settings
 
 from ..mixins.url_build import UrlBuilderMixin
+from ..mixins.actions import ActionViewMixin, ActionsHolder
 from ..mixins.context import (
-    ContextGetterMixin
+    ContextGetterMixin, ContextCache, context_getter, AsyncContextMixin
 )
 
 
@@ -23,8 +31,172 @@ class TView(ContextGetterMixin, UrlBuilderMixin, TemplateView):
         }
 
 
+class OrderedView(TView):
+    context_a = {'value': 'a', 'a': True}
+    context_b = {'value': 'b', 'b': True}
+
+    def context_c(self, context):
+        return {'value': context['value'] + 'c'}
+
+    context_d = {'d': True}
+
+
+class LazyView(TView):
+    calls = []
+
+    @context_getter(lazy=True)
+    def context_expensive(self, context):
+        self.calls.append('expensive')
+
+        return context['john'].upper()
+
+    @context_getter(lazy=True, key='other')
+    def context_unused(self, context):
+        self.calls.append('unused')
+
+        return 'unused'
+
+    @context_getter(key='plain')
+    def context_plain(self, context):
+        return 'plain'
+
+
+class ConcurrentView(TView):
+    context_executor = ThreadPoolExecutor(2)
+    barrier = threading.Barrier(2, timeout=5)
+
+    @context_getter(key='first', depends=())
+    def context_first(self, context):
+        self.barrier.wait()
+
+        return 'first'
+
+    @context_getter(key='second', depends=['view'])
+    def context_second(self, context):
+        self.barrier.wait()
+
+        return context['view'].get_viewclass_name()
+
+    @context_getter(depends=['first', 'second'])
+    def context_third(self, context):
+        return {'third': context['first'] + context['second']}
+
+    def context_zero(self, context):
+        return {'zero': sorted(context)}
+
+
+class ConcurrentLazyView(TView):
+    context_executor = ThreadPoolExecutor(2)
+
+    @context_getter(lazy=True, key='all')
+    def context_a_all(self, context):
+        return sorted(x for x in context if x.startswith('z'))
+
+    @context_getter(key='z1', depends=())
+    def context_b1(self, context):
+        return 1
+
+    @context_getter(key='z2', depends=())
+    def context_b2(self, context):
+        return 2
+
+    @context_getter(key='z3', depends=())
+    def context_b3(self, context):
+        return 3
+
+
+class AsyncView(TView):
+    @context_getter(key='first', depends=())
+    async def context_first(self, context):
+        self.events[0].set()
+        await asyncio.wait_for(self.events[1].wait(), 5)
+
+        return 'first'
+
+    @context_getter(key='second', depends=())
+    async def context_second(self, context):
+        self.events[1].set()
+        await asyncio.wait_for(self.events[0].wait(), 5)
+
+        return 'second'
+
+    def context_third(self, context):
+        return {'third': context['first'] + context['second']}
+
+
+class AsyncGetView(AsyncContextMixin, TView):
+    @context_getter(key='first', depends=())
+    async def context_first(self, context):
+        await asyncio.sleep(0)
+
+        return 'first'
+
+    def context_second(self, context):
+        return {'second': context['first'] + 'second'}
+
+
+class CachedView(TView):
+    calls = []
+    version = 1
+
+    @context_getter(cache=ContextCache(vary=['kwargs.pk']))
+    def context_first(self, context):
+        self.calls.append('first')
+
+        return {'first': self.kwargs['pk']}
+
+    @context_getter(key='second', cache=ContextCache(
+        version=lambda view: view.version
+    ))
+    def context_second(self, context):
+        self.calls.append('second')
+
+        return 'second'
+
+    @context_getter(lazy=True, cache=ContextCache())
+    def context_third(self, context):
+        self.calls.append('third')
+
+        return 'third'
+
+
+class SelectiveView(TView):
+    calls = []
+    context_fields_param = 'fields'
+    context_fields_header = 'X-Context-Fields'
+
+    @context_getter(key='first', depends=())
+    def context_first(self, context):
+        self.calls.append('first')
+
+        return 'first'
+
+    @context_getter(key='second', depends=['first'])
+    def context_second(self, context):
+        self.calls.append('second')
+
+        return context['first'] + 'second'
+
+    @context_getter(key='third', depends=())
+    def context_third(self, context):
+        self.calls.append('third')
+
+        return 'third'
+
+
+class SelectiveAction(ActionViewMixin, SelectiveView):
+    name = 'selective'
+
+
+class SelectiveHolder(ActionsHolder, TView):
+    actions = [SelectiveAction]
+
+
 urlpatterns = [
-    *TView.as_urls()
+    *TView.as_urls(),
+    *AsyncGetView.as_urls(),
+    *SelectiveView.as_urls(),
+    *SelectiveHolder.as_urls(),
 ]
 
 
@@ -53,3 +225,186 @@ class ContextGetterMixinTestCase(test.TestCase):
 
         self.assertNotIn('different', view_response.context_data)
         self.assertNotIn('string', view_response.context_data)
+
+    def test_context_getters_table(self):
+        table = OrderedView.get_context_getters()
+
+        self.assertIs(table, OrderedView.get_context_getters())
+        self.assertEqual(table[0], {'value': 'b', 'a': True, 'b': True})
+        self.assertEqual(table[1].name, 'context_c')
+        self.assertEqual(table[2], {'d': True})
+        self.assertEqual(table[3].name, 'context_name')
+        self.assertEqual(table[4], {'john': 'John Doe'})
+        self.assertEqual(len(table), 5)
+        self.assertEqual(len(TView.get_context_getters()), 2)
+
+    def test_context_getters_instance(self):
+        view = OrderedView(context_b={'value': 'override'})
+        view.request = None
+        view.kwargs = {}
+        context = view.get_context_data()
+
+        self.assertEqual(context['value'], 'overridec')
+        self.assertNotIn('b', context)
+        self.assertTrue(context['a'])
+        self.assertEqual(
+            OrderedView.get_context_getters()[0].names,
+            ('context_a', 'context_b')
+        )
+
+    def test_context_getters_order(self):
+        view = OrderedView()
+        view.request = None
+        view.kwargs = {}
+        context = view.get_context_data()
+
+        self.assertEqual(context['value'], 'bc')
+        self.assertTrue(context['a'] and context['b'] and context['d'])
+        self.assertEqual(context['name'], 'ordered-view')
+
+    def test_context_lazy(self):
+        LazyView.calls.clear()
+        view = LazyView()
+        view.request = None
+        view.kwargs = {}
+        context = view.get_context_data()
+
+        self.assertEqual(context['plain'], 'plain')
+        self.assertIn('expensive', context)
+        self.assertIn('other', context)
+        self.assertEqual(LazyView.calls, [])
+
+        self.assertEqual(str(context['expensive']), 'JOHN DOE')
+        self.assertEqual(context['expensive'].lower(), 'john doe')
+        self.assertEqual(LazyView.calls, ['expensive'])
+
+    def test_context_schedule(self):
+        self.assertEqual(ConcurrentView.get_context_schedule(), (
+            (0, 2), (1, 4), (5, )
+        ))
+        self.assertEqual(OrderedView.get_context_schedule(), (
+            (1, ), (3, )
+        ))
+
+    def test_context_concurrent(self):
+        view = ConcurrentView()
+        view.request = None
+        view.kwargs = {}
+        context = view.get_context_data()
+
+        self.assertEqual(context['first'], 'first')
+        self.assertEqual(context['second'], 'concurrent-view')
+        self.assertEqual(context['third'], 'firstconcurrent-view')
+        self.assertEqual(context['zero'], sorted(context['zero']))
+        self.assertIn('third', context['zero'])
+
+    def test_context_concurrent_lazy(self):
+        for executor in (None, ConcurrentLazyView.context_executor):
+            view = ConcurrentLazyView(context_executor=executor)
+            view.request = None
+            view.kwargs = {}
+
+            self.assertEqual(
+                list(view.get_context_data()['all']), ['z1', 'z2', 'z3']
+            )
+
+        async def get_context_data():
+            return await view.aget_context_data()
+
+        self.assertEqual(
+            list(async_to_sync(get_context_data)()['all']),
+            ['z1', 'z2', 'z3']
+        )
+
+    def test_context_async(self):
+        view = AsyncView()
+        view.request = None
+        view.kwargs = {}
+
+        async def get_context_data():
+            view.events = (asyncio.Event(), asyncio.Event())
+
+            return await view.aget_context_data()
+
+        context = async_to_sync(get_context_data)()
+
+        self.assertEqual(context['third'], 'firstsecond')
+        self.assertEqual(context['name'], 'async-view')
+
+    async def test_context_async_get(self):
+        self.assertTrue(AsyncGetView.view_is_async)
+
+        response = await self.async_client.get('/async-get-view/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context_data['second'], 'firstsecond')
+        self.assertEqual(response.context_data['name'], 'async-get-view')
+
+    def test_context_cache(self):
+        cache = caches['default']
+        cache.clear()
+        CachedView.calls.clear()
+
+        def get_context_data(pk):
+            view = CachedView()
+            view.request = None
+            view.kwargs = {'pk': pk}
+
+            return view.get_context_data()
+
+        with mock.patch.object(cache, 'get_many', wraps=cache.get_many) as m:
+            context = get_context_data(1)
+            self.assertEqual(m.call_count, 1)
+
+        self.assertEqual(context['first'], 1)
+        self.assertEqual(context['second'], 'second')
+        self.assertEqual(CachedView.calls, ['first', 'second'])
+        self.assertEqual(context['third'], 'third')
+        self.assertEqual(CachedView.calls, ['first', 'second', 'third'])
+
+        CachedView.calls.clear()
+        context = get_context_data(1)
+        self.assertEqual(context['first'], 1)
+        self.assertEqual(context['third'], 'third')
+        self.assertEqual(CachedView.calls, [])
+
+        context = get_context_data(2)
+        self.assertEqual(context['first'], 2)
+        self.assertEqual(CachedView.calls, ['first'])
+
+        CachedView.calls.clear()
+        CachedView.version = 2
+        get_context_data(2)
+        self.assertEqual(CachedView.calls, ['second'])
+
+    def test_context_fields(self):
+        view_url = '/selective-view/'
+        action_url = '/selective-holder/action/selective/'
+
+        SelectiveView.calls.clear()
+        response = self.client.get(view_url, {'fields': 'second'})
+        self.assertEqual(response.context_data['second'], 'firstsecond')
+        self.assertNotIn('third', response.context_data)
+        self.assertNotIn('name', response.context_data)
+        self.assertIn('john', response.context_data)
+        self.assertEqual(SelectiveView.calls, ['first', 'second'])
+
+        SelectiveView.calls.clear()
+        response = self.client.get(
+            action_url, HTTP_X_CONTEXT_FIELDS='third, name'
+        )
+        self.assertEqual(response.context_data['third'], 'third')
+        self.assertEqual(response.context_data['name'], 'selective')
+        # `name` getter has no declared dependencies, so it depends on
+        # all the getters before it.
+        self.assertNotIn('second', response.context_data)
+        self.assertEqual(SelectiveView.calls, ['first', 'third'])
+
+        SelectiveView.calls.clear()
+        response = self.client.get(view_url)
+        self.assertEqual(SelectiveView.calls, ['first', 'second', 'third'])
+
+        view = SelectiveView(context_fields=['first'])
+        view.request = None
+        view.kwargs = {}
+        self.assertNotIn('second', view.get_context_data())
@@ -0,0 +1,136 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
+from django import test
+from django.views.generic import View
+from django.http import HttpResponse
+from django.core.exceptions import ImproperlyConfigured
+
+from ..mixins.actions import ActionViewMixin, ActionsHolder
+from ..mixins.memoize import memoized, clear_memoized, MemoizeMixin
+
+
+calls = []
+
+
+class BaseView(View):
+    def get_object(self):
+        calls.append('object')
+
+        return self.kwargs.get('pk')
+
+
+class MemoizedAction(ActionViewMixin, View):
+    name = 'edit'
+
+    def get_object(self):
+        return self.parental.get_object()
+
+    def get(self, request, *a, **k):
+        return HttpResponse(
+            f'{self.get_object()} {self.parental.get_object()} '
+            f'{self.parental.has_access("user")}'
+        )
+
+
+class MemoizedHolder(MemoizeMixin, ActionsHolder, BaseView):
+    memoized_methods = ['get_object']
+    actions = [MemoizedAction]
+
+    @memoized
+    def has_access(self, user):
+        calls.append('access')
+
+        return True
+
+
+class AsyncMemoizedView(View):
+    @memoized
+    async def aget_object(self, fail=False):
+        calls.append('object')
+        await asyncio.sleep(0)
+
+        if fail:
+            raise ValueError(fail)
+
+        return self.kwargs['pk']
+
+
+class MemoizeTestCase(test.TestCase):
+    def setUp(self):
+        calls.clear()
+        self.factory = test.RequestFactory()
+
+    def test_memoized_methods(self):
+        self.assertTrue(MemoizedHolder.get_object.memoized)
+        self.assertFalse(hasattr(BaseView.get_object, 'memoized'))
+
+        with self.assertRaises(ImproperlyConfigured):
+            class Missing(MemoizeMixin, View):
+                memoized_methods = ['get_unknown']
+
+    def test_shared_with_parental(self):
+        request = self.factory.get('/')
+        view = MemoizedAction.as_view()
+
+        self.assertEqual(view(request, pk=1).content, b'1 1 True')
+        self.assertEqual(calls, ['object', 'access'])
+
+        view(request, pk=1)
+
+        self.assertEqual(calls, ['object', 'access'])
+
+        view(request, pk=2)
+
+        self.assertEqual(calls[2:], ['object', 'access'])
+
+        clear_memoized(request)
+        view(request, pk=1)
+
+        self.assertEqual(calls[4:], ['object', 'access'])
+
+        view(self.factory.get('/'), pk=1)
+
+        self.assertEqual(calls[6:], ['object', 'access'])
+
+    def test_not_memoized(self):
+        holder = MemoizedHolder()
+        holder.kwargs = {}
+
+        holder.get_object()
+        holder.get_object()
+
+        holder.request = self.factory.get('/')
+        holder.has_access([1])
+        holder.has_access([1])
+
+        self.assertEqual(calls, ['object', 'object', 'access', 'access'])
+
+    def test_async_memoized(self):
+        request = self.factory.get('/')
+
+        async def get_objects():
+            first, second = AsyncMemoizedView(), AsyncMemoizedView()
+
+            for view in (first, second):
+                view.setup(request, pk=1)
+
+            return await asyncio.gather(
+                first.aget_object(), second.aget_object(),
+                first.aget_object()
+            )
+
+        async def fail():
+            view = AsyncMemoizedView()
+            view.setup(request, pk=1)
+
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    await view.aget_object(fail=True)
+
+        self.assertEqual(async_to_sync(get_objects)(), [1, 1, 1])
+        self.assertEqual(calls, ['object'])
+
+        async_to_sync(fail)()
+
+        self.assertEqual(calls, ['object', 'object', 'object'])
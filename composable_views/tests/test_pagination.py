@@ -0,0 +1,134 @@
+import base64
+
+from django import test
+from django.db import models, connection
+from django.http import JsonResponse, Http404
+from django.test.utils import override_settings
+from django.views.generic.list import BaseListView
+
+from ..utils import ClassConnectableClass
+from ..mixins.url_build import UrlBuilderMixin, CURSOR_REGEX
+from ..mixins.viewset import ViewSet
+from ..mixins.pagination import CursorPaginationMixin
+
+
+class CursorItem(models.Model):
+    id = models.AutoField(primary_key=True)
+    rank = models.IntegerField()
+
+    class Meta:
+        app_label = 'composable_views'
+
+
+class ItemList(
+    CursorPaginationMixin, UrlBuilderMixin, ClassConnectableClass,
+    BaseListView
+):
+    model = CursorItem
+    paginate_by = 2
+    url_regex_list = ['', CURSOR_REGEX]
+
+    def render_to_response(self, context):
+        page = context['page_obj']
+
+        return JsonResponse({
+            'items': [x.pk for x in context['object_list']],
+            'next': page.next_url,
+            'previous': page.previous_url,
+        })
+
+
+class RankedList(ItemList):
+    url_mode = 'path'
+    cursor_ordering = '-rank'
+
+
+class CursorViewSet(ViewSet):
+    list_view_base = ItemList
+    list_url_regex_list = ['', CURSOR_REGEX]
+
+
+urlpatterns = [*CursorViewSet.as_urls(), *RankedList.as_urls()]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class PaginationTestCase(test.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # App has no models module, so the table is not migrated.
+        with connection.schema_editor() as editor:
+            editor.create_model(CursorItem)
+
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+
+        with connection.schema_editor() as editor:
+            editor.delete_model(CursorItem)
+
+    @classmethod
+    def setUpTestData(cls):
+        # Ranks repeat, so the pk orders the equal ones.
+        CursorItem.objects.bulk_create(
+            CursorItem(pk=pk, rank=pk // 2) for pk in range(1, 6)
+        )
+
+    def walk(self, url: str, key: str) -> list:
+        pages = []
+
+        while url is not None:
+            content = self.client.get(url).json()
+            pages.append(content['items'])
+            url = content[key]
+
+        return pages
+
+    def test_cursor_pagination(self):
+        pages = self.walk('/item-list/', 'next')
+
+        self.assertEqual(pages, [[1, 2], [3, 4], [5]])
+
+        last = self.client.get('/item-list/').json()['next']
+        last = self.client.get(last).json()['next']
+        previous = self.walk(last, 'previous')
+
+        self.assertEqual(previous, [[5], [3, 4], [1, 2]])
+        self.assertTrue(last.startswith('/item-list/cursor/'))
+
+    def test_cursor_ordering(self):
+        pages = self.walk('/ranked-list/', 'next')
+
+        self.assertEqual(pages, [[5, 4], [3, 2], [1]])
+
+        content = self.client.get('/ranked-list/').json()
+
+        self.assertIsNone(content['previous'])
+
+        with self.assertNumQueries(1):
+            content = self.client.get(content['next']).json()
+
+        self.assertEqual(content['items'], [3, 2])
+        self.assertEqual(
+            self.client.get(content['previous']).json()['items'], [5, 4]
+        )
+
+    def test_invalid_cursor(self):
+        view = ItemList()
+
+        for cursor in ('x', 'bm90IGpzb24', 'WzFd'):
+            with self.assertRaises(Http404):
+                view.decode_cursor(cursor, CursorItem)
+
+        # Valid JSON with values, that the fields can not convert.
+        for data in (b'[0,"abc","x"]', b'[0,1,"x"]', b'[0,null,1]'):
+            cursor = base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+            self.assertEqual(self.client.get(
+                f'/ranked-list/cursor/{cursor}/'
+            ).status_code, 404)
+
+        self.assertEqual(
+            self.client.get('/ranked-list/cursor/x/').status_code, 404
+        )
@@ -0,0 +1,463 @@
+import threading
+import time
+from unittest import mock
+
+from django import test
+from django.views.generic import View
+from django.http import HttpResponse
+from django.urls import Resolver404, reverse, resolve
+from django.test.utils import override_settings
+
+from ..utils import (
+    re_path, path, include, ClassConnectableClass, URLResolver, RegexPattern,
+    RoutePattern
+)
+from ..resolvers import (
+    literal_prefix, compile_urls, flatten_urls, share_urls, TrieResolver,
+    SharedPrefixResolver, LazyResolver
+)
+from ..mixins import (
+    UrlBuilderMixin, ViewSet, ActionsHolder, ActionViewMixin,
+    PK_REGEX, PAGED_REGEX, SLUG_REGEX
+)
+
+
+class TView(View):
+    def get(self, request, *a, **k):
+        return HttpResponse(self.get_viewclass_name())
+
+
+class ResolverView(UrlBuilderMixin, TView):
+    url_regex_list = ['', PK_REGEX, SLUG_REGEX]
+
+
+class ResolverAction(ActionViewMixin, TView):
+    name = 'edit'
+
+
+class ResolverHolder(ActionsHolder, TView):
+    url_regex_list = [PK_REGEX, PAGED_REGEX]
+    actions = [ResolverAction]
+
+
+class ResolverViewSet(ViewSet):
+    url_compiled = True
+
+    list_view_base = ResolverView
+    list_name = 'list'
+
+    detail_view_base = ResolverView
+    detail_name = 'detail'
+    detail_url_regex_list = [PK_REGEX]
+
+
+class FlatAction(ActionViewMixin, TView):
+    name = 'edit'
+
+
+class FlatHolder(ActionsHolder, TView):
+    url_flatten = True
+    url_regex_list = [PK_REGEX, PAGED_REGEX]
+    actions = [FlatAction]
+
+
+plain_urls = [
+    *ResolverView.as_urls(),
+    *ResolverHolder.as_urls(),
+    re_path(r'^ab?c/$', lambda x: True, name='optional'),
+    re_path(r'^abc|^xyz/$', lambda x: True, name='alternative'),
+]
+
+shared_prefixes = [r'^a/(?P<slug>[a-z]+)/', r'^a/', r'^b/(?P<pk>[0-9]+)/']
+shared_urls = [
+    re_path(r'^x/$', TView.as_view(), name='x'),
+    re_path(r'^y/(?P<id>[0-9]+)/$', TView.as_view(), name='y'),
+]
+
+urlpatterns = [
+    re_path(r'^shared/', include(([share_urls(
+        [RegexPattern(x) for x in shared_prefixes], shared_urls
+    )], 'shared'))),
+    *compile_urls(plain_urls),
+    *ResolverViewSet.as_urls(),
+    *FlatHolder.as_urls(),
+]
+
+paths = [
+    'resolver-view/', 'resolver-view/1/', 'resolver-view/some-slug/',
+    'resolver-holder/1/', 'resolver-holder/page/2/',
+    'resolver-holder/1/action/edit/',
+    'resolver-holder/page/2/action/edit/',
+    'ac/', 'abc/', 'xyz/', 'abc', 'unknown/', '',
+]
+
+
+def assert_same_resolve(case, expected_resolver, resolver):
+    for path in paths:
+        try:
+            expected = expected_resolver.resolve(path)
+        except Resolver404:
+            with case.assertRaises(Resolver404):
+                resolver.resolve(path)
+
+            continue
+
+        match = resolver.resolve(path)
+
+        case.assertEqual(match.func, expected.func)
+        case.assertEqual(match.args, expected.args)
+        case.assertEqual(match.kwargs, expected.kwargs)
+        case.assertEqual(match.url_name, expected.url_name)
+        case.assertEqual(match.namespaces, expected.namespaces)
+        case.assertEqual(match.route, expected.route)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class TrieResolverTestCase(test.TestCase):
+    def test_literal_prefix(self):
+        self.assertEqual(
+            literal_prefix(RegexPattern(r'^abc/$')), ('abc/', True)
+        )
+        self.assertEqual(
+            literal_prefix(RegexPattern(r'^a\-b/(?P<pk>[0-9]+)/$')),
+            ('a-b/', False)
+        )
+        self.assertEqual(literal_prefix(RegexPattern(r'^ab?c')), ('a', False))
+        self.assertEqual(literal_prefix(RegexPattern(r'^a|b')), ('', False))
+        self.assertEqual(literal_prefix(RegexPattern(r'^')), ('', True))
+        self.assertEqual(
+            literal_prefix(RoutePattern('page/<int:page>/')),
+            ('page/', False)
+        )
+        self.assertEqual(
+            literal_prefix(RoutePattern('page/')), ('page/', True)
+        )
+
+    def test_resolve_same(self):
+        plain = URLResolver(RegexPattern(r'^'), plain_urls)
+        compiled = compile_urls(plain_urls)[0]
+
+        self.assertIsInstance(compiled, TrieResolver)
+        assert_same_resolve(self, plain, compiled)
+
+    def test_resolve_candidates(self):
+        compiled = compile_urls(plain_urls)[0]
+        node = compiled.get_node('resolver-view/1/')
+        resolver = compiled.get_node_resolver(node)
+
+        self.assertEqual(
+            [x.name for x in resolver.url_patterns],
+            ['resolver-view'] * 3 + ['alternative']
+        )
+        self.assertIs(resolver, compiled.get_node_resolver(node))
+
+    def test_viewset_compiled(self):
+        self.assertEqual(reverse('resolver-view-set:list'), '/list/')
+        self.assertEqual(
+            reverse('resolver-view-set:detail', kwargs={'pk': 1}),
+            '/detail/1/'
+        )
+        self.assertEqual(
+            reverse('resolver-holder:actions:edit', kwargs={'page': 2}),
+            '/resolver-holder/page/2/action/edit/'
+        )
+
+        response = self.client.get('/detail/1/')
+        self.assertEqual(response.content, b'detail')
+        self.assertEqual(
+            response.resolver_match.view_name, 'resolver-view-set:detail'
+        )
+
+        response = self.client.get('/resolver-holder/page/2/action/edit/')
+        self.assertEqual(response.content, b'edit')
+        self.assertEqual(self.client.get('/detail/').status_code, 404)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class FlattenUrlsTestCase(test.TestCase):
+    def test_resolve_same(self):
+        plain = URLResolver(RegexPattern(r'^'), plain_urls)
+        flat = URLResolver(RegexPattern(r'^'), flatten_urls(plain_urls))
+
+        assert_same_resolve(self, plain, flat)
+
+    def test_flatten_structure(self):
+        urls = flatten_urls([
+            re_path(r'^', include([
+                re_path(r'^a/', include([
+                    re_path(r'^b/$', TView.as_view(), name='b'),
+                    re_path(r'^c/$', TView.as_view(), name='c'),
+                ])),
+            ])),
+            re_path(r'^', include(([
+                re_path(r'^d/', include([
+                    re_path(r'^(\d+)/$', TView.as_view(), name='e'),
+                ])),
+            ], 'ns'))),
+            re_path(r'^f/', include([
+                re_path(r'^(\d+)/$', TView.as_view(), name='f'),
+            ])),
+        ])
+        b, c, ns, f = urls
+
+        self.assertEqual(str(b.pattern), r'^a/b/$')
+        self.assertEqual(str(c.pattern), r'^a/c/$')
+        self.assertEqual(ns.namespace, 'ns')
+        # Positional groups are not joined, but the namespace is merged
+        # with the prefix resolver.
+        self.assertEqual(str(ns.pattern), r'^d/')
+        self.assertEqual(str(ns.url_patterns[0].pattern), r'^(\d+)/$')
+        self.assertIsInstance(f, URLResolver)
+
+    def test_flatten_routes(self):
+        ns, = flatten_urls([
+            path('x/', include(([
+                path('a/<int:pk>/', TView.as_view(), name='detail'),
+                path('a/list/', TView.as_view(), name='list'),
+            ], 'ns'))),
+        ])
+
+        self.assertEqual(str(ns.pattern), 'x/a/')
+        self.assertEqual(
+            [str(x.pattern) for x in ns.url_patterns], ['<int:pk>/', 'list/']
+        )
+        self.assertEqual(ns.resolve('x/a/1/').kwargs, {'pk': 1})
+
+    def test_holder_flat(self):
+        *views, holder = FlatHolder.as_urls()
+        actions, = holder.url_patterns
+
+        self.assertEqual(len(views), 2)
+        self.assertEqual(holder.namespace, 'flat-holder')
+        self.assertEqual(str(holder.pattern), r'^flat-holder/')
+        self.assertEqual(actions.namespace, 'actions')
+        self.assertEqual(str(actions.pattern), r'^')
+        self.assertIsInstance(actions.url_patterns[0], SharedPrefixResolver)
+        self.assertEqual(
+            [str(x) for x in actions.url_patterns[0].prefixes],
+            [r'^(?P<pk>[0-9]+)/action/', r'^page/(?P<page>[0-9]+)/action/']
+        )
+        self.assertEqual(
+            reverse('flat-holder:actions:edit', kwargs={'pk': 1}),
+            '/flat-holder/1/action/edit/'
+        )
+
+        response = self.client.get('/flat-holder/page/2/action/edit/')
+        self.assertEqual(response.content, b'edit')
+        self.assertEqual(
+            response.resolver_match.view_name, 'flat-holder:actions:edit'
+        )
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class SharedPrefixResolverTestCase(test.TestCase):
+    def test_resolve_same(self):
+        nested = URLResolver(RegexPattern(r'^'), [
+            re_path(x, include(shared_urls)) for x in shared_prefixes
+        ])
+        shared = URLResolver(RegexPattern(r'^'), [share_urls(
+            [RegexPattern(x) for x in shared_prefixes], shared_urls
+        )])
+        paths = [
+            'a/q/x/', 'a/x/', 'a/y/1/', 'a/q/y/2/', 'b/1/x/', 'b/x/', 'a/',
+        ]
+
+        for path in paths:
+            try:
+                expected = nested.resolve(path)
+            except Resolver404:
+                with self.assertRaises(Resolver404):
+                    shared.resolve(path)
+
+                continue
+
+            match = shared.resolve(path)
+
+            self.assertEqual(match.func, expected.func)
+            self.assertEqual(match.kwargs, expected.kwargs)
+            self.assertEqual(match.url_name, expected.url_name)
+            self.assertEqual(match.route, expected.route)
+
+    def test_shared_fallback(self):
+        nested = URLResolver(RegexPattern(r'^'), [
+            re_path(x, include(shared_urls)) for x in shared_prefixes
+        ])
+
+        self.assertIsInstance(share_urls(
+            [RegexPattern(x) for x in shared_prefixes], shared_urls
+        ), SharedPrefixResolver)
+
+        with mock.patch(
+            'composable_views.resolvers._has_resolver_state',
+            return_value=False
+        ):
+            shared = share_urls(
+                [RegexPattern(x) for x in shared_prefixes], shared_urls
+            )
+
+        self.assertNotIsInstance(shared, SharedPrefixResolver)
+
+        for path in ('a/q/x/', 'a/x/', 'b/1/x/', 'a/y/1/'):
+            self.assertEqual(
+                shared.resolve(path).kwargs, nested.resolve(path).kwargs
+            )
+
+        for name, kwargs in (('x', {'slug': 'q'}), ('x', {}), ('y', {
+            'pk': 1, 'id': 2
+        })):
+            self.assertEqual(
+                shared.reverse(name, **kwargs), nested.reverse(name, **kwargs)
+            )
+
+    def test_shared_literal(self):
+        shared = share_urls(
+            [RegexPattern(r'^a/(?P<pk>[0-9]+)/'), RegexPattern(r'^a/b/')], []
+        )
+
+        self.assertEqual(str(shared.pattern), r'^a/')
+        self.assertEqual(
+            [str(x) for x in shared.prefixes], [r'^(?P<pk>[0-9]+)/', r'^b/']
+        )
+        self.assertEqual(list(shared.get_candidates('b/')), [1])
+        self.assertEqual(list(shared.get_candidates('c/')), [])
+
+    def test_reverse(self):
+        self.assertEqual(
+            reverse('shared:x', kwargs={'slug': 'q'}), '/shared/a/q/x/'
+        )
+        self.assertEqual(reverse('shared:x'), '/shared/a/x/')
+        self.assertEqual(
+            reverse('shared:y', kwargs={'id': 2}), '/shared/a/y/2/'
+        )
+        self.assertEqual(
+            reverse('shared:y', kwargs={'id': 2, 'slug': 'q'}),
+            '/shared/a/q/y/2/'
+        )
+        self.assertEqual(
+            resolve('/shared/b/3/x/').kwargs, {'pk': '3'}
+        )
+
+
+built = []
+
+
+class LazyView(UrlBuilderMixin, ClassConnectableClass, TView):
+    @classmethod
+    def as_urls(cls, *args, **kwargs):
+        built.append(cls.get_url_name())
+
+        return super().as_urls(*args, **kwargs)
+
+
+class LazyAction(ActionViewMixin, TView):
+    name = 'act'
+
+    @classmethod
+    def as_urls(cls, *args, **kwargs):
+        built.append(cls.get_url_name())
+
+        return super().as_urls(*args, **kwargs)
+
+
+class LazyViewSet(ViewSet):
+    url_lazy = True
+
+    list_view_base = LazyView
+    list_name = 'lazy-list'
+
+    detail_view_base = LazyView
+    detail_name = 'lazy-detail'
+    detail_url_regex_list = [PK_REGEX]
+
+
+class LazyHolder(ActionsHolder, TView):
+    url_lazy = True
+    url_regex_list = [PK_REGEX]
+    actions = [LazyAction]
+
+
+def lazy_urlconf():
+    return type('Urls', (), {'urlpatterns': [
+        *LazyViewSet.as_urls(),
+        *LazyHolder.as_urls(),
+        re_path(r'^other/$', TView.as_view(), name='other'),
+    ]})
+
+
+class LazyResolverTestCase(test.TestCase):
+    def setUp(self):
+        built.clear()
+
+    def test_prefixes(self):
+        self.assertEqual(
+            LazyViewSet.get_url_prefixes(), {'lazy-list/', 'lazy-detail/'}
+        )
+        self.assertEqual(LazyHolder.get_url_prefixes(), {'lazy-holder/'})
+
+    def test_lazy_viewset(self):
+        urls = lazy_urlconf()
+        lazy = urls.urlpatterns[0]
+
+        self.assertIsInstance(lazy, LazyResolver)
+        self.assertEqual(reverse('other', urlconf=urls), '/other/')
+        self.assertEqual(resolve('/other/', urlconf=urls).url_name, 'other')
+        self.assertIsNone(lazy.urls)
+        self.assertEqual(built, [])
+
+        self.assertEqual(
+            reverse(
+                'lazy-view-set:lazy-detail', kwargs={'pk': 1}, urlconf=urls
+            ),
+            '/lazy-detail/1/'
+        )
+        self.assertEqual(sorted(built), ['lazy-detail', 'lazy-list'])
+
+        urls = lazy_urlconf()
+        match = resolve('/lazy-list/', urlconf=urls)
+
+        self.assertEqual(match.view_name, 'lazy-view-set:lazy-list')
+        self.assertIsNotNone(urls.urlpatterns[0].urls)
+
+    def test_lazy_holder(self):
+        urls = lazy_urlconf()
+        lazy = urls.urlpatterns[-2]
+
+        self.assertIsInstance(lazy, LazyResolver)
+        self.assertEqual(resolve('/lazy-holder/1/', urlconf=urls).kwargs, {
+            'pk': '1'
+        })
+        self.assertNotIn('act', built)
+
+        match = resolve('/lazy-holder/1/action/act/', urlconf=urls)
+
+        self.assertEqual(match.view_name, 'lazy-holder:actions:act')
+        self.assertEqual(built, ['act'])
+
+    def test_build_once(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            time.sleep(0.01)
+
+            return [re_path(r'^a/$', TView.as_view(), name='a')]
+
+        lazy = LazyResolver(RegexPattern(r'^'), build, ['a/'])
+        threads = [
+            threading.Thread(target=lambda: lazy.resolve('a/'))
+            for _ in range(5)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(lazy.resolve('a/').url_name, 'a')
+
+        with self.assertRaises(Resolver404):
+            LazyResolver(RegexPattern(r'^'), build, ['a/']).resolve('b/')
+
+        self.assertEqual(len(calls), 1)
@@ -0,0 +1,189 @@
+import re
+
+from django import test
+from django.views.generic import View
+from django.http import HttpResponse
+from django.urls import (
+    NoReverseMatch, reverse, set_script_prefix, clear_script_prefix
+)
+from django.test.utils import override_settings
+
+from ..utils import re_path, include, ClassConnectableClass
+from ..reversers import join_names, get_reverser, UrlReverser
+from ..mixins import (
+    UrlBuilderMixin, ViewSet, ActionsHolder, ActionViewMixin,
+    PK_REGEX, PAGED_REGEX, PK_SLUG_REGEX
+)
+
+
+class TView(View):
+    def get(self, request, *a, **k):
+        return HttpResponse()
+
+
+class ReverserAction(ActionViewMixin, TView):
+    name = 'edit'
+
+
+class ReverserPathAction(ActionViewMixin, TView):
+    name = 'edit'
+
+
+class ReverserHolder(ActionsHolder, TView):
+    url_regex_list = ['', PK_REGEX, PAGED_REGEX, PK_SLUG_REGEX]
+    actions = [ReverserAction]
+
+
+class ReverserPathHolder(ActionsHolder, TView):
+    url_mode = 'path'
+    url_regex_list = [PK_REGEX]
+    actions = [ReverserPathAction]
+
+
+class ReverserNestedAction(ActionViewMixin, TView):
+    name = 'edit'
+    url_regex_list = ['', PK_REGEX]
+
+
+class ReverserNestedHolder(ActionsHolder, TView):
+    url_regex_list = ['', PK_REGEX, PAGED_REGEX]
+    actions = [ReverserNestedAction]
+
+
+class ReverserView(UrlBuilderMixin, ClassConnectableClass, TView):
+    url_regex_list = [r'(?P<name>.+)', r'(\d+)/(\d+)']
+
+
+class ReverserViewSet(ViewSet):
+    detail_view_base = ReverserView
+    detail_name = 'detail'
+
+
+urlpatterns = [
+    re_path(r'^app/', include(([
+        *ReverserHolder.as_urls(),
+        *ReverserPathHolder.as_urls(),
+    ], 'app'))),
+    *ReverserViewSet.as_urls(),
+    *ReverserNestedHolder.as_urls(),
+]
+
+kwargs_list = [
+    {}, {'pk': 1}, {'page': 2}, {'pk': 3, 'slug': 'some-slug'},
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class UrlReverserTestCase(test.TestCase):
+    def assert_same(self, reverser, *args, **kwargs):
+        self.assertEqual(
+            reverser.reverse(*args, **kwargs),
+            reverse(reverser.viewname, args=args, kwargs=kwargs)
+        )
+
+    def test_join_names(self):
+        self.assertEqual(join_names(None, 'a', '', 'b'), 'a:b')
+
+    def test_class_reversers(self):
+        self.assertEqual(
+            ReverserHolder.get_url_reverser('edit', 'app').viewname,
+            'app:reverser-holder:actions:edit'
+        )
+        self.assertIs(
+            ReverserHolder.get_url_reverser('edit', 'app'),
+            ReverserHolder.actions.get_url_reverser('edit', 'app')
+        )
+        self.assertEqual(
+            ReverserHolder.get_url_reverser(namespace='app').viewname,
+            'app:reverser-holder'
+        )
+        self.assertEqual(
+            ReverserViewSet.get_url_reverser('detail').viewname,
+            'reverser-view-set:detail'
+        )
+
+    def test_reverse_same(self):
+        action = ReverserHolder.get_url_reverser('edit', 'app')
+        holder = ReverserHolder.get_url_reverser(namespace='app')
+        path_action = ReverserPathHolder.get_url_reverser('edit', 'app')
+        detail = ReverserViewSet.get_url_reverser('detail')
+
+        for kwargs in kwargs_list:
+            self.assert_same(action, **kwargs)
+            self.assert_same(holder, **kwargs)
+
+        self.assert_same(path_action, pk=4)
+
+        # Some patterns repeat the `pk` group, and do not compile.
+        nested = ReverserNestedHolder.get_url_reverser('edit')
+
+        for kwargs in ({}, {'page': 2}, {'page': 2, 'pk': 7}):
+            self.assert_same(nested, **kwargs)
+
+        self.assert_same(detail, name='a b/%?')
+        self.assert_same(detail, '1', '2')
+        self.assert_same(detail, name='//x')
+        self.assert_same(detail, 1, 2)
+
+        try:
+            set_script_prefix('/script%20name/')
+
+            for kwargs in kwargs_list:
+                self.assert_same(action, **kwargs)
+
+            self.assert_same(detail, name='//x')
+        finally:
+            clear_script_prefix()
+
+    def test_reverse_errors(self):
+        action = ReverserHolder.get_url_reverser('edit', 'app')
+
+        for reverser, args, kwargs in (
+            (action, (), {'pk': 'x'}),
+            (action, (1, ), {'pk': 1}),
+            (get_reverser('app:unknown:edit'), (), {}),
+            (get_reverser('unknown'), (), {}),
+            (
+                ReverserNestedHolder.get_url_reverser('edit'), (),
+                {'pk': 7}
+            ),
+        ):
+            with self.assertRaises(
+                (NoReverseMatch, ValueError, re.error)
+            ) as expected:
+                reverse(reverser.viewname, args=args, kwargs=kwargs)
+
+            with self.assertRaises(type(expected.exception)) as raised:
+                reverser.reverse(*args, **kwargs)
+
+            self.assertEqual(str(raised.exception), str(expected.exception))
+
+    def test_reverse_many(self):
+        action = ReverserHolder.get_url_reverser('edit', 'app')
+
+        self.assertEqual(
+            action.reverse_many(kwargs_list),
+            [
+                '/app/reverser-holder/action/edit/',
+                '/app/reverser-holder/1/action/edit/',
+                '/app/reverser-holder/page/2/action/edit/',
+                '/app/reverser-holder/3/-some-slug/action/edit/',
+            ]
+        )
+        self.assertEqual(
+            ReverserViewSet.get_url_reverser('detail').reverse_many(
+                [(1, 2), {'name': 'x'}]
+            ),
+            ['/detail/1/2/', '/detail/x/']
+        )
+
+    def test_urlconf_change(self):
+        reverser = UrlReverser('reverser-view-set:detail')
+
+        self.assertEqual(reverser.reverse(name='x'), '/detail/x/')
+
+        with override_settings(ROOT_URLCONF='composable_views.tests.urls'):
+            with self.assertRaises(NoReverseMatch):
+                reverser.reverse(name='x')
+
+        self.assertEqual(reverser.reverse(name='x'), '/detail/x/')
@@ -0,0 +1,199 @@
+import os
+import json
+import tempfile
+from io import StringIO
+
+from django import test
+from django.views.generic import View
+from django.views.decorators.csrf import csrf_exempt
+from django.http import HttpResponse
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command, CommandError
+from django.test.utils import override_settings
+from django.urls import reverse, resolve
+
+from ..utils import re_path, ClassConnectableClass
+from ..snapshots import (
+    object_reference, import_reference, snapshot_urls, save_snapshot,
+    load_snapshot, is_fresh, load_urls
+)
+from ..mixins import (
+    UrlBuilderMixin, ViewSet, ActionsHolder, ActionViewMixin, PK_REGEX,
+    PAGED_REGEX
+)
+
+
+class TView(View):
+    def get(self, request, *a, **k):
+        return HttpResponse(f'{type(self).__name__} {k}')
+
+
+class SnapshotView(UrlBuilderMixin, ClassConnectableClass, TView):
+    pass
+
+
+class SnapshotViewSet(ViewSet):
+    detail_view_base = SnapshotView
+    detail_name = 'snap-detail'
+    detail_url_regex_list = [PK_REGEX]
+
+
+class SnapshotAction(ActionViewMixin, TView):
+    name = 'edit'
+
+
+class SnapshotPathAction(ActionViewMixin, TView):
+    name = 'edit'
+
+
+class SnapshotHolder(ActionsHolder, TView):
+    url_regex_list = ['', PK_REGEX, PAGED_REGEX]
+    actions = [SnapshotAction]
+
+
+class SnapshotPathHolder(ActionsHolder, TView):
+    url_mode = 'path'
+    url_flatten = True
+    url_compiled = True
+    url_regex_list = [PK_REGEX]
+    actions = [SnapshotPathAction]
+
+
+@csrf_exempt
+def function_view(request, **kwargs):
+    return HttpResponse(f'function {kwargs}')
+
+
+def build_urls():
+    return [
+        *SnapshotViewSet.as_urls(),
+        *SnapshotHolder.as_urls(),
+        *SnapshotPathHolder.as_urls(),
+        re_path(
+            r'^function/(?P<pk>\d+)/$', function_view, {'extra': 1},
+            name='function'
+        ),
+    ]
+
+
+def other_build_urls():
+    return build_urls()
+
+
+def leaves(urls) -> list:
+    return [
+        leaf for url in urls
+        for leaf in (leaves(url.url_patterns) if hasattr(
+            url, 'url_patterns'
+        ) else [url])
+    ]
+
+
+paths = [
+    '/snap-detail/1/',
+    '/snapshot-holder/',
+    '/snapshot-holder/page/2/action/edit/',
+    '/snapshot-path-holder/3/',
+    '/snapshot-path-holder/3/action/edit/',
+    '/function/4/',
+]
+
+
+class SnapshotTestCase(test.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'urls.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_references(self):
+        detail = SnapshotViewSet.detail_view_class
+        action = SnapshotHolder.actions.edit
+
+        for value, reference in (
+            (detail, 'SnapshotViewSet.views.detail'),
+            (action, 'SnapshotAction'),
+            (function_view, 'function_view'),
+        ):
+            reference = f'{__name__}:{reference}'
+
+            self.assertEqual(object_reference(value), reference)
+            self.assertIs(import_reference(reference), value)
+
+        with self.assertRaises(ImproperlyConfigured):
+            object_reference(type('Local', (View, ), {}))
+
+    def test_load_snapshot(self):
+        snapshot = json.loads(json.dumps(snapshot_urls(build_urls)))
+        built = type('Urls', (), {'urlpatterns': build_urls()})
+        loaded = type('Urls', (), {'urlpatterns': load_snapshot(snapshot)})
+
+        self.assertTrue(is_fresh(snapshot, build_urls))
+        self.assertFalse(is_fresh(snapshot, other_build_urls))
+        self.assertIn(__name__, snapshot['modules'])
+        self.assertIn('composable_views.mixins.actions', snapshot['modules'])
+
+        for path in paths:
+            expected = resolve(path, built)
+            match = resolve(path, loaded)
+
+            self.assertEqual(match.view_name, expected.view_name)
+            self.assertEqual(match.kwargs, expected.kwargs)
+            self.assertEqual(
+                reverse(match.view_name, kwargs=match.kwargs, urlconf=loaded),
+                path
+            )
+
+        function = resolve('/function/4/', loaded).func
+
+        self.assertTrue(function.csrf_exempt)
+        self.assertEqual(function.view_reference, f'{__name__}:function_view')
+
+        with override_settings(ROOT_URLCONF=loaded):
+            for path in paths:
+                with override_settings(ROOT_URLCONF=built):
+                    expected = self.client.get(path).content
+
+                self.assertEqual(self.client.get(path).content, expected)
+
+    def test_load_urls(self):
+        def is_loaded(urls):
+            return all(hasattr(x.callback, 'view_reference') for x in (
+                leaves(urls)
+            ))
+
+        self.assertFalse(is_loaded(load_urls(self.path, build_urls)))
+
+        save_snapshot(build_urls, self.path)
+
+        self.assertTrue(is_loaded(load_urls(self.path, build_urls)))
+        self.assertFalse(is_loaded(load_urls(self.path, other_build_urls)))
+
+        with open(self.path) as file:
+            snapshot = json.load(file)
+
+        snapshot['hash'] = 'stale'
+
+        with open(self.path, 'w') as file:
+            json.dump(snapshot, file)
+
+        self.assertFalse(is_loaded(load_urls(self.path, build_urls)))
+
+        with open(self.path, 'w') as file:
+            file.write('{')
+
+        self.assertFalse(is_loaded(load_urls(self.path, build_urls)))
+
+    def test_command(self):
+        out = StringIO()
+
+        call_command(
+            'url_snapshot', f'{__name__}.build_urls', self.path, stdout=out
+        )
+
+        self.assertIn(self.path, out.getvalue())
+        self.assertTrue(os.path.exists(self.path))
+
+        with self.assertRaises(CommandError):
+            call_command('url_snapshot', f'{__name__}.unknown', self.path)
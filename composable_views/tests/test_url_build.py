@@ -1,8 +1,10 @@
 from django import test
 from django.views.generic import View
 
-from ..utils import path_regex
-from ..mixins import NamedClassMixin, UrlBuilderMixin, PAGED_REGEX
+from ..utils import path_regex, RegexPattern, RoutePattern
+from ..mixins import (
+    NamedClassMixin, UrlBuilderMixin, PAGED_REGEX, PK_REGEX, PK_SLUG_REGEX
+)
 
 
 class NamedClassTestCase(test.TestCase):
@@ -32,6 +34,22 @@ class NamedClassTestCase(test.TestCase):
         )
 
 
+    def test_names_override(self):
+        class Parent(NamedClassMixin):
+            pass
+
+        class Child(Parent):
+            name = 'child-name'
+
+        self.assertEqual(Parent.get_viewclass_name(), 'parent')
+        self.assertEqual(Child.get_viewclass_name(), 'child-name')
+        self.assertEqual(Child.get_verbose_name(), 'Child name')
+
+        Parent.name = 'renamed'
+        self.assertEqual(Parent.get_viewclass_name(), 'renamed')
+        self.assertEqual(Parent.get_verbose_name(), 'Renamed')
+
+
 class UrlBuilderTestCase(test.TestCase):
     class WithUrl(UrlBuilderMixin, View):
         name = 'some'
@@ -65,6 +83,22 @@ class UrlBuilderTestCase(test.TestCase):
             self.CustomRegex.get_url_regex(r'(.*)'), r'^some-url/(.*)/$'
         )
 
+    def test_get_url_regex_override(self):
+        class Formatted(self.CustomRegex):
+            url_format = r'^{regex}/{name}$'
+
+        class Listed(self.CustomRegex):
+            url_name = 'listed'
+            url_regex_list = [PAGED_REGEX]
+
+        self.assertEqual(
+            self.CustomRegex.get_url_regex(), r'^some-url/([a-z])/$'
+        )
+        self.assertEqual(Formatted.get_url_regex(), r'^([a-z])/some-url$')
+        self.assertEqual(
+            Listed.get_url_regex(), r'^listed/page/(?P<page>[0-9]+)/$'
+        )
+
     def test_as_urls(self):
         first, second = self.CustomRegex.as_urls()
 
@@ -82,3 +116,56 @@ class UrlBuilderTestCase(test.TestCase):
         )
         self.assertEqual(paged.name, 'some-url')
         self.assertEqual(paged.callback.view_class, self.CustomRegex)
+
+
+class UrlPathModeTestCase(test.TestCase):
+    class Paged(UrlBuilderMixin, View):
+        name = 'paged'
+        url_mode = 'path'
+        url_regex_list = ['', PK_SLUG_REGEX, PAGED_REGEX, r'(?P<year>\d{4})/']
+
+    class Inherited(UrlBuilderMixin, View):
+        name = 'inherited'
+        url_regex_list = [PK_REGEX]
+
+    def test_get_url_route(self):
+        self.assertEqual(self.Paged.get_url_route(), 'paged/')
+        self.assertEqual(
+            self.Paged.get_url_route(PK_SLUG_REGEX),
+            'paged/<int:pk>/-<slug:slug>/'
+        )
+        self.assertEqual(
+            self.Paged.get_url_route(PAGED_REGEX), 'paged/page/<int:page>/'
+        )
+        self.assertEqual(
+            self.Paged.get_url_route('<uuid:uuid>/'), 'paged/<uuid:uuid>/'
+        )
+        self.assertIsNone(self.Paged.get_url_route(r'(?P<year>\d{4})/'))
+
+    def test_get_url_mode(self):
+        class Parent(UrlBuilderMixin):
+            url_mode = 'path'
+
+        self.assertEqual(self.Inherited.get_url_mode(), 'regex')
+        self.assertEqual(self.Paged.get_url_mode(), 'path')
+
+        class Child(self.Inherited):
+            parent_class = Parent
+
+        self.assertEqual(Child.get_url_mode(), 'path')
+
+    def test_as_urls(self):
+        empty, pk_slug, paged, year = self.Paged.as_urls()
+
+        self.assertIsInstance(empty.pattern, RoutePattern)
+        self.assertEqual(str(empty.pattern), 'paged/')
+        self.assertEqual(str(pk_slug.pattern), 'paged/<int:pk>/-<slug:slug>/')
+        self.assertEqual(paged.name, 'paged')
+        self.assertEqual(paged.callback.view_class, self.Paged)
+        self.assertEqual(
+            paged.resolve('paged/page/3/').kwargs, {'page': 3}
+        )
+        self.assertIsInstance(year.pattern, RegexPattern)
+        self.assertEqual(
+            path_regex(year).pattern, r'^paged/(?P<year>\d{4})/$'
+        )
@@ -7,7 +7,7 @@ except ModuleNotFoundError as e:
 
 from ..utils import (
     re_path, include, path_regex,
-    ClassConnectable, ClassConnector
+    ClassConnectable, ClassConnectableClass, ClassConnector
 )
 
 
@@ -53,3 +53,28 @@ class ConnectableConnectorTestCase(test.TestCase):
             some = Connectable()
 
         self.assertEqual(Connector.some.parent_class, Connector)
+
+    def test_connectables_registry(self):
+        class Connectable(ClassConnectable):
+            pass
+
+        class ConnectableClass(ClassConnectableClass):
+            pass
+
+        class Connector(ClassConnector):
+            some = Connectable()
+            other = ConnectableClass
+            value = 'value'
+
+        class Child(Connector):
+            own = Connectable()
+
+        class Overridden(Child):
+            some = None
+
+        self.assertEqual(Connector._connectables, {'some', 'other'})
+        self.assertEqual(Child._connectables, {'some', 'other', 'own'})
+        self.assertEqual(Overridden._connectables, {'other', 'own'})
+        self.assertEqual(Child.own.parent_class, Child)
+        self.assertEqual(Child.some.parent_class, Connector)
+        self.assertEqual(ConnectableClass.parent_class, Connector)
@@ -7,16 +7,18 @@ from django.core.exceptions import ImproperlyConfigured
 from django.template.exceptions import TemplateDoesNotExist
 from django.http import HttpResponse
 from django.test.utils import override_settings
+from asgiref.sync import iscoroutinefunction
 try:
-    from django.urls import reverse
+    from django.urls import reverse, resolve
 except ModuleNotFoundError as e:
-    from django.core.urlresolvers import reverse
+    from django.core.urlresolvers import reverse, resolve
 from django.conf import settings
 
 from ..mixins.viewset import (
-    postfixed_items, collect_attributes, ViewSet, ViewSetBase
+    postfixed_items, group_attributes, collect_attributes, ViewSet,
+    ViewSetBase
 )
-from ..mixins.url_build import UrlBuilderMixin
+from ..mixins.url_build import UrlBuilderMixin, PK_REGEX
 from ..utils import ClassConnectableClass
 
 
@@ -32,6 +34,26 @@ class SingleView(UrlBuilderMixin, ClassConnectableClass, TView):
     template_name = 'error.html'
 
 
+class ImportedView(UrlBuilderMixin, ClassConnectableClass, TView):
+    template_name = 'noop.html'
+
+
+class AsyncView(UrlBuilderMixin, ClassConnectableClass, TemplateView):
+    content = None
+
+    async def get(self, request, *a, **k):
+        return HttpResponse(self.content)
+
+
+class AsyncViewSet(ViewSet):
+    shared_properties = ['content']
+    content = 'async'
+
+    detail_view_base = AsyncView
+    detail_name = 'async-detail'
+    detail_url_regex_list = [PK_REGEX]
+
+
 class SingleViewSet(ViewSet):
     single_view_base = SingleView
     single_template_name = 'noop.html'
@@ -61,9 +83,21 @@ class MultipleViewSet(ViewSet):
     fourth_name = 'fourth'
 
 
+class PathViewSet(ViewSet):
+    url_mode = 'path'
+    template_name = 'noop.html'
+    shared_properties = ['template_name']
+
+    detail_view_base = SingleView
+    detail_name = 'path-detail'
+    detail_url_regex_list = [PK_REGEX]
+
+
 urlpatterns = [
     *SingleViewSet.as_urls(),
     *MultipleViewSet.as_urls(),
+    *PathViewSet.as_urls(),
+    *AsyncViewSet.as_urls(),
 ]
 
 
@@ -124,6 +158,41 @@ class ViewSetTestCase(test.TestCase):
             MultipleViewSet.second_content_type
         )
 
+    def test_collect_attributes(self):
+        attrs = {
+            'shared_properties': ['template_name'],
+            'template_name': 'shared.html',
+            'list_template_name': 'list.html',
+            'list_paged_template_name': 'paged.html',
+            'list_view_base': SingleView,
+            'list_paged_view_base': SingleView,
+            'listXcontent_type': 'text/plain',
+            'list_unknown': 'unknown',
+        }
+        shared = attrs['shared_properties']
+        groups = group_attributes(attrs, ['list', 'list_paged'], shared)
+
+        for group in (None, groups['list']):
+            self.assertEqual(
+                collect_attributes(SingleView, 'list', attrs, shared, group),
+                {
+                    'template_name': 'list.html',
+                    'content_type': 'text/plain',
+                    'parent_class': None,
+                }
+            )
+
+        self.assertEqual(
+            collect_attributes(
+                SingleView, 'list_paged', attrs, shared, groups['list_paged']
+            ),
+            {'template_name': 'paged.html', 'parent_class': None}
+        )
+        self.assertEqual(
+            collect_attributes(SingleView, 'other', attrs, shared),
+            {'template_name': 'shared.html', 'parent_class': None}
+        )
+
     def test_initialization_errors(self):
         class View1(UrlBuilderMixin, TView):
             pass
@@ -161,6 +230,62 @@ class ViewSetTestCase(test.TestCase):
             class ViewSet5(ViewSet):
                 first_view_class = View3
 
+    def test_deferred_views(self):
+        class DeferredViewSet(ViewSet):
+            url_lazy = True
+            template_name = 'noop.html'
+            shared_properties = ['template_name']
+
+            detail_view_base = (
+                'composable_views.tests.test_viewsets.SingleView'
+            )
+            detail_name = 'deferred-detail'
+            detail_url_regex_list = [PK_REGEX]
+
+            imported_view_class = (
+                'composable_views.tests.test_viewsets.ImportedView'
+            )
+
+        deferred = vars(DeferredViewSet)['detail_view_class']
+        urls = type('Urls', (), {
+            'urlpatterns': DeferredViewSet.as_urls(),
+        })
+
+        self.assertFalse(deferred.resolved)
+        self.assertIsNone(ImportedView.parent_class)
+        self.assertEqual(DeferredViewSet.get_url_prefixes(), {''})
+
+        match = resolve('/deferred-detail/1/', urls)
+        view = DeferredViewSet.detail_view_class
+
+        self.assertTrue(deferred.resolved)
+        self.assertIs(match.func.view_class, view)
+        self.assertIs(DeferredViewSet.views['detail'], view)
+        self.assertIs(DeferredViewSet.views['imported'], ImportedView)
+        self.assertEqual(view.parent_class, DeferredViewSet)
+        self.assertEqual(view.template_name, 'noop.html')
+        self.assertEqual(ImportedView.parent_class, DeferredViewSet)
+
+        class DeferredErrors(ViewSet):
+            first_view_class = 'composable_views.tests.test_viewsets.TView'
+            second_view_base = 'composable_views.tests.unknown.View'
+
+        with self.assertRaises(ImproperlyConfigured):
+            DeferredErrors.first_view_class
+
+        with self.assertRaises(ImportError):
+            DeferredErrors.second_view_class
+
+    async def test_views_async(self):
+        detail_url = '/async-detail/1/'
+
+        self.assertTrue(AsyncViewSet.detail_view_class.view_is_async)
+        self.assertTrue(iscoroutinefunction(resolve(detail_url).func))
+
+        response = await self.async_client.get(detail_url)
+
+        self.assertEqual(response.content, b'async')
+
     def test_views_response_base(self):
         second_url = '/second/'
         second_response = self.client.get(second_url)
@@ -196,3 +321,14 @@ class ViewSetTestCase(test.TestCase):
         self.assertEqual(reverse('multiple-view-set:fourth'), fourth_url)
         with self.assertRaises(TemplateDoesNotExist):
             self.client.get(fourth_url)
+
+    def test_views_path_mode(self):
+        detail_url = '/path-detail/3/'
+        match = resolve(detail_url)
+
+        self.assertEqual(PathViewSet.detail_view_class.get_url_mode(), 'path')
+        self.assertEqual(
+            reverse('path-view-set:path-detail', kwargs={'pk': 3}), detail_url
+        )
+        self.assertEqual(match.kwargs, {'pk': 3})
+        self.assertEqual(self.client.get(detail_url).status_code, 200)
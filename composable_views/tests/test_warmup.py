@@ -0,0 +1,105 @@
+from io import StringIO
+
+from django import test
+from django.views.generic import View
+from django.http import HttpResponse
+from django.core.management import call_command
+
+from ..utils import re_path, ClassConnectableClass
+from ..warmup import warmup_urls
+from ..snapshots import snapshot_urls, load_snapshot
+from ..mixins import (
+    UrlBuilderMixin, ViewSet, ActionsHolder, ActionViewMixin, PK_REGEX
+)
+
+
+class TView(View):
+    def get(self, request, *a, **k):
+        return HttpResponse()
+
+
+class WarmupView(UrlBuilderMixin, ClassConnectableClass, TView):
+    pass
+
+
+class WarmupViewSet(ViewSet):
+    url_lazy = True
+
+    list_view_base = WarmupView
+    list_name = 'warm-list'
+
+    detail_view_base = WarmupView
+    detail_name = 'warm-detail'
+    detail_url_regex_list = [PK_REGEX]
+
+
+class WarmupAction(ActionViewMixin, TView):
+    name = 'edit'
+
+
+class WarmupHolder(ActionsHolder, TView):
+    url_regex_list = ['', PK_REGEX]
+    actions = [WarmupAction]
+
+
+def build_urls() -> list:
+    return [
+        *WarmupViewSet.as_urls(),
+        *WarmupHolder.as_urls(),
+        re_path(r'^other/$', TView.as_view(), name='other'),
+    ]
+
+
+urlpatterns = build_urls()
+
+
+class WarmupTestCase(test.TestCase):
+    def test_warmup(self):
+        urls = type('Urls', (), {'urlpatterns': build_urls()})
+        lazy = urls.urlpatterns[0]
+        reports = {x.owner: x for x in warmup_urls(urls)}
+
+        self.assertEqual(
+            set(reports), {WarmupViewSet, WarmupHolder, None}
+        )
+        self.assertIsNotNone(lazy.urls)
+        self.assertIn('regex', lazy.url_patterns[0].pattern.__dict__)
+
+        viewset = reports[WarmupViewSet]
+
+        self.assertEqual(viewset.built, 1)
+        self.assertEqual(viewset.urls, 2)
+        self.assertEqual(viewset.resolvers, 1)
+        self.assertEqual(viewset.patterns, 3)
+        self.assertEqual(reports[WarmupHolder].urls, 3)
+        self.assertEqual(reports[None].urls, 1)
+        self.assertGreater(viewset.seconds, 0)
+        self.assertEqual(
+            viewset.name, f'{__name__}.{WarmupViewSet.__qualname__}'
+        )
+
+    def test_warmup_snapshot(self):
+        urls = type('Urls', (), {
+            'urlpatterns': load_snapshot(snapshot_urls(build_urls)),
+        })
+        reports = {x.owner: x for x in warmup_urls(urls)}
+
+        self.assertEqual(
+            set(reports), {WarmupViewSet, WarmupHolder, None}
+        )
+        self.assertEqual(reports[WarmupViewSet].urls, 2)
+        self.assertEqual(reports[WarmupViewSet].imported, 2)
+        self.assertEqual(reports[WarmupHolder].urls, 3)
+        self.assertEqual(reports[None].urls, 1)
+
+    def test_command(self):
+        out = StringIO()
+
+        call_command('url_warmup', urlconf=__name__, stdout=out)
+
+        lines = out.getvalue().splitlines()
+
+        self.assertTrue(lines[-1].startswith('total'))
+        self.assertTrue(any(
+            x.startswith(f'{__name__}.WarmupHolder') for x in lines
+        ))
@@ -4,8 +4,15 @@ Utility functions and classes to use in library.
 
 __all__ = [
     're_path',
+    'path',
     'include',
     'path_regex',
+    'path_prefix',
+    'URLPattern',
+    'URLResolver',
+    'RegexPattern',
+    'RoutePattern',
+    'is_connectable',
     'ClassConnectable',
     'ClassConnectableClass',
     'ClassConnectorBase',
@@ -34,6 +41,21 @@ except ImportError as e:
         return old_include(lst)
 
 
+try:
+    from django.urls import path
+except ImportError:
+    # Converter based routes are available only since Django 2.0.
+    path = None
+
+try:
+    from django.urls.resolvers import (
+        URLPattern, URLResolver, RegexPattern, RoutePattern
+    )
+except ImportError:
+    # Url resolvers customization is available only since Django 2.0.
+    URLPattern = URLResolver = RegexPattern = RoutePattern = None
+
+
 def path_regex(path):
     """
     Compatibility regex getter from Django's UrlPattern.
@@ -49,6 +71,26 @@ def path_regex(path):
     return path.pattern.regex if hasattr(path, 'pattern') else path.regex
 
 
+def path_prefix(path):
+    """
+    Prefix to nest other urls under the url pattern object.
+
+    Args:
+        path (UrlPattern): Django's UrlPattern object provided by
+            `re_path`, `path`, or in old versions `url`.
+
+    Returns:
+        str | RoutePattern: Regex without the line boundaries, or the
+            route pattern itself for the `path` urls.
+    """
+    pattern = getattr(path, 'pattern', None)
+
+    if RoutePattern is not None and isinstance(pattern, RoutePattern):
+        return pattern
+
+    return path_regex(path).pattern.lstrip('^').rstrip('$')
+
+
 class ClassConnectable:
     """
     Mixin that provides an interface to set parent class to a nested
@@ -94,24 +136,46 @@ class ClassConnectableClass:
         cls.parent_class = parent_class
 
 
+def is_connectable(value) -> bool:
+    """
+    Checks whether value may be connected to a parent class.
+
+    Args:
+        value (object): Attribute value.
+
+    Returns:
+        bool: True for `ClassConnectable` instances and
+            `ClassConnectableClass` subclasses.
+    """
+    return isinstance(value, ClassConnectable) or (
+        isinstance(value, type) and issubclass(value, ClassConnectableClass)
+    )
+
+
 class ClassConnectorBase(type):
     """
     Metaclass for classes to automaticaly connect attributes.
+
+    Only attributes, that class declares itself, are checked. Names of
+    all connectable attributes, including inherited ones, are stored in
+    the `_connectables` class registry.
     """
 
     def __new__(cls, name, bases, attrs):
         new = super(ClassConnectorBase, cls).__new__(cls, name, bases, attrs)
+        connectables = set()
 
-        for attr in dir(new):
-            value = getattr(new, attr)
+        for base in bases:
+            connectables.update(getattr(base, '_connectables', ()))
 
-            try:
-                issub = issubclass(value, ClassConnectableClass)
-            except TypeError:
-                issub = False
+        for attr, value in list(new.__dict__.items()):
+            if is_connectable(value):
+                connectables.add(attr)
+                value.set_parent_class(new)
+            else:
+                connectables.discard(attr)
 
-            if isinstance(value, ClassConnectable) or issub:
-                new.__dict__[attr].set_parent_class(new)
+        new._connectables = frozenset(connectables)
 
         return new
 
@@ -0,0 +1,258 @@
+"""
+Url warmup, that does all the lazy url work at once.
+
+Lazy urls are built, patterns are compiled, and resolvers populate
+their reverse dicts. Called in the master process of a preforking
+server (gunicorn with `--preload`, for example), it lets the workers
+share that work, instead of doing it on the first request in each of
+them.
+
+Example:
+    >>> # wsgi.py
+    >>> application = get_wsgi_application()
+    >>> warmup_urls(freeze=True)
+
+Warmup works only with Django 2.0 or newer.
+"""
+
+import gc
+from time import perf_counter
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import translation
+
+from .utils import URLResolver, ClassConnector
+from .resolvers import TrieResolver, SharedPrefixResolver, LazyResolver
+
+try:
+    from django.urls import get_resolver
+except ImportError:
+    from django.core.urlresolvers import get_resolver
+
+
+__all__ = [
+    'WarmupReport',
+    'url_owner',
+    'UrlWarmup',
+    'warmup_urls',
+]
+
+# Owner of the resolvers, whose urls belong to different owners.
+MIXED = object()
+
+
+def _check_warmup():
+    if URLResolver is None:
+        raise ImproperlyConfigured(
+            'Url warmup requires Django 2.0 or newer.'
+        )
+
+
+class WarmupReport:
+    """
+    Warmup time and counts of the warmed objects.
+
+    Attributes:
+        owner (type): Viewset or actions holder, or `None` for other
+            urls and for the resolvers, that they share.
+        seconds (float): Warmup time.
+        urls (int): Url patterns.
+        resolvers (int): Populated resolvers.
+        patterns (int): Compiled patterns.
+        built (int): Built lazy resolvers.
+        imported (int): Imported snapshot views.
+    """
+
+    counts = ('urls', 'resolvers', 'patterns', 'built', 'imported')
+
+    def __init__(self, owner=None):
+        self.owner = owner
+        self.seconds = 0.0
+
+        for count in self.counts:
+            setattr(self, count, 0)
+
+    @property
+    def name(self) -> str:
+        if self.owner is None:
+            return 'other'
+
+        return f'{self.owner.__module__}.{self.owner.__qualname__}'
+
+    def add(self, report):
+        """
+        Adds time and counts of the other report.
+
+        Args:
+            report (WarmupReport): Other report.
+        """
+        self.seconds += report.seconds
+
+        for count in self.counts:
+            setattr(self, count, getattr(self, count) + getattr(report, count))
+
+
+def url_owner(url):
+    """
+    Args:
+        url (URLPattern): Url pattern.
+
+    Returns:
+        type: Viewset or actions holder, that generated the url, or
+            `None` for other urls.
+    """
+    callback = url.callback
+    import_view = getattr(callback, 'import_view', None)
+
+    # Snapshot views are proxies, so the owner is found by the view,
+    # that they import.
+    if import_view is not None:
+        callback = import_view()
+
+    owner = getattr(callback, 'view_class', None)
+
+    while getattr(owner, 'parent_class', None) is not None:
+        owner = owner.parent_class
+
+    if isinstance(owner, type) and issubclass(owner, ClassConnector):
+        return owner
+
+    return None
+
+
+class UrlWarmup:
+    """
+    Walks the url tree, and reports warmup of each owner subtree.
+
+    Attributes:
+        languages (list): Languages to populate resolvers for.
+        reports (dict): Reports by owners.
+    """
+
+    def __init__(self, languages):
+        self.languages = list(languages)
+        self.reports = {}
+
+    def report(self, owner) -> WarmupReport:
+        if owner not in self.reports:
+            self.reports[owner] = WarmupReport(owner)
+
+        return self.reports[owner]
+
+    def compile(self, pattern, report: WarmupReport):
+        for language in self.languages:
+            with translation.override(language):
+                pattern.regex
+
+        report.patterns += 1
+
+    def warm_url(self, url, report: WarmupReport):
+        import_view = getattr(url.callback, 'import_view', None)
+
+        if import_view is not None:
+            import_view()
+            report.imported += 1
+
+        self.compile(url.pattern, report)
+        url.lookup_str
+        report.urls += 1
+
+    def warm_resolver(self, resolver, report: WarmupReport):
+        self.compile(resolver.pattern, report)
+
+        if isinstance(resolver, SharedPrefixResolver):
+            for index, prefix in enumerate(resolver.prefixes):
+                self.compile(prefix, report)
+                resolver.get_prefix_resolver(index)
+
+            resolver.prefixes_regex
+
+        if isinstance(resolver, TrieResolver):
+            resolver.trie
+
+        for language in self.languages:
+            with translation.override(language):
+                resolver.reverse_dict
+
+        report.resolvers += 1
+
+    def warm(self, url) -> tuple:
+        """
+        Warms the url subtree. Subtrees of a single owner are reported
+        by their parents, so the time of the whole subtree is counted.
+
+        Args:
+            url (URLPattern | URLResolver): Url.
+
+        Returns:
+            tuple: Owner of the subtree urls, or `MIXED`, and the
+                report, that is not added yet.
+        """
+        report = WarmupReport()
+        start = perf_counter()
+
+        if not isinstance(url, URLResolver):
+            self.warm_url(url, report)
+            report.seconds = perf_counter() - start
+
+            return url_owner(url), report
+
+        if isinstance(url, LazyResolver) and url.urls is None:
+            report.built += 1
+
+        patterns = url.url_patterns
+        report.seconds = perf_counter() - start
+        results = [self.warm(x) for x in patterns]
+        start = perf_counter()
+        # Children are warmed first, so their reverse dicts are
+        # populated before the parent collects them.
+        self.warm_resolver(url, report)
+        report.seconds += perf_counter() - start
+        owners = {owner for owner, _ in results}
+
+        if len(owners) <= 1 and MIXED not in owners:
+            for _, child in results:
+                report.add(child)
+
+            return (owners.pop() if owners else None), report
+
+        for owner, child in results:
+            if owner is not MIXED:
+                self.report(owner).add(child)
+
+        self.report(None).add(report)
+
+        return MIXED, WarmupReport()
+
+
+def warmup_urls(urlconf=None, languages=None, freeze: bool=False) -> list:
+    """
+    Warms all the urls of the urlconf.
+
+    Args:
+        urlconf (str, optional): Urlconf module. By default the root
+            one.
+        languages (iterable, optional): Languages to populate the
+            resolvers for. By default the active one.
+        freeze (bool, optional): Moves all objects to the permanent
+            generation of the garbage collector, so it doesn't touch
+            the memory, that forked workers share.
+
+    Returns:
+        list: Reports of the viewsets, the actions holders and the
+            other urls, the slowest first.
+    """
+    _check_warmup()
+
+    warmup = UrlWarmup(languages or [translation.get_language()])
+    owner, report = warmup.warm(get_resolver(urlconf))
+
+    if owner is not MIXED:
+        warmup.report(owner).add(report)
+
+    if freeze and hasattr(gc, 'freeze'):
+        gc.freeze()
+
+    return sorted(
+        warmup.reports.values(), key=lambda x: x.seconds, reverse=True
+    )